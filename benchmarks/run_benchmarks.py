@@ -0,0 +1,320 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Benchmark Runner
+
+Name: Charlestone Mayenga
+
+AI Usage: [Document any AI assistance used]
+
+Times the game's hot paths on synthetic data at several scales (number
+of items, quests and saved characters):
+
+    python benchmarks/run_benchmarks.py                      # 10 and 10k
+    python benchmarks/run_benchmarks.py --scales all         # adds 1M
+    python benchmarks/run_benchmarks.py --only load_items save_character
+    python benchmarks/run_benchmarks.py --output results.json
+    python benchmarks/run_benchmarks.py --compare baseline.json --threshold 0.25
+
+Each benchmark is timed with timeit: loops are calibrated to run for at
+least 0.2s, repeated, and the fastest repeat is used for comparisons.
+With --compare, results slower than the baseline by more than the
+threshold are flagged and the exit status is 1.
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import random
+import timeit
+import argparse
+import platform
+import tempfile
+import contextlib
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import game_data
+import character_manager
+import inventory_system
+import quest_handler
+import combat_system
+from synthetic_data import SyntheticData
+
+RESULTS_VERSION = 1
+
+DEFAULT_SCALES = (10, 10_000)
+ALL_SCALES = (10, 10_000, 1_000_000)
+
+DEFAULT_REPEAT = 5
+
+# Slowdown (as a fraction) that counts as a regression
+DEFAULT_THRESHOLD = 0.25
+
+# Benchmarks {name: setup(data) -> function to time}
+BENCHMARKS = {}
+
+# ============================================================================
+# BENCHMARKS
+# ============================================================================
+
+def benchmark(name):
+    """Register a benchmark setup function under name"""
+    def register(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+
+@benchmark("load_items")
+def bench_load_items(data):
+    filename = data.items_file
+    return lambda: game_data.load_items(filename)
+
+
+@benchmark("load_quests")
+def bench_load_quests(data):
+    filename = data.quests_file
+    return lambda: game_data.load_quests(filename)
+
+
+@benchmark("save_character")
+def bench_save_character(data):
+    character = data.character
+    directory = os.path.join(data.directory, "single_save")
+    return lambda: character_manager.save_character(character, directory)
+
+
+@benchmark("load_character")
+def bench_load_character(data):
+    directory = os.path.join(data.directory, "single_save")
+    character_manager.save_character(data.character, directory)
+    name = data.character['name']
+    return lambda: character_manager.load_character(name, directory)
+
+
+@benchmark("list_saved_characters")
+def bench_list_saved_characters(data):
+    directory = data.save_directory
+    return lambda: character_manager.list_saved_characters(directory)
+
+
+@benchmark("get_available_quests")
+def bench_get_available_quests(data):
+    """Repeated calls for one character (the quest frontier stays cached)"""
+    character, quests = data.character, data.quests
+    return lambda: quest_handler.get_available_quests(character, quests)
+
+
+@benchmark("get_available_quests_cold")
+def bench_get_available_quests_cold(data):
+    """First call for a character (the quest frontier is rebuilt every time)"""
+    character, quests = data.character, data.quests
+    
+    def run():
+        character._quest_frontier = None
+        return quest_handler.get_available_quests(character, quests)
+    return run
+
+
+@benchmark("gain_experience")
+def bench_gain_experience(data):
+    """A grant worth `scale` levels' worth of XP to a fresh level 1 character"""
+    base = character_manager.create_character("XpHero", "Mage")
+    xp_amount = 100 * data.scale
+    
+    def run():
+        character = base.copy()
+        character_manager.gain_experience(character, xp_amount)
+    return run
+
+
+@benchmark("simple_battle")
+def bench_simple_battle(data):
+    """One whole battle resolved round by round, without console output"""
+    character = character_manager.create_character("BattleHero", "Warrior")
+    enemy = combat_system.create_enemy("goblin")
+    messages = []
+    
+    def run():
+        messages.clear()
+        battle = combat_system.SimpleBattle(character, enemy, output=messages.append)
+        battle.announce()
+        while battle.play_round('attack') is None:
+            pass
+    return run
+
+
+@benchmark("display_inventory")
+def bench_display_inventory(data):
+    """Render the first inventory page of a full, duplicate-heavy inventory"""
+    character, items = data.character, data.items
+    
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            inventory_system.display_inventory(character, items)
+    return run
+
+# ============================================================================
+# RUNNING
+# ============================================================================
+
+def measure(function, repeat=DEFAULT_REPEAT):
+    """
+    Time a function with timeit
+    
+    Returns: Dictionary {'loops', 'repeat', 'best_s', 'median_s', 'mean_s'}
+             (seconds per call)
+    """
+    timer = timeit.Timer(function)
+    loops, _ = timer.autorange()
+    times = sorted(total / loops for total in timer.repeat(repeat, loops))
+    return {
+        'loops': loops,
+        'repeat': repeat,
+        'best_s': times[0],
+        'median_s': times[len(times) // 2],
+        'mean_s': sum(times) / len(times),
+    }
+
+
+def run_benchmarks(scales=DEFAULT_SCALES, names=None, repeat=DEFAULT_REPEAT, seed=0, log=None):
+    """
+    Run benchmarks at each scale
+    
+    Args:
+        scales: Numbers of items/quests/characters to generate
+        names: Benchmarks to run (all if None)
+        repeat: Timed repeats per benchmark
+        seed: Seed for the synthetic data and for battles
+        log: Called with a progress line after each benchmark (optional)
+    
+    Returns: Results dictionary {'version', 'created', 'python', 'platform',
+             'results': {name: {scale: measurement}}} (scales as strings, as in JSON)
+    Raises: ValueError for an unknown benchmark name
+    """
+    names = list(BENCHMARKS) if names is None else list(names)
+    for name in names:
+        if name not in BENCHMARKS:
+            raise ValueError(f"Unknown benchmark: {name}")
+    
+    results = {name: {} for name in names}
+    for scale in scales:
+        with tempfile.TemporaryDirectory() as directory:
+            data = SyntheticData(scale, directory, seed)
+            for name in names:
+                random.seed(seed)
+                measurement = measure(BENCHMARKS[name](data), repeat)
+                results[name][str(scale)] = measurement
+                if log is not None:
+                    log(f"{name:<28}{scale:>10,}  {format_seconds(measurement['best_s']):>10}")
+    
+    return {
+        'version': RESULTS_VERSION,
+        'created': time.strftime("%Y-%m-%dT%H:%M:%S"),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+
+
+def format_seconds(seconds):
+    """Format a duration with a readable unit"""
+    if seconds >= 1:
+        return f"{seconds:.2f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds * 1e6:.2f} us"
+
+# ============================================================================
+# COMPARING
+# ============================================================================
+
+def compare_results(current, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Compare two result sets by best time
+    
+    Returns: List of rows (name, scale, baseline_s, current_s, ratio, status)
+             where status is 'regression', 'faster', 'ok' or 'new'
+    """
+    rows = []
+    for name, scales in current['results'].items():
+        for scale, measurement in scales.items():
+            current_s = measurement['best_s']
+            previous = baseline['results'].get(name, {}).get(scale)
+            if previous is None:
+                rows.append((name, scale, None, current_s, None, 'new'))
+                continue
+            
+            ratio = current_s / previous['best_s'] if previous['best_s'] else float('inf')
+            if ratio > 1 + threshold:
+                status = 'regression'
+            elif ratio < 1 / (1 + threshold):
+                status = 'faster'
+            else:
+                status = 'ok'
+            rows.append((name, scale, previous['best_s'], current_s, ratio, status))
+    return rows
+
+
+def format_comparison(rows):
+    """Format comparison rows as a table"""
+    lines = [f"{'Benchmark':<28}{'Scale':>10}{'Baseline':>12}{'Current':>12}{'Ratio':>8}  Status"]
+    for name, scale, baseline_s, current_s, ratio, status in rows:
+        baseline_text = format_seconds(baseline_s) if baseline_s is not None else "-"
+        ratio_text = f"{ratio:.2f}x" if ratio is not None else "-"
+        lines.append(f"{name:<28}{int(scale):>10,}{baseline_text:>12}"
+                     f"{format_seconds(current_s):>12}{ratio_text:>8}  {status.upper()}")
+    return "\n".join(lines)
+
+# ============================================================================
+# MAIN EXECUTION
+# ============================================================================
+
+def parse_scales(values):
+    """Turn --scales arguments ('all' or numbers) into a tuple of ints"""
+    if not values:
+        return DEFAULT_SCALES
+    if values == ['all']:
+        return ALL_SCALES
+    return tuple(int(value.replace("_", "").replace(",", "")) for value in values)
+
+
+def main(argv=None):
+    """Run the benchmarks from the command line"""
+    parser = argparse.ArgumentParser(description="Quest Chronicles benchmarks")
+    parser.add_argument("--scales", nargs="+", metavar="N",
+                        help="data sizes to run at, or 'all' (default: 10 10000)")
+    parser.add_argument("--only", nargs="+", metavar="NAME", choices=sorted(BENCHMARKS),
+                        help="benchmarks to run (default: all)")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="timed repeats")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the synthetic data")
+    parser.add_argument("--output", metavar="FILE", help="write results as JSON to FILE")
+    parser.add_argument("--compare", metavar="BASELINE", help="compare with a results file")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="slowdown that counts as a regression (0.25 = 25%%)")
+    args = parser.parse_args(argv)
+    
+    results = run_benchmarks(parse_scales(args.scales), args.only, args.repeat, args.seed, log=print)
+    
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(results, file, indent=2)
+        print(f"\nResults written to {args.output}")
+    
+    if args.compare:
+        with open(args.compare, 'r') as file:
+            baseline = json.load(file)
+        rows = compare_results(results, baseline, args.threshold)
+        print("\n" + format_comparison(rows))
+        regressions = [row for row in rows if row[5] == 'regression']
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Benchmark Data Module
+
+Name: Charlestone Mayenga
+
+AI Usage: [Document any AI assistance used]
+
+Synthetic data for the benchmarks: item and quest files, a played-in
+character and a directory of save files, all at a chosen scale and the
+same every run for a given seed. Items, quests and the character come
+from content_generator. Data is written to a scratch directory and only
+built when a benchmark asks for it, so timing one function at 1M scale
+doesn't create a million save files.
+"""
+
+import os
+import sys
+import functools
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import game_data
+import character_manager
+import inventory_system
+import content_generator
+
+# ============================================================================
+# SAVE FILES
+# ============================================================================
+
+def write_save_files(directory, count, character):
+    """
+    Write count save files, copies of character under different names
+    
+    The first file is written by character_manager.save_character and
+    the rest reuse its text, so large directories are quick to build.
+    
+    Returns: List of character names
+    """
+    os.makedirs(directory, exist_ok=True)
+    template = dict(character, name="Template")
+    character_manager.save_character(template, directory)
+    template_path = os.path.join(directory, "Template_save.txt")
+    with open(template_path, 'r') as file:
+        text = file.read()
+    os.remove(template_path)
+    
+    body = text.split("\n", 1)[1]
+    names = []
+    for number in range(count):
+        name = f"Hero{number:07d}"
+        names.append(name)
+        with open(os.path.join(directory, f"{name}_save.txt"), 'w') as file:
+            file.write(f"NAME: {name}\n{body}")
+    return names
+
+# ============================================================================
+# DATA SETS
+# ============================================================================
+
+class SyntheticData:
+    """
+    Lazily built benchmark data for one scale
+    
+    Attributes (each built on first use):
+        items_file / quests_file: Generated data files
+        items / quests: The loaded catalogs
+        character: A max-level character with a full, duplicate-heavy
+                   inventory and up to half the quests completed
+        save_directory: Directory holding `scale` save files
+    """
+    
+    def __init__(self, scale, directory, seed=0):
+        self.scale = scale
+        self.directory = directory
+        self.seed = seed
+    
+    @functools.cached_property
+    def items_file(self):
+        filename = os.path.join(self.directory, "items.txt")
+        content_generator.write_items(filename, content_generator.generate_items(self.scale, self.seed))
+        return filename
+    
+    @functools.cached_property
+    def quests_file(self):
+        filename = os.path.join(self.directory, "quests.txt")
+        content_generator.write_quests(filename, content_generator.generate_quests(self.scale, self.seed))
+        return filename
+    
+    @functools.cached_property
+    def items(self):
+        return game_data.load_items(self.items_file)
+    
+    @functools.cached_property
+    def quests(self):
+        return game_data.load_quests(self.quests_file)
+    
+    @functools.cached_property
+    def character(self):
+        characters = content_generator.generate_characters(
+            1, self.quests, self.items, self.seed,
+            level=content_generator.MAX_CHARACTER_LEVEL,
+            history=self.scale // 2,
+            inventory_size=inventory_system.MAX_INVENTORY_SIZE,
+        )
+        character = next(characters)
+        character['name'] = "BenchHero"
+        return character
+    
+    @functools.cached_property
+    def save_directory(self):
+        directory = os.path.join(self.directory, "save_games")
+        write_save_files(directory, self.scale, self.character)
+        return directory
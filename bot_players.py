@@ -0,0 +1,345 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Bot Players Module
+
+Name: Charlestone Mayenga
+
+AI Usage: [Document any AI assistance used]
+
+This module generates synthetic load for capacity planning. Each bot
+plays a real game through GameSession.execute (the same path the game
+server and scripted mode use): it creates a character, explores and
+fights, shops, accepts and turns in quests, saves and reloads.
+
+What a bot does next is drawn from a behaviour mix (weights per
+activity). Many bots run in parallel on thread or process workers, and
+every command is timed under the operation it exercises, so the report
+gives throughput and latency percentiles per operation:
+    python bot_players.py --bots 200 --actions 50 --workers 8 --processes
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import random
+import argparse
+import tempfile
+import concurrent.futures
+
+import game_session
+import quest_handler
+import quest_tracker
+
+# Activity weights for each behaviour mix
+BEHAVIOUR_MIXES = {
+    'balanced': {'explore': 4, 'shop': 2, 'quests': 2, 'save': 1, 'reload': 1},
+    'fighter': {'explore': 8, 'quests': 2, 'save': 1},
+    'shopper': {'shop': 6, 'explore': 1, 'save': 1, 'reload': 1},
+    'persistence': {'save': 4, 'reload': 4, 'explore': 1},
+}
+
+CHARACTER_CLASSES = ["Warrior", "Mage", "Rogue", "Cleric"]
+
+# Battle actions bots pick from (attack is most common)
+BATTLE_ACTIONS = ["attack", "attack", "attack", "ability"]
+
+# Rounds after which a bot gives up on a battle and runs
+MAX_BATTLE_ROUNDS = 100
+
+# Percentiles shown in reports
+PERCENTILES = (50, 90, 99)
+
+# ============================================================================
+# BOTS
+# ============================================================================
+
+class Bot:
+    """
+    One synthetic player
+    
+    Attributes:
+        name: Character name (unique per bot)
+        session: The bot's GameSession (replaced on reload)
+        rng: The bot's own random.Random, so its choices are reproducible
+        timings: Seconds per command {operation: [seconds, ...]}
+        commands: Number of commands executed
+    """
+    
+    def __init__(self, name, quests, items, save_directory, rng, mix):
+        self.name = name
+        self.quests = quests
+        self.items = items
+        self.save_directory = save_directory
+        self.rng = rng
+        self.activities = list(mix)
+        self.weights = [mix[activity] for activity in self.activities]
+        self.session = None
+        self.timings = {}
+        self.commands = 0
+    
+    def timed(self, operation, command):
+        """Execute one command and charge its time to operation"""
+        started = time.perf_counter()
+        output = self.session.execute(command)
+        elapsed = time.perf_counter() - started
+        self.timings.setdefault(operation, []).append(elapsed)
+        self.commands += 1
+        return output
+    
+    def new_session(self):
+        """Replace the session with a fresh one (no character loaded)"""
+        self.session = game_session.GameSession(self.quests, self.items,
+                                                self.save_directory, autosave=False)
+    
+    def create(self):
+        """Create the bot's character"""
+        self.new_session()
+        self.timed('create_character', f"new {self.name} {self.rng.choice(CHARACTER_CLASSES)}")
+    
+    # ------------------------------------------------------------------
+    # Activities
+    # ------------------------------------------------------------------
+    
+    def explore(self):
+        """Find an enemy and fight it out; the whole battle is one start_battle"""
+        started = time.perf_counter()
+        self.session.execute("explore")
+        rounds = 1
+        while self.session.battle is not None:
+            action = "run" if rounds > MAX_BATTLE_ROUNDS else self.rng.choice(BATTLE_ACTIONS)
+            self.session.execute(action)
+            rounds += 1
+        self.timings.setdefault('start_battle', []).append(time.perf_counter() - started)
+        self.commands += rounds
+        
+        if self.session.state == game_session.DEAD:
+            if self.session.character['gold'] >= game_session.REVIVE_COST:
+                self.timed('revive', "revive")
+            else:
+                self.create()
+    
+    def shop(self):
+        """Buy something affordable, sometimes selling an item first"""
+        character = self.session.character
+        if character['inventory'] and self.rng.random() < 0.3:
+            self.timed('sell_item', f"sell {self.rng.choice(character['inventory'])}")
+        
+        affordable = [item_id for item_id, item in self.items.items()
+                      if item['cost'] <= character['gold']]
+        if affordable:
+            self.timed('purchase_item', f"buy {self.rng.choice(affordable)}")
+        else:
+            self.timed('browse_shop', "shop")
+    
+    def quests_activity(self):
+        """Turn in a finished quest, or accept a new one"""
+        character = self.session.character
+        for quest_id in character.get('active_quests') or ():
+            if quest_tracker.objectives_complete(character, quest_id, self.quests):
+                self.timed('complete_quest', f"complete {quest_id}")
+                return
+        
+        available = quest_handler.get_available_quests(character, self.quests)
+        if available:
+            self.timed('accept_quest', f"accept {self.rng.choice(available)['quest_id']}")
+        else:
+            self.timed('list_quests', "quests active")
+    
+    def save(self):
+        """Save the character"""
+        self.timed('save_character', "save")
+    
+    def reload(self):
+        """Save, start a new session and load the character back"""
+        self.save()
+        self.new_session()
+        self.timed('load_character', f"load {self.name}")
+        if self.session.character is None:
+            self.create()
+    
+    def step(self):
+        """Do one activity drawn from the behaviour mix"""
+        activity = self.rng.choices(self.activities, self.weights)[0]
+        if activity == 'quests':
+            self.quests_activity()
+        else:
+            getattr(self, activity)()
+    
+    def play(self, actions):
+        """Create the character, then do actions activities"""
+        self.create()
+        for _ in range(actions):
+            self.step()
+
+# ============================================================================
+# WORKERS
+# ============================================================================
+
+def run_bots(bot_numbers, actions, mix, seed, save_directory, catalogs=None):
+    """
+    Play a group of bots one after another (one worker's share)
+    
+    Catalogs are loaded here when not given, so the function also works
+    in a separate process.
+    
+    Returns: Tuple (timings {operation: [seconds]}, commands executed)
+    """
+    quests, items = catalogs if catalogs is not None else game_session.load_catalogs()
+    timings = {}
+    commands = 0
+    
+    for number in bot_numbers:
+        rng = random.Random(f"{seed}-{number}")
+        bot = Bot(f"Bot{number:05d}", quests, items, save_directory, rng, BEHAVIOUR_MIXES[mix])
+        bot.play(actions)
+        for operation, seconds in bot.timings.items():
+            timings.setdefault(operation, []).extend(seconds)
+        commands += bot.commands
+    
+    return timings, commands
+
+
+def percentile(sorted_values, percent):
+    """
+    Nearest-rank percentile of an already sorted list
+    
+    Returns: The value, or 0.0 for an empty list
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(percent / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize_timings(timings, elapsed):
+    """
+    Turn raw per-operation timings into report rows
+    
+    Returns: Dictionary {operation: {'count', 'per_second', 'p50_ms', 'p90_ms',
+                                     'p99_ms', 'max_ms'}}
+    """
+    summary = {}
+    for operation in sorted(timings):
+        values = sorted(timings[operation])
+        row = {'count': len(values), 'per_second': len(values) / elapsed if elapsed else 0.0}
+        for percent in PERCENTILES:
+            row[f"p{percent}_ms"] = percentile(values, percent) * 1000
+        row['max_ms'] = values[-1] * 1000
+        summary[operation] = row
+    return summary
+
+
+def run_load_test(bots=10, actions=50, mix='balanced', workers=4, processes=False,
+                  seed=0, save_directory=None):
+    """
+    Run bots in parallel and measure every operation
+    
+    Args:
+        bots: Number of bots
+        actions: Activities per bot (after creating its character)
+        mix: Name of a behaviour mix in BEHAVIOUR_MIXES
+        workers: Number of worker threads or processes
+        processes: Use process workers instead of threads
+        seed: Makes every bot's choices reproducible
+        save_directory: Where bots save (a temporary directory if None)
+    
+    Returns: Report dictionary (settings, 'elapsed', 'commands',
+             'commands_per_second' and 'operations' from summarize_timings)
+    Raises: ValueError for an unknown mix
+    """
+    if mix not in BEHAVIOUR_MIXES:
+        raise ValueError(f"Unknown behaviour mix: {mix}")
+    workers = max(1, min(workers, bots))
+    
+    with tempfile.TemporaryDirectory() as scratch:
+        directory = save_directory or scratch
+        os.makedirs(directory, exist_ok=True)
+        groups = [range(first, bots, workers) for first in range(workers)]
+        
+        if processes:
+            executor = concurrent.futures.ProcessPoolExecutor(workers)
+            catalogs = None
+        else:
+            executor = concurrent.futures.ThreadPoolExecutor(workers)
+            catalogs = game_session.load_catalogs()
+        
+        started = time.perf_counter()
+        with executor:
+            futures = [executor.submit(run_bots, group, actions, mix, seed, directory, catalogs)
+                       for group in groups]
+            results = [future.result() for future in futures]
+        elapsed = time.perf_counter() - started
+    
+    timings = {}
+    commands = 0
+    for group_timings, group_commands in results:
+        for operation, seconds in group_timings.items():
+            timings.setdefault(operation, []).extend(seconds)
+        commands += group_commands
+    
+    return {
+        'bots': bots,
+        'actions': actions,
+        'mix': mix,
+        'workers': workers,
+        'mode': 'processes' if processes else 'threads',
+        'elapsed': elapsed,
+        'commands': commands,
+        'commands_per_second': commands / elapsed if elapsed else 0.0,
+        'operations': summarize_timings(timings, elapsed),
+    }
+
+
+def format_report(report):
+    """
+    Format a load test report as a table
+    
+    Returns: String
+    """
+    lines = [
+        f"{report['bots']} bots x {report['actions']} actions ({report['mix']} mix) "
+        f"on {report['workers']} {report['mode']}",
+        f"{report['commands']} commands in {report['elapsed']:.2f}s "
+        f"({report['commands_per_second']:.0f} commands/s)",
+        "",
+        f"{'Operation':<18}{'Count':>8}{'Ops/s':>10}{'p50 ms':>10}{'p90 ms':>10}"
+        f"{'p99 ms':>10}{'Max ms':>10}",
+    ]
+    for operation, row in report['operations'].items():
+        lines.append(
+            f"{operation:<18}{row['count']:>8}{row['per_second']:>10.1f}{row['p50_ms']:>10.2f}"
+            f"{row['p90_ms']:>10.2f}{row['p99_ms']:>10.2f}{row['max_ms']:>10.2f}"
+        )
+    return "\n".join(lines)
+
+# ============================================================================
+# MAIN EXECUTION
+# ============================================================================
+
+def main(argv=None):
+    """Run a load test from the command line"""
+    parser = argparse.ArgumentParser(description="Quest Chronicles bot load test")
+    parser.add_argument("--bots", type=int, default=10, help="number of bots")
+    parser.add_argument("--actions", type=int, default=50, help="activities per bot")
+    parser.add_argument("--mix", choices=sorted(BEHAVIOUR_MIXES), default='balanced',
+                        help="behaviour mix")
+    parser.add_argument("--workers", type=int, default=4, help="worker threads or processes")
+    parser.add_argument("--processes", action="store_true", help="use process workers")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the bots' choices")
+    parser.add_argument("--save-dir", help="save directory (default: a temporary one)")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+    
+    report = run_load_test(args.bots, args.actions, args.mix, args.workers,
+                           args.processes, args.seed, args.save_dir)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(format_report(report))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
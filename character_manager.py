@@ -10,29 +10,477 @@ This module handles character creation, loading, and saving.
 """
 
 import os
+import re
+import itertools
+import game_data
+import game_events
 from custom_exceptions import (
     InvalidCharacterClassError,
     CharacterNotFoundError,
     SaveFileCorruptedError,
     InvalidSaveDataError,
-    CharacterDeadError
+    CharacterDeadError,
+    InvalidCharacterNameError,
+    MissingDataFileError
 )
 
+# ============================================================================
+# CHARACTER RECORD
+# ============================================================================
+
+# Character fields in save/display order, mapped to their attribute names
+# ('class' is a Python keyword, so it is stored as character_class)
+CHARACTER_FIELDS = {
+    'name': 'name',
+    'class': 'character_class',
+    'level': 'level',
+    'health': 'health',
+    'max_health': 'max_health',
+    'strength': 'strength',
+    'magic': 'magic',
+    'experience': 'experience',
+    'gold': 'gold',
+    'inventory': 'inventory',
+    'active_quests': 'active_quests',
+    'completed_quests': 'completed_quests',
+    'equipped_weapon': 'equipped_weapon',
+    'equipped_armor': 'equipped_armor',
+    'quest_xp_earned': 'quest_xp_earned',
+    'quest_gold_earned': 'quest_gold_earned',
+    'quest_progress': 'quest_progress'
+}
+
+# Attribute names that are stored in slots
+_ATTRIBUTE_NAMES = frozenset(CHARACTER_FIELDS.values())
+
+# Marker for "no default given" in Character.pop()
+_MISSING = object()
+
+# Class base stats used when data/progression.txt is missing
+# {class: (health, strength, magic)}
+DEFAULT_CLASS_STATS = {
+    'Warrior': (120, 15, 5),
+    'Mage': (80, 8, 20),
+    'Rogue': (90, 12, 10),
+    'Cleric': (100, 10, 15)
+}
+
+# Level-up rules shared by every default class: level L -> L+1 costs
+# 100 + 100*(L-1) XP and adds 10 max health, 2 strength and 2 magic
+DEFAULT_LEVEL_UP = {
+    'health_per_level': 10,
+    'strength_per_level': 2,
+    'magic_per_level': 2,
+    'xp_first_level': 100,
+    'xp_increase': 100
+}
+
+# Class progression catalog (loaded on first use)
+_progression = None
+
+# Built-in level-up rules for characters without a known class
+_default_curve = None
+
+# Names become save file names, so only letters, digits, spaces,
+# underscores, hyphens and apostrophes are allowed (no path separators)
+VALID_NAME_PATTERN = re.compile(r"[A-Za-z0-9][A-Za-z0-9 _'-]*")
+MAX_NAME_LENGTH = 32
+
+# Fields holding lists of quest IDs (stored as QuestList)
+QUEST_LIST_FIELDS = ('active_quests', 'completed_quests')
+
+# Source of QuestList versions (shared, so no two lists ever hold the same one)
+_quest_list_versions = itertools.count(1)
+
+
+class QuestList(list):
+    """
+    List of quest IDs with O(1) membership checks
+    
+    Behaves like a normal list (order, indexing, saving with ','.join,
+    comparing equal to plain lists) but also keeps a count of each quest
+    ID, so `quest_id in character['completed_quests']` doesn't scan the
+    list. Every list method that changes the contents keeps the counts
+    in step, and copies and pickles are rebuilt from the items.
+    
+    version changes on every change to the contents and is never reused
+    by another list, so caches can tell a list has changed even when its
+    length hasn't (e.g. one quest removed and another appended).
+    """
+    
+    __slots__ = ('_counts', 'version')
+    
+    def __init__(self, quest_ids=()):
+        super().__init__(quest_ids)
+        self._recount()
+    
+    def _recount(self):
+        counts = {}
+        for quest_id in self:
+            counts[quest_id] = counts.get(quest_id, 0) + 1
+        self._counts = counts
+        self.version = next(_quest_list_versions)
+    
+    def _added(self, quest_id):
+        self._counts[quest_id] = self._counts.get(quest_id, 0) + 1
+        self.version = next(_quest_list_versions)
+    
+    def _removed(self, quest_id):
+        remaining = self._counts[quest_id] - 1
+        if remaining:
+            self._counts[quest_id] = remaining
+        else:
+            del self._counts[quest_id]
+        self.version = next(_quest_list_versions)
+    
+    def __contains__(self, quest_id):
+        return quest_id in self._counts
+    
+    def count(self, quest_id):
+        return self._counts.get(quest_id, 0)
+    
+    def append(self, quest_id):
+        super().append(quest_id)
+        self._added(quest_id)
+    
+    def insert(self, position, quest_id):
+        super().insert(position, quest_id)
+        self._added(quest_id)
+    
+    def extend(self, quest_ids):
+        quest_ids = list(quest_ids)
+        super().extend(quest_ids)
+        for quest_id in quest_ids:
+            self._added(quest_id)
+    
+    def __iadd__(self, quest_ids):
+        self.extend(quest_ids)
+        return self
+    
+    def remove(self, quest_id):
+        super().remove(quest_id)
+        self._removed(quest_id)
+    
+    def pop(self, position=-1):
+        quest_id = super().pop(position)
+        self._removed(quest_id)
+        return quest_id
+    
+    def clear(self):
+        super().clear()
+        self._counts = {}
+        self.version = next(_quest_list_versions)
+    
+    def __setitem__(self, position, value):
+        super().__setitem__(position, value)
+        self._recount()
+    
+    def __delitem__(self, position):
+        super().__delitem__(position)
+        self._recount()
+    
+    def __imul__(self, times):
+        super().__imul__(times)
+        self._recount()
+        return self
+    
+    def copy(self):
+        return QuestList(self)
+    
+    def __reduce__(self):
+        # Rebuild from the items so copies and unpickled lists recount
+        return (QuestList, (list(self),))
+
+
+# Private Character slots holding per-character quest caches
+_QUEST_CACHE_SLOTS = ('_quest_frontier', '_quest_tracker')
+
+
+class Character:
+    """
+    Compact character record
+    
+    Known fields live in __slots__ instead of a per-character dictionary,
+    which cuts memory several times over when many characters are loaded.
+    Hot loops can use attributes directly (character.gold), while existing
+    code keeps working with dictionary-style access (character['gold']).
+    
+    Keys that aren't known fields (e.g. bonus stats from items) are kept
+    in a small overflow dictionary that is only created when needed.
+    
+    The character's quest frontier (see quest_handler) and objective
+    tracker (see quest_tracker) live in private slots. They aren't
+    fields, so they're never saved, listed, copied or pickled.
+    """
+    
+    __slots__ = tuple(CHARACTER_FIELDS.values()) + ('_extra',) + _QUEST_CACHE_SLOTS
+    
+    def __init__(self, **fields):
+        """Create a character from attribute values, e.g. Character(name='Hero', level=1)"""
+        self._extra = None
+        self._quest_frontier = None
+        self._quest_tracker = None
+        for attribute, value in fields.items():
+            if attribute in _ATTRIBUTE_NAMES:
+                setattr(self, attribute, value)
+            else:
+                self[attribute] = value
+    
+    @classmethod
+    def from_dict(cls, data):
+        """Create a Character from any mapping of character fields"""
+        character = cls()
+        for key, value in data.items():
+            if key in QUEST_LIST_FIELDS and isinstance(value, list):
+                value = QuestList(value)
+            character[key] = value
+        return character
+    
+    def to_dict(self):
+        """Return a plain dictionary copy of the character's fields"""
+        return dict(self.items())
+    
+    def __getitem__(self, key):
+        slot = CHARACTER_FIELDS.get(key)
+        if slot is not None:
+            try:
+                return getattr(self, slot)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+    
+    def __setitem__(self, key, value):
+        slot = CHARACTER_FIELDS.get(key)
+        if slot is not None:
+            setattr(self, slot, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+    
+    def __delitem__(self, key):
+        slot = CHARACTER_FIELDS.get(key)
+        try:
+            if slot is not None:
+                delattr(self, slot)
+            elif self._extra is not None:
+                del self._extra[key]
+            else:
+                raise KeyError(key)
+        except AttributeError:
+            raise KeyError(key) from None
+    
+    def __contains__(self, key):
+        slot = CHARACTER_FIELDS.get(key)
+        if slot is not None:
+            return hasattr(self, slot)
+        return self._extra is not None and key in self._extra
+    
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+    
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+    
+    def pop(self, key, default=_MISSING):
+        try:
+            value = self[key]
+        except KeyError:
+            if default is _MISSING:
+                raise
+            return default
+        del self[key]
+        return value
+    
+    def update(self, other=(), **fields):
+        pairs = other.items() if hasattr(other, 'items') else other
+        for key, value in pairs:
+            self[key] = value
+        for key, value in fields.items():
+            self[key] = value
+    
+    def keys(self):
+        return [key for key, _ in self.items()]
+    
+    def values(self):
+        return [value for _, value in self.items()]
+    
+    def items(self):
+        pairs = []
+        for key, slot in CHARACTER_FIELDS.items():
+            try:
+                pairs.append((key, getattr(self, slot)))
+            except AttributeError:
+                pass
+        if self._extra:
+            pairs.extend(self._extra.items())
+        return pairs
+    
+    def __iter__(self):
+        return iter(self.keys())
+    
+    def __len__(self):
+        return len(self.items())
+    
+    def __getstate__(self):
+        # Copies and unpickled characters build their own quest frontier and tracker
+        state = {}
+        for slot in Character.__slots__:
+            if slot not in _QUEST_CACHE_SLOTS and hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return (None, state)
+    
+    def copy(self):
+        """Shallow copy, like dict.copy()"""
+        duplicate = Character()
+        for slot in CHARACTER_FIELDS.values():
+            try:
+                setattr(duplicate, slot, getattr(self, slot))
+            except AttributeError:
+                pass
+        if self._extra:
+            duplicate._extra = dict(self._extra)
+        return duplicate
+    
+    def __eq__(self, other):
+        if isinstance(other, Character):
+            return self.items() == other.items()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+    
+    __hash__ = None
+    
+    def __repr__(self):
+        return f"Character({self.to_dict()!r})"
+
+
+# ============================================================================
+# CLASS PROGRESSION
+# ============================================================================
+
+def load_progression(filename="data/progression.txt"):
+    """
+    Load class base stats and level-up curves from the progression file
+    
+    Returns: Dictionary of classes {class_name: progression_dict}
+    Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
+    """
+    global _progression
+    
+    _progression = game_data.load_progression(filename)
+    return _progression
+
+
+def _default_progression():
+    """Build a progression catalog from the built-in class stats"""
+    progression = {}
+    for class_name, (health, strength, magic) in DEFAULT_CLASS_STATS.items():
+        progression[class_name] = {
+            'class': class_name,
+            'base_health': health,
+            'base_strength': strength,
+            'base_magic': magic,
+            **DEFAULT_LEVEL_UP
+        }
+    return progression
+
+
+def get_progression():
+    """
+    Get the progression catalog, loading data/progression.txt on first use
+    
+    Falls back to the built-in class stats if the file doesn't exist.
+    
+    Returns: Dictionary of classes {class_name: progression_dict}
+    """
+    global _progression
+    
+    if _progression is None:
+        try:
+            load_progression()
+        except MissingDataFileError:
+            _progression = _default_progression()
+    return _progression
+
+
+def get_progression_curve(character_class):
+    """
+    Get the precomputed level tables for a class
+    
+    Returns: game_data.ProgressionCurve
+    Raises: InvalidCharacterClassError if the class has no progression
+    """
+    curves = game_data.get_progression_index(get_progression()).curves
+    curve = curves.get(character_class)
+    if curve is None:
+        raise InvalidCharacterClassError(f"Invalid class: {character_class}")
+    return curve
+
+
+def get_level_up_curve(character_class):
+    """
+    Get the curve used to level up a class
+    
+    Unlike get_progression_curve, classes without a curve (e.g. from an
+    old save) fall back to the built-in level-up rules.
+    
+    Returns: game_data.ProgressionCurve
+    """
+    global _default_curve
+    
+    curve = game_data.get_progression_index(get_progression()).curves.get(character_class)
+    if curve is None:
+        if _default_curve is None:
+            _default_curve = game_data.ProgressionCurve(_default_progression()['Warrior'])
+        curve = _default_curve
+    return curve
+
+
 # ============================================================================
 # CHARACTER MANAGEMENT FUNCTIONS
 # ============================================================================
 
+def is_valid_character_name(name):
+    """Check if a name is safe to use as a character (and save file) name"""
+    return (isinstance(name, str) and len(name) <= MAX_NAME_LENGTH
+            and VALID_NAME_PATTERN.fullmatch(name) is not None)
+
+
+def _save_filename(character_name, save_directory):
+    """
+    Get the save file path for a character
+    
+    Raises: InvalidCharacterNameError if the name could point outside
+            save_directory or isn't a valid name
+    """
+    if not is_valid_character_name(character_name):
+        raise InvalidCharacterNameError(f"Invalid character name: {character_name!r}")
+    return os.path.join(save_directory, f"{character_name}_save.txt")
+
+
 def create_character(name, character_class):
     """
     Create a new character with stats based on class
     
-    Valid classes: Warrior, Mage, Rogue, Cleric
+    Valid classes: Warrior, Mage, Rogue, Cleric (or whatever classes
+    data/progression.txt defines)
     
-    Returns: Dictionary with character data including:
+    Returns: Character record (supports dictionary-style access) including:
             - name, class, level, health, max_health, strength, magic
             - experience, gold, inventory, active_quests, completed_quests
+            - quest_xp_earned, quest_gold_earned (running quest reward totals)
     
-    Raises: InvalidCharacterClassError if class is not valid
+    Raises:
+        InvalidCharacterClassError if class is not valid
+        InvalidCharacterNameError if name isn't a valid character name
     """
     # TODO: Implement character creation
     # Validate character_class first
@@ -48,44 +496,30 @@ def create_character(name, character_class):
     
     # Raise InvalidCharacterClassError if class not in valid list
     
-    # Validate the character class
-    valid_classes = {"Warrior", "Mage", "Rogue", "Cleric"}
-    if character_class not in valid_classes:
-        raise InvalidCharacterClassError(f"Invalid class: {character_class}")
-    
-    # Set base stats based on class
-    if character_class == "Warrior":
-        health = 120
-        strength = 15
-        magic = 5
-    elif character_class == "Mage":
-        health = 80
-        strength = 8
-        magic = 20
-    elif character_class == "Rogue":
-        health = 90
-        strength = 12
-        magic = 10
-    elif character_class == "Cleric":
-        health = 100
-        strength = 10
-        magic = 15
-    
-    # Create and return character dictionary
-    character = {
-        'name': name,
-        'class': character_class,
-        'level': 1,
-        'health': health,
-        'max_health': health,
-        'strength': strength,
-        'magic': magic,
-        'experience': 0,
-        'gold': 100,
-        'inventory': [],
-        'active_quests': [],
-        'completed_quests': []
-    }
+    if not is_valid_character_name(name):
+        raise InvalidCharacterNameError(f"Invalid character name: {name!r}")
+    
+    # Validate the class and look up its level 1 stats
+    curve = get_progression_curve(character_class)
+    health, strength, magic = curve.stats_at(1)
+    
+    # Create and return the character record
+    character = Character(
+        name=name,
+        character_class=character_class,
+        level=1,
+        health=health,
+        max_health=health,
+        strength=strength,
+        magic=magic,
+        experience=0,
+        gold=100,
+        inventory=[],
+        active_quests=QuestList(),
+        completed_quests=QuestList(),
+        quest_xp_earned=0,
+        quest_gold_earned=0
+    )
     return character
 
 
@@ -108,22 +542,30 @@ def save_character(character, save_directory="data/save_games"):
     INVENTORY: item1,item2,item3
     ACTIVE_QUESTS: quest1,quest2
     COMPLETED_QUESTS: quest1,quest2
+    QUEST_XP_EARNED: 0
+    QUEST_GOLD_EARNED: 0
+    QUEST_PROGRESS: quest1=2,quest2=0/1
+    
+    The quest reward totals and objective progress (counts per objective,
+    separated by /) are only written if the character has them.
     
     Returns: True if successful
-    Raises: PermissionError, IOError (let them propagate or handle)
+    Raises:
+        InvalidCharacterNameError if the name isn't a valid character name
+        PermissionError, IOError (let them propagate or handle)
     """
     # TODO: Implement save functionality
     # Create save_directory if it doesn't exist
     # Handle any file I/O errors appropriately
     # Lists should be saved as comma-separated values
     
+    # Construct the filename
+    filename = _save_filename(character['name'], save_directory)
+    
     # Create directory if it doesn't exist
     if not os.path.exists(save_directory):
         os.makedirs(save_directory)
     
-    # Construct the filename
-    filename = os.path.join(save_directory, f"{character['name']}_save.txt")
-    
     try:
         with open(filename, 'w') as file:
             # Write each character field to the file
@@ -146,6 +588,20 @@ def save_character(character, save_directory="data/save_games"):
             
             completed_quests_str = ','.join(character['completed_quests'])
             file.write(f"COMPLETED_QUESTS: {completed_quests_str}\n")
+            
+            # Running quest reward totals
+            if 'quest_xp_earned' in character:
+                file.write(f"QUEST_XP_EARNED: {character['quest_xp_earned']}\n")
+            if 'quest_gold_earned' in character:
+                file.write(f"QUEST_GOLD_EARNED: {character['quest_gold_earned']}\n")
+            
+            # Objective progress of active quests
+            if 'quest_progress' in character:
+                progress_str = ','.join(
+                    f"{quest_id}={'/'.join(str(count) for count in counts)}"
+                    for quest_id, counts in character['quest_progress'].items()
+                )
+                file.write(f"QUEST_PROGRESS: {progress_str}\n")
         
         return True
     
@@ -161,8 +617,9 @@ def load_character(character_name, save_directory="data/save_games"):
         character_name: Name of character to load
         save_directory: Directory containing save files
     
-    Returns: Character dictionary
+    Returns: Character record
     Raises: 
+        InvalidCharacterNameError if the name isn't a valid character name
         CharacterNotFoundError if save file doesn't exist
         SaveFileCorruptedError if file exists but can't be read
         InvalidSaveDataError if data format is wrong
@@ -174,7 +631,7 @@ def load_character(character_name, save_directory="data/save_games"):
     # Parse comma-separated lists back into Python lists
     
     # Construct the filename
-    filename = os.path.join(save_directory, f"{character_name}_save.txt")
+    filename = _save_filename(character_name, save_directory)
     
     # Check if file exists
     if not os.path.exists(filename):
@@ -209,7 +666,8 @@ def load_character(character_name, save_directory="data/save_games"):
             # Parse different field types
             if key in {"NAME", "CLASS"}:
                 character[key.lower()] = value
-            elif key in {"LEVEL", "HEALTH", "MAX_HEALTH", "STRENGTH", "MAGIC", "EXPERIENCE", "GOLD"}:
+            elif key in {"LEVEL", "HEALTH", "MAX_HEALTH", "STRENGTH", "MAGIC", "EXPERIENCE", "GOLD",
+                         "QUEST_XP_EARNED", "QUEST_GOLD_EARNED"}:
                 character[key.lower()] = int(value)
             elif key in {"INVENTORY", "ACTIVE_QUESTS", "COMPLETED_QUESTS"}:
                 # Handle empty lists properly
@@ -219,12 +677,20 @@ def load_character(character_name, save_directory="data/save_games"):
                     # Split on comma and filter out empty strings
                     items = [item.strip() for item in value.split(',') if item.strip()]
                     character[key.lower()] = items
+            elif key == "QUEST_PROGRESS":
+                # quest_id=count/count,... → {quest_id: [count, count]}
+                progress = {}
+                for entry in value.split(','):
+                    if entry.strip():
+                        quest_id, counts = entry.split('=', 1)
+                        progress[quest_id.strip()] = [int(count) for count in counts.split('/')]
+                character['quest_progress'] = progress
             else:
                 raise InvalidSaveDataError(f"Unexpected key '{key}' in save file.")
         
         # Validate loaded character data
         validate_character_data(character)
-        return character
+        return Character.from_dict(character)
     
     except InvalidSaveDataError:
         raise
@@ -262,13 +728,15 @@ def delete_character(character_name, save_directory="data/save_games"):
     Delete a character's save file
     
     Returns: True if deleted successfully
-    Raises: CharacterNotFoundError if character doesn't exist
+    Raises:
+        InvalidCharacterNameError if the name isn't a valid character name
+        CharacterNotFoundError if character doesn't exist
     """
     # TODO: Implement character deletion
     # Verify file exists before attempting deletion
     
     # Construct the filename
-    filename = os.path.join(save_directory, f"{character_name}_save.txt")
+    filename = _save_filename(character_name, save_directory)
     
     # Check if file exists
     if not os.path.exists(filename):
@@ -282,11 +750,26 @@ def delete_character(character_name, save_directory="data/save_games"):
 # CHARACTER OPERATIONS
 # ============================================================================
 
+def calculate_level_gain(character_class, level, experience):
+    """
+    Work out how many levels a pool of experience buys, without looping
+    
+    Uses the class's precomputed cumulative XP table (closed form past
+    the end of the table).
+    
+    Returns: Tuple (levels_gained, xp_spent)
+    Raises: InvalidCharacterClassError if the class has no progression
+    """
+    return get_progression_curve(character_class).levels_gained(level, experience)
+
+
 def gain_experience(character, xp_amount):
     """
     Add experience to character and handle level ups
     
-    Level up formula: level_up_xp = current_level * 100
+    Level up costs and stat gains come from the class's progression
+    curve (default: level_up_xp = current_level * 100). Characters whose
+    class has no curve use the default rules.
     Example when leveling up:
     - Increase level by 1
     - Increase max_health by 10
@@ -294,38 +777,33 @@ def gain_experience(character, xp_amount):
     - Increase magic by 2
     - Restore health to max_health
     
+    Any number of levels is applied in one step (see calculate_level_gain).
+    
     Raises: CharacterDeadError if character health is 0
     """
-    # TODO: Implement experience gain and leveling
-    # Check if character is dead first
-    # Add experience
-    # Check for level up (can level up multiple times)
-    # Update stats on level up
-    
     # Check if character is dead
     if character['health'] <= 0:
         raise CharacterDeadError("Cannot gain experience: character is dead.")
     
     # Add experience
+    starting_level = character['level']
     character['experience'] += xp_amount
     
     # Check for level ups (can level up multiple times)
-    while character['experience'] >= character['level'] * 100:
-        # Subtract XP needed for this level
-        character['experience'] -= character['level'] * 100
-        
-        # Increase level
-        character['level'] += 1
-        
-        # Increase max health
-        character['max_health'] += 10
-        
-        # Increase stats
-        character['strength'] += 2
-        character['magic'] += 2
+    curve = get_level_up_curve(character.get('class'))
+    levels, xp_spent = curve.levels_gained(starting_level, character['experience'])
+    if levels:
+        character['experience'] -= xp_spent
+        character['level'] += levels
+        character['max_health'] += curve.health_per_level * levels
+        character['strength'] += curve.strength_per_level * levels
+        character['magic'] += curve.magic_per_level * levels
         
         # Restore health to max
         character['health'] = character['max_health']
+        
+        # Announce the level change
+        game_events.publish(game_events.LevelUp(character, starting_level, character['level']))
     
     return character
 
@@ -351,6 +829,7 @@ def add_gold(character, amount):
     
     # Add the gold
     character['gold'] += amount
+    game_events.publish(game_events.GoldChanged(character, amount, character['gold']))
     return character['gold']
 
 
@@ -10,7 +10,12 @@ Handles combat mechanics
 """
 
 import random
+from collections import namedtuple
+import game_data
+import game_events
 from custom_exceptions import (
+    MissingDataFileError,
+    InvalidDataFormatError,
     InvalidTargetError,
     CombatNotActiveError,
     CharacterDeadError,
@@ -21,6 +26,110 @@ from custom_exceptions import (
 # ENEMY DEFINITIONS
 # ============================================================================
 
+# Immutable stats shared by every enemy of one type
+EnemyTemplate = namedtuple(
+    'EnemyTemplate',
+    ['type', 'name', 'max_health', 'strength', 'magic', 'xp_reward', 'gold_reward']
+)
+
+# Registry of enemy templates {enemy_type: EnemyTemplate}, built once
+ENEMY_TEMPLATES = {
+    'goblin': EnemyTemplate('goblin', 'Goblin', 50, 8, 2, 25, 10),
+    'orc': EnemyTemplate('orc', 'Orc', 80, 12, 5, 50, 25),
+    'dragon': EnemyTemplate('dragon', 'Dragon', 200, 25, 15, 200, 100)
+}
+
+# Level bands used when data/enemies.txt is missing {enemy_type: (min, max)}
+DEFAULT_LEVEL_BANDS = {
+    'goblin': (1, 2),
+    'orc': (3, 5),
+    'dragon': (6, None)
+}
+
+# Enemy types the game refers to by name; a data file must define them
+REQUIRED_ENEMY_TYPES = ('goblin', 'orc', 'dragon')
+
+_TEMPLATE_FIELDS = frozenset(EnemyTemplate._fields)
+
+# Enemy catalog backing the spawn tables (loaded on first use)
+_enemy_catalog = None
+
+
+class Enemy:
+    """
+    One enemy in one encounter
+    
+    Holds a reference to the shared EnemyTemplate plus the only state that
+    changes during a fight (current health), so creating an encounter is a
+    single small allocation. Supports dictionary-style access like the
+    original enemy dictionaries: enemy['name'], enemy['health'] = 0, ...
+    
+    Any other field that gets assigned is copied into a per-encounter
+    override dictionary; the template itself is never modified.
+    """
+    
+    __slots__ = ('template', 'health', '_overrides')
+    
+    def __init__(self, template, health=None):
+        self.template = template
+        self.health = template.max_health if health is None else health
+        self._overrides = None
+    
+    def __getitem__(self, key):
+        if key == 'health':
+            return self.health
+        if self._overrides is not None and key in self._overrides:
+            return self._overrides[key]
+        if key in _TEMPLATE_FIELDS:
+            return getattr(self.template, key)
+        raise KeyError(key)
+    
+    def __setitem__(self, key, value):
+        if key == 'health':
+            self.health = value
+        else:
+            if self._overrides is None:
+                self._overrides = {}
+            self._overrides[key] = value
+    
+    def __contains__(self, key):
+        return (key == 'health' or key in _TEMPLATE_FIELDS
+                or (self._overrides is not None and key in self._overrides))
+    
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+    
+    def to_dict(self):
+        """Return a plain dictionary with all of this enemy's fields"""
+        enemy = self.template._asdict()
+        enemy['health'] = self.health
+        if self._overrides:
+            enemy.update(self._overrides)
+        return enemy
+    
+    def copy(self):
+        """Copy the per-encounter state; the template stays shared"""
+        duplicate = Enemy(self.template, self.health)
+        if self._overrides:
+            duplicate._overrides = dict(self._overrides)
+        return duplicate
+    
+    def __eq__(self, other):
+        if isinstance(other, Enemy):
+            return self.to_dict() == other.to_dict()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+    
+    __hash__ = None
+    
+    def __repr__(self):
+        return f"Enemy({self.to_dict()!r})"
+
+
 def create_enemy(enemy_type):
     """
     Create an enemy based on type
@@ -30,71 +139,106 @@ def create_enemy(enemy_type):
     - orc: health=80, strength=12, magic=5, xp_reward=50, gold_reward=25
     - dragon: health=200, strength=25, magic=15, xp_reward=200, gold_reward=100
     
-    Returns: Enemy dictionary
+    Stats come from the shared template in ENEMY_TEMPLATES; only the
+    enemy's current health is allocated per encounter.
+    
+    Returns: Enemy (supports dictionary-style access)
     Raises: InvalidTargetError if enemy_type not recognized
     """
-    # TODO: Implement enemy creation
-    # Return dictionary with: name, health, max_health, strength, magic, xp_reward, gold_reward
-    
-    enemy_type = enemy_type.lower()
-    
-    if enemy_type == "goblin":
-        return {
-            'name': 'Goblin',
-            'type': 'goblin',
-            'health': 50,
-            'max_health': 50,
-            'strength': 8,
-            'magic': 2,
-            'xp_reward': 25,
-            'gold_reward': 10
-        }
-    elif enemy_type == "orc":
-        return {
-            'name': 'Orc',
-            'type': 'orc',
-            'health': 80,
-            'max_health': 80,
-            'strength': 12,
-            'magic': 5,
-            'xp_reward': 50,
-            'gold_reward': 25
-        }
-    elif enemy_type == "dragon":
-        return {
-            'name': 'Dragon',
-            'type': 'dragon',
-            'health': 200,
-            'max_health': 200,
-            'strength': 25,
-            'magic': 15,
-            'xp_reward': 200,
-            'gold_reward': 100
-        }
-    else:
+    template = ENEMY_TEMPLATES.get(enemy_type.lower())
+    if template is None:
         raise InvalidTargetError(f"Unknown enemy type: {enemy_type}")
+    
+    return Enemy(template)
+
+
+def load_enemy_templates(filename="data/enemies.txt"):
+    """
+    Load enemy templates and spawn bands from the enemy data file
+    
+    Replaces ENEMY_TEMPLATES with the file's enemies and builds the
+    level -> spawn table index used by get_random_enemy_for_level.
+    The file must define every type in REQUIRED_ENEMY_TYPES; otherwise
+    the current templates are kept.
+    
+    Returns: Dictionary of enemies {enemy_id: enemy_data_dict}
+    Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
+    """
+    global _enemy_catalog
+    
+    enemies = game_data.load_enemies(filename)
+    
+    missing = [enemy_type for enemy_type in REQUIRED_ENEMY_TYPES if enemy_type not in enemies]
+    if missing:
+        raise InvalidDataFormatError(f"Enemy data is missing required enemies: {', '.join(missing)}")
+    
+    ENEMY_TEMPLATES.clear()
+    for enemy_id, enemy in enemies.items():
+        ENEMY_TEMPLATES[enemy_id] = EnemyTemplate(
+            enemy_id, enemy['name'], enemy['health'], enemy['strength'],
+            enemy['magic'], enemy['xp_reward'], enemy['gold_reward']
+        )
+    
+    _enemy_catalog = enemies
+    return enemies
+
+
+def _default_enemy_catalog():
+    """Build an enemy catalog from the built-in templates and level bands"""
+    enemies = {}
+    for enemy_id, (min_level, max_level) in DEFAULT_LEVEL_BANDS.items():
+        template = ENEMY_TEMPLATES[enemy_id]
+        enemies[enemy_id] = {
+            'enemy_id': enemy_id,
+            'name': template.name,
+            'health': template.max_health,
+            'strength': template.strength,
+            'magic': template.magic,
+            'xp_reward': template.xp_reward,
+            'gold_reward': template.gold_reward,
+            'min_level': min_level,
+            'max_level': max_level,
+            'spawn_weight': 1
+        }
+    return enemies
+
+
+def get_enemy_catalog():
+    """
+    Get the enemy catalog, loading data/enemies.txt on first use
+    
+    Falls back to the built-in goblin/orc/dragon bands if the file
+    doesn't exist.
+    
+    Returns: Dictionary of enemies {enemy_id: enemy_data_dict}
+    """
+    global _enemy_catalog
+    
+    if _enemy_catalog is None:
+        try:
+            load_enemy_templates()
+        except MissingDataFileError:
+            _enemy_catalog = _default_enemy_catalog()
+    return _enemy_catalog
 
 
 def get_random_enemy_for_level(character_level):
     """
     Get an appropriate enemy for character's level
     
-    Level 1-2: Goblins
-    Level 3-5: Orcs
-    Level 6+: Dragons
+    Eligible enemies and their spawn weights come from data/enemies.txt
+    (default bands: Level 1-2 Goblins, 3-5 Orcs, 6+ Dragons). The weighted
+    spawn table for each level is precomputed, so each pick is O(1).
     
     Returns: Enemy dictionary
+    Raises: InvalidTargetError if no enemy spawns at that level
     """
-    # TODO: Implement level-appropriate enemy selection
-    # Use if/elif/else to select enemy type
-    # Call create_enemy with appropriate type
-    
-    if character_level <= 2:
-        return create_enemy("goblin")
-    elif character_level <= 5:
-        return create_enemy("orc")
-    else:
-        return create_enemy("dragon")
+    index = game_data.get_enemy_index(get_enemy_catalog())
+    table = index.spawn_table(character_level)
+    if table is None:
+        raise InvalidTargetError(f"No enemies spawn at level {character_level}")
+    
+    return create_enemy(table.draw())
 
 
 # ============================================================================
@@ -105,10 +249,20 @@ class SimpleBattle:
     """
     Simple turn-based combat system
     
-    Manages combat between character and enemy
+    Manages combat between character and enemy. start_battle() runs the
+    whole fight with console input; play_round() runs one round for a
+    given action so callers without a console (game sessions) can drive
+    the fight one command at a time.
+    
+    Battle messages go to output(text) if given, otherwise to the console;
+    start_battle() reads actions from input_func(prompt) if given.
     """
     
-    def __init__(self, character, enemy):
+    # Player actions by menu number or name
+    ACTIONS = {'1': 'attack', '2': 'ability', '3': 'run',
+               'attack': 'attack', 'ability': 'ability', 'run': 'run'}
+    
+    def __init__(self, character, enemy, output=None, input_func=None):
         """Initialize battle with character and enemy"""
         # TODO: Implement initialization
         # Store character and enemy
@@ -116,17 +270,35 @@ class SimpleBattle:
         # Initialize turn counter
         
         self.character = character.copy()  # Use copy to not modify original
+        self.source_character = character  # Events are published for the original
         self.enemy = enemy.copy()
         self.combat_active = True
         self.turn_count = 0
         self.battle_log = []
+        self.output = output
+        self.input_func = input_func
+    
+    def log(self, message):
+        """Record a battle message and show it"""
+        self.battle_log.append(message)
+        if self.output is None:
+            display_battle_log(message)
+        else:
+            self.output(f">>> {message}")
+    
+    def show_stats(self):
+        """Show both fighters' current stats"""
+        if self.output is None:
+            display_combat_stats(self.character, self.enemy)
+        else:
+            self.output(format_combat_stats(self.character, self.enemy))
     
     def start_battle(self):
         """
         Start the combat loop
         
         Returns: Dictionary with battle results:
-                {'winner': 'player'|'enemy', 'xp_gained': int, 'gold_gained': int}
+                {'winner': 'player'|'enemy'|'escaped', 'xp_gained': int, 'gold_gained': int}
         
         Raises: CharacterDeadError if character is already dead
         """
@@ -135,49 +307,80 @@ class SimpleBattle:
         # Loop until someone dies
         # Award XP and gold if player wins
         
-        # Check character isn't dead before starting
-        if self.character['health'] <= 0:
-            raise CharacterDeadError("Character is dead and cannot fight!")
-        
-        # Display battle start
-        display_battle_log(f"⚔️ Battle started: {self.character['name']} vs {self.enemy['name']}!")
+        # Check character isn't dead, then display battle start
+        self.announce()
         
         # Battle loop
-        while self.combat_active:
+        while True:
             # Display current stats
-            display_combat_stats(self.character, self.enemy)
-            
-            # Player turn
-            self.player_turn()
+            self.show_stats()
             
-            # Check if enemy is dead
-            result = self.check_battle_end()
-            if result == 'player':
-                display_battle_log(f"✓ Victory! {self.enemy['name']} has been defeated!")
-                rewards = get_victory_rewards(self.enemy)
-                return {
-                    'winner': 'player',
-                    'xp_gained': rewards['xp'],
-                    'gold_gained': rewards['gold']
-                }
-            
-            # Enemy turn (if still alive)
-            if self.combat_active and self.enemy['health'] > 0:
-                self.enemy_turn()
-                
-                # Check if character is dead
-                result = self.check_battle_end()
-                if result == 'enemy':
-                    display_battle_log(f"✗ Defeat! You have been defeated by {self.enemy['name']}!")
-                    return {
-                        'winner': 'enemy',
-                        'xp_gained': 0,
-                        'gold_gained': 0
-                    }
-            
-            self.turn_count += 1
+            result = self.play_round(None)
+            if result is not None:
+                return result
+    
+    def announce(self):
+        """
+        Check the character can fight and show the start of the battle
+        
+        Raises: CharacterDeadError if character is already dead
+        """
+        if self.character['health'] <= 0:
+            raise CharacterDeadError("Character is dead and cannot fight!")
+        self.log(f"⚔️ Battle started: {self.character['name']} vs {self.enemy['name']}!")
+    
+    def play_round(self, action):
+        """
+        Play one round: the player's action, then the enemy's attack
+        
+        Args:
+            action: 'attack', 'ability' or 'run' (or menu number '1'-'3');
+                    None asks on the console
+        
+        Returns: Battle results dictionary (see start_battle) once the
+                 battle is over, None while it continues
+        Raises: CombatNotActiveError if the battle is already over
+        """
+        # Player turn
+        self.player_turn(action)
+        
+        # Check if enemy is dead
+        result = self.check_battle_end()
+        if result == 'player':
+            self.log(f"✓ Victory! {self.enemy['name']} has been defeated!")
+            self.combat_active = False
+            rewards = get_victory_rewards(self.enemy)
+            game_events.publish(game_events.EnemyDefeated(
+                self.source_character, self.enemy['type'], rewards['xp'], rewards['gold']
+            ))
+            return {
+                'winner': 'player',
+                'xp_gained': rewards['xp'],
+                'gold_gained': rewards['gold']
+            }
+        
+        # Escaped
+        if not self.combat_active:
+            return {'winner': 'escaped', 'xp_gained': 0, 'gold_gained': 0}
+        
+        # Enemy turn (still alive)
+        self.enemy_turn()
+        
+        # Check if character is dead
+        result = self.check_battle_end()
+        if result == 'enemy':
+            self.log(f"✗ Defeat! You have been defeated by {self.enemy['name']}!")
+            self.combat_active = False
+            return {
+                'winner': 'enemy',
+                'xp_gained': 0,
+                'gold_gained': 0
+            }
+        
+        self.turn_count += 1
+        return None
     
-    def player_turn(self):
+    def player_turn(self, action=None):
         """
         Handle player's turn
         
@@ -186,6 +389,8 @@ class SimpleBattle:
         2. Special Ability (if available)
         3. Try to Run
         
+        The menu is only shown (and input read) when no action is given.
+        
         Raises: CombatNotActiveError if called outside of battle
         """
         # TODO: Implement player turn
@@ -197,41 +402,44 @@ class SimpleBattle:
         if not self.combat_active:
             raise CombatNotActiveError("Combat is not active!")
         
-        # Display options
-        print("\nYour turn! Choose an action:")
-        print("1. Basic Attack")
-        print("2. Special Ability")
-        print("3. Try to Run")
+        if action is None:
+            # Display options
+            print("\nYour turn! Choose an action:")
+            print("1. Basic Attack")
+            print("2. Special Ability")
+            print("3. Try to Run")
+            
+            action = (self.input_func or input)("Enter your choice (1-3): ").strip()
         
-        choice = input("Enter your choice (1-3): ").strip()
+        choice = self.ACTIONS.get(action.lower())
         
-        if choice == '1':
+        if choice == 'attack':
             # Basic attack
             damage = self.calculate_damage(self.character, self.enemy)
             self.apply_damage(self.enemy, damage)
-            display_battle_log(f"{self.character['name']} attacks for {damage} damage!")
+            self.log(f"{self.character['name']} attacks for {damage} damage!")
         
-        elif choice == '2':
+        elif choice == 'ability':
             # Special ability
             try:
                 use_special_ability(self.character, self.enemy)
-                display_battle_log(f"{self.character['name']} used special ability!")
+                self.log(f"{self.character['name']} used special ability!")
             except Exception as e:
-                display_battle_log(f"Could not use ability: {e}")
+                self.log(f"Could not use ability: {e}")
         
-        elif choice == '3':
+        elif choice == 'run':
             # Try to escape
             if self.attempt_escape():
-                display_battle_log("You escaped from battle!")
+                self.log("You escaped from battle!")
                 self.combat_active = False
             else:
-                display_battle_log("Escape failed!")
+                self.log("Escape failed!")
         
         else:
-            display_battle_log("Invalid choice, basic attack used instead!")
+            self.log("Invalid choice, basic attack used instead!")
             damage = self.calculate_damage(self.character, self.enemy)
             self.apply_damage(self.enemy, damage)
-            display_battle_log(f"{self.character['name']} attacks for {damage} damage!")
+            self.log(f"{self.character['name']} attacks for {damage} damage!")
     
     def enemy_turn(self):
         """
@@ -252,7 +460,7 @@ class SimpleBattle:
         # Enemy always attacks (simple AI)
         damage = self.calculate_damage(self.enemy, self.character)
         self.apply_damage(self.character, damage)
-        display_battle_log(f"{self.enemy['name']} attacks for {damage} damage!")
+        self.log(f"{self.enemy['name']} attacks for {damage} damage!")
     
     def calculate_damage(self, attacker, defender):
         """
@@ -462,10 +670,21 @@ def display_combat_stats(character, enemy):
     """
     # TODO: Implement status display
     
-    print(f"\n--- Combat Status ---")
-    print(f"{character['name']}: HP={character['health']}/{character['max_health']} | STR={character['strength']} | MAG={character['magic']}")
-    print(f"{enemy['name']}: HP={enemy['health']}/{enemy['max_health']} | STR={enemy['strength']} | MAG={enemy['magic']}")
-    print("-" * 40)
+    print("\n" + format_combat_stats(character, enemy))
+
+
+def format_combat_stats(character, enemy):
+    """
+    Format the combat status display
+    
+    Returns: Multi-line string with both fighters' health and stats
+    """
+    return "\n".join([
+        "--- Combat Status ---",
+        f"{character['name']}: HP={character['health']}/{character['max_health']} | STR={character['strength']} | MAG={character['magic']}",
+        f"{enemy['name']}: HP={enemy['health']}/{enemy['max_health']} | STR={enemy['strength']} | MAG={enemy['magic']}",
+        "-" * 40
+    ])
 
 
 def display_battle_log(message):
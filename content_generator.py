@@ -0,0 +1,444 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Content Generator Module
+
+Name: Charlestone Mayenga
+
+AI Usage: [Document any AI assistance used]
+
+This module generates game content of any size for scale testing:
+item and quest files in the formats game_data reads, and save files in
+the format character_manager reads. Everything is deterministic from a
+seed, so a data set can be regenerated anywhere instead of shipped.
+
+The content is shaped like a long-running game:
+- Items come in tiers; low tiers are common, and cost follows power.
+- Quests come in storylines, each quest requiring the one before it.
+  Some also require (or offer an alternative through) an earlier
+  storyline. Required levels climb along a storyline, and most
+  storylines start at low levels.
+- Characters are mostly low level, with leftover XP and stats that
+  match their class curve. Inventories are full of repeats of a few
+  favourite items. Quest histories are completed in prerequisite
+  order, and can be thousands of quests long.
+
+    python content_generator.py --items 100000 --quests 50000 --characters 1000 \\
+        --seed 7 --output-dir generated
+"""
+
+import os
+import sys
+import random
+import argparse
+
+import game_data
+import quest_handler
+import character_manager
+import inventory_system
+
+# Share of each item type
+ITEM_TYPE_WEIGHTS = {'consumable': 5, 'weapon': 3, 'armor': 2}
+
+# Stats each item type can boost (repeats make a stat more likely)
+ITEM_EFFECT_STATS = {
+    'consumable': ["health", "health", "health", "strength", "magic"],
+    'weapon': ["strength", "strength", "magic"],
+    'armor': ["max_health", "max_health", "magic"],
+}
+
+# Item name adjectives from the lowest tier to the highest
+ITEM_ADJECTIVES = ["Rusty", "Iron", "Steel", "Silver", "Elven", "Runed", "Blessed",
+                   "Shadow", "Dragonbone", "Celestial"]
+ITEM_NOUNS = {
+    'consumable': ["Potion", "Elixir", "Tonic", "Draught", "Salve"],
+    'weapon': ["Sword", "Axe", "Staff", "Dagger", "Mace", "Bow"],
+    'armor': ["Shield", "Helm", "Robe", "Mail", "Cloak", "Greaves"],
+}
+
+QUEST_VERBS = ["Clear", "Defend", "Explore", "Escort", "Recover", "Investigate"]
+QUEST_PLACES = ["the Old Mine", "the Forest Road", "the Sunken Temple", "the Border Fort",
+                "the Marsh", "the Northern Pass", "the Catacombs", "the Harbor"]
+
+# Enemies that make sense for kill objectives, by lowest level they appear
+# (the spawn bands in data/enemies.txt)
+ENEMIES_BY_LEVEL = [(1, "goblin"), (3, "orc"), (6, "dragon")]
+
+CHARACTER_NAMES = ["Aria", "Bram", "Cora", "Dain", "Esme", "Finn", "Gwen", "Hale",
+                   "Iris", "Jory", "Kira", "Lorn", "Mira", "Nash", "Orla", "Pike"]
+
+MAX_ITEM_TIER = 50
+MAX_QUEST_LEVEL = 50
+MAX_CHARACTER_LEVEL = 60
+
+# Quests per storyline
+STORYLINE_LENGTH = (3, 12)
+
+# Chance a quest also depends on an earlier storyline
+CROSS_STORYLINE_CHANCE = 0.15
+
+# Chance a quest has objectives
+OBJECTIVE_CHANCE = 0.4
+
+# Longest quest history given to randomly generated characters
+DEFAULT_MAX_HISTORY = 500
+
+# ============================================================================
+# DISTRIBUTIONS
+# ============================================================================
+
+def skewed_level(rng, max_level, skew=2.5):
+    """
+    Draw a level from 1 to max_level, mostly low ones
+    
+    Higher skew pushes more of the draws toward level 1.
+    
+    Returns: Integer level
+    """
+    return 1 + int((max_level - 1) * rng.random() ** skew)
+
+
+def _weighted_choice(rng, weights):
+    """Pick a key of a {choice: weight} dictionary"""
+    choices = list(weights)
+    return rng.choices(choices, [weights[choice] for choice in choices])[0]
+
+
+def _slug(text):
+    """Lowercase ID fragment from a name"""
+    return "_".join(text.lower().split())
+
+# ============================================================================
+# ITEMS
+# ============================================================================
+
+def generate_items(count, seed=0):
+    """
+    Generate item dictionaries (same keys as game_data.load_items)
+    
+    Yields: Item dictionaries
+    """
+    rng = random.Random(f"{seed}-items")
+    for number in range(count):
+        item_type = _weighted_choice(rng, ITEM_TYPE_WEIGHTS)
+        tier = skewed_level(rng, MAX_ITEM_TIER)
+        stat = rng.choice(ITEM_EFFECT_STATS[item_type])
+        value = max(1, round(tier * (3 if stat in ("health", "max_health") else 1) * rng.uniform(0.8, 1.2)))
+        adjective = ITEM_ADJECTIVES[(tier - 1) * len(ITEM_ADJECTIVES) // MAX_ITEM_TIER]
+        name = f"{adjective} {rng.choice(ITEM_NOUNS[item_type])}"
+        
+        yield {
+            'item_id': f"{_slug(name)}_{number}",
+            'name': name,
+            'type': item_type,
+            'effect': f"{stat}:{value}",
+            'cost': max(1, round(value * rng.uniform(8, 15))),
+            'description': f"A tier {tier} {item_type}",
+        }
+
+
+def format_item(item):
+    """Format an item as a data/items.txt block"""
+    return (
+        f"ITEM_ID: {item['item_id']}\n"
+        f"NAME: {item['name']}\n"
+        f"TYPE: {item['type']}\n"
+        f"EFFECT: {item['effect']}\n"
+        f"COST: {item['cost']}\n"
+        f"DESCRIPTION: {item['description']}\n"
+    )
+
+
+def write_items(filename, items):
+    """
+    Write items in the data/items.txt format
+    
+    Returns: List of the item IDs written
+    """
+    item_ids = []
+    with open(filename, 'w') as file:
+        for item in items:
+            if item_ids:
+                file.write("\n")
+            file.write(format_item(item))
+            item_ids.append(item['item_id'])
+    return item_ids
+
+# ============================================================================
+# QUESTS
+# ============================================================================
+
+def _quest_objective(rng, level):
+    """Make an OBJECTIVE value suited to a quest's level"""
+    kind = rng.choice(["kill", "kill", "buy", "level"])
+    if kind == "kill":
+        enemies = [enemy for lowest, enemy in ENEMIES_BY_LEVEL if lowest <= level]
+        return f"kill:{rng.choice(enemies)}:{rng.randint(1, 5)}"
+    if kind == "buy":
+        return f"buy:{rng.choice(list(ITEM_TYPE_WEIGHTS))}:1"
+    return f"level:{level + rng.randint(1, 3)}"
+
+
+def generate_quests(count, seed=0):
+    """
+    Generate quest dictionaries (same keys as game_data.load_quests)
+    
+    Quests are yielded in storyline order; a quest's prerequisites always
+    come before it, so the result has no cycles or missing references.
+    
+    Yields: Quest dictionaries
+    """
+    rng = random.Random(f"{seed}-quests")
+    quest_ids = []
+    number = 0
+    
+    while number < count:
+        storyline_start = len(quest_ids)
+        length = rng.randint(*STORYLINE_LENGTH)
+        level = skewed_level(rng, MAX_QUEST_LEVEL)
+        place = rng.choice(QUEST_PLACES)
+        
+        for chapter in range(1, length + 1):
+            if number >= count:
+                break
+            quest_id = f"{_slug(place.replace('the ', ''))}_{number}"
+            
+            prerequisite = "NONE"
+            if chapter > 1:
+                prerequisite = quest_ids[-1]
+                if storyline_start and rng.random() < CROSS_STORYLINE_CHANCE:
+                    other = quest_ids[rng.randrange(storyline_start)]
+                    # Either both are needed, or the other quest is an alternative
+                    separator = ", " if rng.random() < 0.5 else "|"
+                    prerequisite = f"{prerequisite}{separator}{other}"
+            
+            quest = {
+                'quest_id': quest_id,
+                'title': f"{rng.choice(QUEST_VERBS)} {place} (Part {chapter})",
+                'description': f"Chapter {chapter} of the tale of {place}",
+                'reward_xp': level * rng.randint(20, 40),
+                'reward_gold': level * rng.randint(5, 20),
+                'required_level': level,
+                'prerequisite': prerequisite,
+            }
+            if rng.random() < OBJECTIVE_CHANCE:
+                quest['objective'] = _quest_objective(rng, level)
+            
+            yield quest
+            quest_ids.append(quest_id)
+            number += 1
+            level = min(MAX_QUEST_LEVEL, level + rng.randint(0, 2))
+
+
+def format_quest(quest):
+    """Format a quest as a data/quests.txt block"""
+    text = (
+        f"QUEST_ID: {quest['quest_id']}\n"
+        f"TITLE: {quest['title']}\n"
+        f"DESCRIPTION: {quest['description']}\n"
+        f"REWARD_XP: {quest['reward_xp']}\n"
+        f"REWARD_GOLD: {quest['reward_gold']}\n"
+        f"REQUIRED_LEVEL: {quest['required_level']}\n"
+        f"PREREQUISITE: {quest['prerequisite']}\n"
+    )
+    if quest.get('objective', 'NONE') != 'NONE':
+        text += f"OBJECTIVE: {quest['objective']}\n"
+    return text
+
+
+def write_quests(filename, quests):
+    """
+    Write quests in the data/quests.txt format
+    
+    Returns: Number of quests written
+    """
+    count = 0
+    with open(filename, 'w') as file:
+        for quest in quests:
+            if count:
+                file.write("\n")
+            file.write(format_quest(quest))
+            count += 1
+    return count
+
+# ============================================================================
+# CHARACTERS
+# ============================================================================
+
+def _prerequisites_met(quest, completed):
+    """Check a quest's PREREQUISITE expression against completed quest IDs"""
+    groups = game_data.parse_prerequisite_expression(quest['prerequisite'])
+    return all(any(quest_id in completed for quest_id in group) for group in groups)
+
+
+def _quest_history(rng, quests, level, history, active_count):
+    """
+    Pick completed and active quests a character at level could have
+    
+    Walks quests in order, completing each one whose level and
+    prerequisites allow it (skipping a few) until the history is long
+    enough; then picks active quests the same way.
+    
+    Returns: Tuple (completed quest list, active quest list)
+    """
+    completed = []
+    completed_set = set()
+    active = []
+    
+    for quest in quests:
+        if len(active) >= active_count:
+            break
+        if quest['required_level'] > level or not _prerequisites_met(quest, completed_set):
+            continue
+        if len(completed) < history:
+            if rng.random() < 0.9:
+                completed.append(quest['quest_id'])
+                completed_set.add(quest['quest_id'])
+        elif rng.random() < 0.5:
+            active.append(quest['quest_id'])
+    
+    return completed, active
+
+
+def _favourite_inventory(rng, item_ids, size):
+    """A duplicate-heavy inventory: a few favourite items, the first most common"""
+    if not item_ids or not size:
+        return []
+    favourites = rng.sample(item_ids, min(len(item_ids), rng.randint(2, 6)))
+    weights = [1 / (rank + 1) for rank in range(len(favourites))]
+    return rng.choices(favourites, weights, k=size)
+
+
+def generate_characters(count, quests, items, seed=0, level=None, history=None,
+                        inventory_size=None):
+    """
+    Generate character records ready for character_manager.save_character
+    
+    Args:
+        count: Number of characters
+        quests: Quest dictionaries in file order (a dict from load_quests
+                or the output of generate_quests); quests whose
+                prerequisites come later are never completed
+        items: Item catalog (dict) or list of item IDs
+        seed: Random seed
+        level: Level for every character (random, mostly low, if None)
+        history: Completed quests per character (random up to
+                 DEFAULT_MAX_HISTORY if None; fewer if not enough quests
+                 are reachable)
+        inventory_size: Items per inventory (random if None)
+    
+    Yields: Character records (character_manager.Character)
+    """
+    rng = random.Random(f"{seed}-characters")
+    quest_list = list(quests.values()) if isinstance(quests, dict) else list(quests)
+    rewards = {quest['quest_id']: (quest['reward_xp'], quest['reward_gold']) for quest in quest_list}
+    item_ids = list(items)
+    progression = character_manager.get_progression()
+    classes = sorted(progression)
+    
+    for number in range(count):
+        character_class = rng.choice(classes)
+        curve = character_manager.get_progression_curve(character_class)
+        character_level = level if level is not None else skewed_level(rng, MAX_CHARACTER_LEVEL)
+        max_health, strength, magic = curve.stats_at(character_level)
+        
+        target = history if history is not None else rng.randint(0, DEFAULT_MAX_HISTORY)
+        completed, active = _quest_history(rng, quest_list, character_level, target, rng.randint(0, 3))
+        size = (inventory_size if inventory_size is not None
+                else rng.randint(0, inventory_system.MAX_INVENTORY_SIZE))
+        
+        yield character_manager.Character.from_dict({
+            'name': f"{rng.choice(CHARACTER_NAMES)}{number}",
+            'class': character_class,
+            'level': character_level,
+            'health': rng.randint(max_health // 2, max_health),
+            'max_health': max_health,
+            'strength': strength,
+            'magic': magic,
+            'experience': rng.randrange(curve.xp_for_level(character_level)),
+            'gold': rng.randint(0, 100 * character_level),
+            'inventory': _favourite_inventory(rng, item_ids, size),
+            'active_quests': active,
+            'completed_quests': completed,
+            'quest_xp_earned': sum(rewards[quest_id][0] for quest_id in completed),
+            'quest_gold_earned': sum(rewards[quest_id][1] for quest_id in completed),
+        })
+
+
+def write_save_files(directory, characters):
+    """
+    Save characters with character_manager.save_character
+    
+    Returns: List of character names
+    """
+    names = []
+    for character in characters:
+        character_manager.save_character(character, directory)
+        names.append(character['name'])
+    return names
+
+# ============================================================================
+# FULL DATA SETS
+# ============================================================================
+
+def generate_content(output_dir, item_count, quest_count, character_count, seed=0):
+    """
+    Write items.txt, quests.txt and save_games/ into output_dir
+    
+    Characters are built from the generated quests and items, so their
+    histories and inventories refer to real content.
+    
+    Returns: Dictionary with the paths written and the counts
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    items_file = os.path.join(output_dir, "items.txt")
+    quests_file = os.path.join(output_dir, "quests.txt")
+    save_directory = os.path.join(output_dir, "save_games")
+    
+    item_ids = write_items(items_file, generate_items(item_count, seed))
+    quests = list(generate_quests(quest_count, seed))
+    write_quests(quests_file, quests)
+    os.makedirs(save_directory, exist_ok=True)
+    names = write_save_files(save_directory,
+                             generate_characters(character_count, quests, item_ids, seed))
+    
+    return {
+        'items_file': items_file,
+        'quests_file': quests_file,
+        'save_directory': save_directory,
+        'items': len(item_ids),
+        'quests': len(quests),
+        'characters': len(names),
+    }
+
+# ============================================================================
+# MAIN EXECUTION
+# ============================================================================
+
+def main(argv=None):
+    """Generate a content set from the command line"""
+    parser = argparse.ArgumentParser(description="Generate Quest Chronicles content")
+    parser.add_argument("--items", type=int, default=1000, help="number of items")
+    parser.add_argument("--quests", type=int, default=1000, help="number of quests")
+    parser.add_argument("--characters", type=int, default=100, help="number of save files")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--output-dir", default="generated", help="where to write the files")
+    parser.add_argument("--check", action="store_true",
+                        help="load the written files back with game_data and character_manager")
+    args = parser.parse_args(argv)
+    
+    summary = generate_content(args.output_dir, args.items, args.quests, args.characters, args.seed)
+    print(f"Wrote {summary['items']} items, {summary['quests']} quests and "
+          f"{summary['characters']} characters to {args.output_dir}")
+    
+    if args.check:
+        game_data.load_items(summary['items_file'])
+        quests = game_data.load_quests(summary['quests_file'])
+        quest_handler.validate_quest_prerequisites(quests)
+        for name in character_manager.list_saved_characters(summary['save_directory']):
+            character_manager.load_character(name, summary['save_directory'])
+        print("✓ All generated files load cleanly")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -67,6 +67,10 @@ class InsufficientLevelError(CharacterError):
     """Raised when character level is too low for an action"""
     pass
 
+class InvalidCharacterNameError(CharacterError):
+    """Raised when a character name can't be used for a save file"""
+    pass
+
 # Combat Exceptions
 class InvalidTargetError(CombatError):
     """Raised when trying to target an invalid enemy"""
@@ -0,0 +1,562 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Economy Analytics Module
+
+Name: Charlestone Mayenga
+
+AI Usage: [Document any AI assistance used]
+
+This module loads every saved character into columnar NumPy arrays so
+economy questions ("who owns a steel_sword?", "total gold by class")
+and quest targeting ("who can accept dragon_slayer right now?") are
+answered with vectorized operations instead of per-character loops.
+
+NumPy is optional for the rest of the game; only this module needs it.
+"""
+
+import os
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+import game_data
+import character_manager
+from custom_exceptions import (
+    SaveFileCorruptedError,
+    InvalidSaveDataError
+)
+
+# Numeric columns of the stats matrix, in order
+STAT_COLUMNS = ('level', 'health', 'max_health', 'strength', 'magic', 'experience', 'gold')
+
+# ============================================================================
+# POPULATION
+# ============================================================================
+
+class Population:
+    """
+    Columnar view of many characters
+    
+    Attributes:
+        names: List of character names (row order)
+        class_names: List of distinct class names
+        class_codes: int array, index into class_names for each row
+        stats: int64 matrix (characters x STAT_COLUMNS)
+        item_ids: List of interned item IDs (catalog order first)
+        item_rows / item_cols / item_counts: Sparse character x item counts
+            stored as coordinate arrays (one entry per owned item type)
+        quest_ids: List of interned quest IDs (catalog order first); a
+            quest's position is its bit number in the quest bitsets
+        completed_bits / active_bits: uint8 matrices (characters x bytes)
+            of packed quest bits, little-endian within each byte
+    """
+    
+    def __init__(self, names, class_names, class_codes, stats,
+                 item_ids, item_rows, item_cols, item_counts,
+                 quest_ids, completed_bits, active_bits):
+        self.names = names
+        self.class_names = class_names
+        self.class_codes = class_codes
+        self.stats = stats
+        self.item_ids = item_ids
+        self.item_codes = {item_id: code for code, item_id in enumerate(item_ids)}
+        self.item_rows = item_rows
+        self.item_cols = item_cols
+        self.item_counts = item_counts
+        self.quest_ids = quest_ids
+        self.quest_codes = {quest_id: code for code, quest_id in enumerate(quest_ids)}
+        self.completed_bits = completed_bits
+        self.active_bits = active_bits
+    
+    def __len__(self):
+        return len(self.names)
+    
+    def stat(self, stat_name):
+        """Get one column of the stats matrix"""
+        if stat_name not in STAT_COLUMNS:
+            raise KeyError(f"Unknown stat: {stat_name}")
+        return self.stats[:, STAT_COLUMNS.index(stat_name)]
+
+
+def _require_numpy():
+    """Raise a clear error if NumPy isn't installed"""
+    if np is None:
+        raise ImportError("economy_analytics requires NumPy (pip install numpy)")
+
+
+class _PopulationBuilder:
+    """Accumulates characters row by row before converting to arrays"""
+    
+    def __init__(self, item_data_dict, quest_data_dict=None):
+        self.names = []
+        self.class_names = []
+        self.class_lookup = {}
+        self.class_codes = []
+        self.stats = []
+        # Intern catalog items first so codes match catalog order
+        self.item_ids = list(item_data_dict or {})
+        self.item_lookup = {item_id: code for code, item_id in enumerate(self.item_ids)}
+        self.item_rows = []
+        self.item_cols = []
+        self.item_counts = []
+        # Quest ordinals follow catalog order, like items
+        self.quest_ids = list(quest_data_dict or {})
+        self.quest_lookup = {quest_id: code for code, quest_id in enumerate(self.quest_ids)}
+        self.completed_rows = []
+        self.completed_codes = []
+        self.active_rows = []
+        self.active_codes = []
+    
+    def _intern_quest(self, quest_id):
+        code = self.quest_lookup.get(quest_id)
+        if code is None:
+            code = len(self.quest_ids)
+            self.quest_ids.append(quest_id)
+            self.quest_lookup[quest_id] = code
+        return code
+    
+    def _intern_item(self, item_id):
+        code = self.item_lookup.get(item_id)
+        if code is None:
+            code = len(self.item_ids)
+            self.item_ids.append(item_id)
+            self.item_lookup[item_id] = code
+        return code
+    
+    def add(self, name, character_class, stats, inventory,
+            active_quests=(), completed_quests=()):
+        """Add one character's row"""
+        row = len(self.names)
+        self.names.append(name)
+        
+        code = self.class_lookup.get(character_class)
+        if code is None:
+            code = len(self.class_names)
+            self.class_names.append(character_class)
+            self.class_lookup[character_class] = code
+        self.class_codes.append(code)
+        self.stats.append(stats)
+        
+        # Duplicate-heavy inventories become one (item, count) entry each
+        counts = {}
+        for item_id in inventory:
+            counts[item_id] = counts.get(item_id, 0) + 1
+        for item_id, count in counts.items():
+            self.item_rows.append(row)
+            self.item_cols.append(self._intern_item(item_id))
+            self.item_counts.append(count)
+        
+        for quest_id in completed_quests:
+            self.completed_rows.append(row)
+            self.completed_codes.append(self._intern_quest(quest_id))
+        for quest_id in active_quests:
+            self.active_rows.append(row)
+            self.active_codes.append(self._intern_quest(quest_id))
+    
+    def _pack_bits(self, rows, codes):
+        """Set one bit per (row, quest code) pair in a packed uint8 matrix"""
+        width = (len(self.quest_ids) + 7) // 8
+        bits = np.zeros((len(self.names), width), dtype=np.uint8)
+        if rows:
+            codes = np.array(codes, dtype=np.int64)
+            np.bitwise_or.at(
+                bits,
+                (np.array(rows, dtype=np.int64), codes >> 3),
+                (1 << (codes & 7)).astype(np.uint8)
+            )
+        return bits
+    
+    def build(self):
+        """Convert the accumulated rows into a Population"""
+        stats = np.array(self.stats, dtype=np.int64).reshape(len(self.names), len(STAT_COLUMNS))
+        return Population(
+            self.names,
+            self.class_names,
+            np.array(self.class_codes, dtype=np.int32),
+            stats,
+            self.item_ids,
+            np.array(self.item_rows, dtype=np.int64),
+            np.array(self.item_cols, dtype=np.int32),
+            np.array(self.item_counts, dtype=np.int32),
+            self.quest_ids,
+            self._pack_bits(self.completed_rows, self.completed_codes),
+            self._pack_bits(self.active_rows, self.active_codes)
+        )
+
+
+# ============================================================================
+# LOADING
+# ============================================================================
+
+def parse_save_fields(text):
+    """
+    Parse save file text into {KEY: value_string}
+    
+    This is a lighter parser than character_manager.load_character,
+    meant for bulk analytics passes.
+    
+    Raises: InvalidSaveDataError if a line is malformed
+    """
+    fields = {}
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        key, sep, value = line.partition(':')
+        if not sep:
+            raise InvalidSaveDataError(f"Malformed line in save file: {line}")
+        fields[key.strip()] = value.strip()
+    return fields
+
+
+def _split_list(value):
+    """Split a comma-separated save value into a list"""
+    return [entry.strip() for entry in value.split(',') if entry.strip()] if value else []
+
+
+def population_from_characters(characters, item_data_dict=None, quest_data_dict=None):
+    """
+    Build a Population from in-memory character dictionaries
+    
+    Args:
+        characters: Iterable of character dictionaries
+        item_data_dict: Item catalog used to intern item IDs
+        quest_data_dict: Quest catalog used to number quest bits
+    
+    Returns: Population
+    """
+    _require_numpy()
+    
+    builder = _PopulationBuilder(item_data_dict, quest_data_dict)
+    for character in characters:
+        builder.add(
+            character['name'],
+            character['class'],
+            [character[stat] for stat in STAT_COLUMNS],
+            character.get('inventory', []),
+            character.get('active_quests', []),
+            character.get('completed_quests', [])
+        )
+    return builder.build()
+
+
+def load_population(save_directory="data/save_games", item_data_dict=None,
+                    quest_data_dict=None):
+    """
+    Load every saved character into a Population
+    
+    Args:
+        save_directory: Directory containing *_save.txt files
+        item_data_dict: Item catalog used to intern item IDs
+        quest_data_dict: Quest catalog used to number quest bits
+    
+    Returns: Population
+    Raises:
+        SaveFileCorruptedError if a save file can't be read
+        InvalidSaveDataError if a save file has bad data
+    """
+    _require_numpy()
+    
+    builder = _PopulationBuilder(item_data_dict, quest_data_dict)
+    if not os.path.exists(save_directory):
+        return builder.build()
+    
+    for entry in os.scandir(save_directory):
+        if not entry.name.endswith("_save.txt"):
+            continue
+        
+        try:
+            with open(entry.path, 'r') as file:
+                text = file.read()
+        except Exception as e:
+            raise SaveFileCorruptedError(f"Could not read save file '{entry.name}': {e}")
+        
+        fields = parse_save_fields(text)
+        try:
+            stats = [int(fields[stat.upper()]) for stat in STAT_COLUMNS]
+            builder.add(
+                fields['NAME'],
+                fields['CLASS'],
+                stats,
+                _split_list(fields.get('INVENTORY', '')),
+                _split_list(fields.get('ACTIVE_QUESTS', '')),
+                _split_list(fields.get('COMPLETED_QUESTS', ''))
+            )
+        except (KeyError, ValueError) as e:
+            raise InvalidSaveDataError(f"Invalid save data in '{entry.name}': {e}")
+    
+    return builder.build()
+
+
+# ============================================================================
+# AGGREGATE QUERIES
+# ============================================================================
+
+def count_owners(population, item_id):
+    """
+    Count how many characters own at least one of an item
+    
+    Returns: Integer count
+    """
+    code = population.item_codes.get(item_id)
+    if code is None:
+        return 0
+    return int(np.count_nonzero(population.item_cols == code))
+
+
+def owners_by_item(population):
+    """
+    Count owners of every item in one pass
+    
+    Returns: Dictionary {item_id: number_of_owners}
+    """
+    owners = np.bincount(population.item_cols, minlength=len(population.item_ids))
+    return {item_id: int(owners[code]) for code, item_id in enumerate(population.item_ids)}
+
+
+def total_units_by_item(population):
+    """
+    Count total units held of every item across the population
+    
+    Returns: Dictionary {item_id: total_units}
+    """
+    units = np.bincount(
+        population.item_cols, weights=population.item_counts, minlength=len(population.item_ids)
+    )
+    return {item_id: int(units[code]) for code, item_id in enumerate(population.item_ids)}
+
+
+def item_counts_for(population, item_id):
+    """
+    Get how many of an item each character holds
+    
+    Returns: int array with one entry per character
+    """
+    counts = np.zeros(len(population), dtype=np.int32)
+    code = population.item_codes.get(item_id)
+    if code is not None:
+        mask = population.item_cols == code
+        counts[population.item_rows[mask]] = population.item_counts[mask]
+    return counts
+
+
+def total_by_class(population, stat_name='gold'):
+    """
+    Sum a stat for each character class
+    
+    Example: total_by_class(population, 'gold') → {'Warrior': 1200, 'Mage': 800}
+    
+    Returns: Dictionary {class_name: total}
+    """
+    totals = np.bincount(
+        population.class_codes,
+        weights=population.stat(stat_name),
+        minlength=len(population.class_names)
+    )
+    return {name: int(totals[code]) for code, name in enumerate(population.class_names)}
+
+
+def count_by_class(population):
+    """
+    Count characters in each class
+    
+    Returns: Dictionary {class_name: count}
+    """
+    counts = np.bincount(population.class_codes, minlength=len(population.class_names))
+    return {name: int(counts[code]) for code, name in enumerate(population.class_names)}
+
+
+def stat_summary(population, stat_name):
+    """
+    Summarize a stat across the population
+    
+    Returns: Dictionary with 'min', 'max', 'mean' and 'total'
+    """
+    column = population.stat(stat_name)
+    if len(column) == 0:
+        return {'min': 0, 'max': 0, 'mean': 0.0, 'total': 0}
+    return {
+        'min': int(column.min()),
+        'max': int(column.max()),
+        'mean': float(column.mean()),
+        'total': int(column.sum())
+    }
+
+
+# ============================================================================
+# EXPERIENCE GRANTS
+# ============================================================================
+
+def levels_gained(curve, levels, experience):
+    """
+    Vectorized ProgressionCurve.levels_gained for one class
+    
+    Looks every character up in the curve's cumulative XP table with one
+    searchsorted; characters whose new level runs past the table fall
+    back to the curve's closed form.
+    
+    Args:
+        curve: game_data.ProgressionCurve for the class
+        levels: int array of current levels
+        experience: int array of experience after the grant
+    
+    Returns: Tuple (levels_gained, xp_spent) of int64 arrays
+    """
+    levels = np.asarray(levels, dtype=np.int64)
+    experience = np.asarray(experience, dtype=np.int64)
+    cumulative = np.asarray(curve.cumulative_xp, dtype=np.int64)
+    last = len(cumulative) - 1
+    
+    in_table = (levels >= 1) & (levels < last)
+    start = cumulative[np.where(in_table, levels, 0)]
+    target = np.searchsorted(cumulative, start + np.maximum(experience, 0), side='right') - 1
+    target = np.maximum(target, levels)
+    in_table &= target < last
+    
+    gained = np.where(in_table, target - levels, 0)
+    spent = np.where(in_table, cumulative[np.minimum(target, last)] - start, 0)
+    
+    for row in np.flatnonzero(~in_table):
+        gained[row], spent[row] = curve.levels_gained(int(levels[row]), int(experience[row]))
+    return gained, spent
+
+
+def grant_experience(population, xp_amount):
+    """
+    Give experience to every character and apply level ups in place
+    
+    Same rules as character_manager.gain_experience, using each class's
+    progression curve (or the default rules for classes without one), for
+    the whole population at once. Dead characters (health 0) are skipped.
+    
+    Args:
+        population: Population to update
+        xp_amount: XP for everyone, or an array with one amount per character
+    
+    Returns: int array of levels gained per character
+    """
+    alive = population.stat('health') > 0
+    experience = population.stat('experience')
+    experience += np.where(alive, xp_amount, 0)
+    
+    gained = np.zeros(len(population), dtype=np.int64)
+    health_gain = np.zeros(len(population), dtype=np.int64)
+    strength_gain = np.zeros(len(population), dtype=np.int64)
+    magic_gain = np.zeros(len(population), dtype=np.int64)
+    
+    for code, class_name in enumerate(population.class_names):
+        rows = np.flatnonzero(population.class_codes == code)
+        curve = character_manager.get_level_up_curve(class_name)
+        class_gained, spent = levels_gained(curve, population.stat('level')[rows], experience[rows])
+        experience[rows] -= spent
+        gained[rows] = class_gained
+        health_gain[rows] = curve.health_per_level * class_gained
+        strength_gain[rows] = curve.strength_per_level * class_gained
+        magic_gain[rows] = curve.magic_per_level * class_gained
+    
+    population.stat('level')[:] += gained
+    population.stat('max_health')[:] += health_gain
+    population.stat('strength')[:] += strength_gain
+    population.stat('magic')[:] += magic_gain
+    
+    # Level ups restore health to max
+    health = population.stat('health')
+    health[:] = np.where(gained > 0, population.stat('max_health'), health)
+    return gained
+
+
+# ============================================================================
+# QUEST TARGETING
+# ============================================================================
+
+def _quest_bit(bits, code):
+    """Get one quest's bit for every character as a boolean array"""
+    return ((bits[:, code >> 3] >> (code & 7)) & 1).astype(bool)
+
+
+def has_completed(population, quest_id):
+    """
+    Check which characters have completed a quest
+    
+    Returns: bool array with one entry per character
+    """
+    code = population.quest_codes.get(quest_id)
+    if code is None:
+        return np.zeros(len(population), dtype=bool)
+    return _quest_bit(population.completed_bits, code)
+
+
+def has_active(population, quest_id):
+    """
+    Check which characters have a quest active
+    
+    Returns: bool array with one entry per character
+    """
+    code = population.quest_codes.get(quest_id)
+    if code is None:
+        return np.zeros(len(population), dtype=bool)
+    return _quest_bit(population.active_bits, code)
+
+
+def can_accept_mask(population, quest_id, quest_data_dict):
+    """
+    Check which characters could accept a quest right now
+    
+    Same rules as quest_handler.can_accept_quest (level, prerequisite
+    groups, required item and gold, not completed, not active), evaluated
+    as one mask over the whole population.
+    
+    Returns: bool array with one entry per character
+    """
+    if quest_id not in quest_data_dict:
+        return np.zeros(len(population), dtype=bool)
+    
+    requirement = game_data.get_quest_index(quest_data_dict).requirements[quest_id]
+    mask = population.stat('level') >= requirement.level
+    mask &= ~has_completed(population, quest_id)
+    mask &= ~has_active(population, quest_id)
+    
+    # Every group needs at least one completed quest
+    for group in requirement.groups:
+        group_mask = np.zeros(len(population), dtype=bool)
+        for prerequisite in group:
+            group_mask |= has_completed(population, prerequisite)
+        mask &= group_mask
+    
+    if requirement.item is not None:
+        mask &= item_counts_for(population, requirement.item) > 0
+    if requirement.gold:
+        mask &= population.stat('gold') >= requirement.gold
+    return mask
+
+
+def characters_who_can_accept(population, quest_id, quest_data_dict):
+    """
+    Get the names of characters who could accept a quest right now
+    
+    Returns: List of character names
+    """
+    mask = can_accept_mask(population, quest_id, quest_data_dict)
+    return [population.names[row] for row in np.flatnonzero(mask)]
+
+
+# ============================================================================
+# TESTING
+# ============================================================================
+
+if __name__ == "__main__":
+    print("=== ECONOMY ANALYTICS TEST ===\n")
+    
+    try:
+        population = load_population()
+        print(f"✓ Loaded {len(population)} characters")
+        print(f"  Gold by class: {total_by_class(population, 'gold')}")
+        print(f"  Characters by class: {count_by_class(population)}")
+        print(f"  Level summary: {stat_summary(population, 'level')}\n")
+    except ImportError as e:
+        print(f"✗ {e}\n")
+    except (SaveFileCorruptedError, InvalidSaveDataError) as e:
+        print(f"✗ Could not load saves: {e}\n")
+    
+    print("=== ECONOMY ANALYTICS TESTS COMPLETE ===")
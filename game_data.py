@@ -10,12 +10,43 @@ This module handles loading and validating game data from text files.
 """
 
 import os
+import math
+import bisect
+import random
+import threading
+from collections import namedtuple
 from custom_exceptions import (
     InvalidDataFormatError,
     MissingDataFileError,
-    CorruptedDataError
+    CorruptedDataError,
+    InsufficientLevelError,
+    QuestRequirementsNotMetError
 )
 
+# One quest objective: kind ('kill', 'buy' or 'level'), the enemy types or
+# item IDs/types that count toward it, and the target count or level
+QuestObjective = namedtuple('QuestObjective', ['kind', 'subjects', 'target'])
+
+# Objective kinds and whether they name a subject (kill:goblin:3 vs level:10)
+OBJECTIVE_KINDS = {'kill': True, 'buy': True, 'level': False}
+
+# Levels covered by each class's precomputed progression tables
+PROGRESSION_TABLE_LEVELS = 100
+
+# Maximum number of catalog indexes kept in the cache at once
+MAX_CACHED_INDEXES = 16
+
+# Caches of catalog indexes {id(catalog_dict): index}. Loading a catalog
+# clears its cache, so indexes don't keep replaced catalogs alive.
+_quest_indexes = {}
+_item_indexes = {}
+_enemy_indexes = {}
+_progression_indexes = {}
+
+# Guards the index caches; game server and bot sessions query them from
+# worker threads. Re-entrant because building one index can query another.
+_index_lock = threading.RLock()
+
 # ============================================================================
 # DATA LOADING FUNCTIONS
 # ============================================================================
@@ -32,6 +63,12 @@ def load_quests(filename="data/quests.txt"):
     REWARD_GOLD: 50
     REQUIRED_LEVEL: 1
     PREREQUISITE: previous_quest_id (or NONE)
+    REQUIRED_ITEM: item_id (optional)
+    REQUIRED_GOLD: 100 (optional)
+    OBJECTIVE: kill:goblin:3, buy:weapon|armor:1, level:10 (optional)
+    
+    PREREQUISITE may list several quests: commas mean "all of these" and
+    | means "any one of these", e.g. "first_steps, goblin_hunter|orc_menace"
     
     Returns: Dictionary of quests {quest_id: quest_data_dict}
     Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
@@ -71,6 +108,10 @@ def load_quests(filename="data/quests.txt"):
     except Exception as e:
         raise CorruptedDataError(f"Error parsing quest data: {e}")
     
+    # Drop indexes of earlier loads, then precompute this catalog's index
+    _clear_index_cache(_quest_indexes)
+    get_quest_index(quests)
+    
     return quests
 
 
@@ -124,9 +165,852 @@ def load_items(filename="data/items.txt"):
     except Exception as e:
         raise CorruptedDataError(f"Error parsing item data: {e}")
     
+    # Drop indexes of earlier loads, then build this catalog's indexes
+    _clear_index_cache(_item_indexes)
+    get_item_index(items)
+    
     return items
 
 
+def load_enemies(filename="data/enemies.txt"):
+    """
+    Load enemy data from file
+    
+    Expected format per enemy (separated by blank lines):
+    ENEMY_ID: unique_enemy_name
+    NAME: Enemy Display Name
+    HEALTH: 50
+    STRENGTH: 8
+    MAGIC: 2
+    XP_REWARD: 25
+    GOLD_REWARD: 10
+    MIN_LEVEL: 1
+    MAX_LEVEL: 2 (or NONE for no upper limit)
+    SPAWN_WEIGHT: 10
+    
+    Returns: Dictionary of enemies {enemy_id: enemy_data_dict}
+    Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
+    """
+    # Check if file exists
+    if not os.path.exists(filename):
+        raise MissingDataFileError(f"Enemy file not found: {filename}")
+    
+    # Try to read the file
+    try:
+        with open(filename, 'r') as file:
+            content = file.read()
+    except Exception as e:
+        raise CorruptedDataError(f"Could not read enemy file: {e}")
+    
+    # Parse enemies (separated by blank lines)
+    enemies = {}
+    enemy_blocks = content.strip().split('\n\n')
+    
+    try:
+        for block in enemy_blocks:
+            if not block.strip():
+                continue
+            
+            # Parse this enemy block
+            lines = block.strip().split('\n')
+            enemy = parse_enemy_block(lines)
+            
+            # Validate the enemy
+            validate_enemy_data(enemy)
+            
+            # Store by enemy_id
+            enemies[enemy['enemy_id']] = enemy
+    
+    except InvalidDataFormatError:
+        raise
+    except Exception as e:
+        raise CorruptedDataError(f"Error parsing enemy data: {e}")
+    
+    # Drop indexes of earlier loads, then precompute the spawn tables
+    _clear_index_cache(_enemy_indexes)
+    get_enemy_index(enemies)
+    
+    return enemies
+
+
+def load_progression(filename="data/progression.txt"):
+    """
+    Load class progression curves from file
+    
+    Expected format per class (separated by blank lines):
+    CLASS: Warrior
+    BASE_HEALTH: 120
+    BASE_STRENGTH: 15
+    BASE_MAGIC: 5
+    HEALTH_PER_LEVEL: 10
+    STRENGTH_PER_LEVEL: 2
+    MAGIC_PER_LEVEL: 2
+    XP_FIRST_LEVEL: 100
+    XP_INCREASE: 100
+    
+    Going from level L to L+1 costs XP_FIRST_LEVEL + XP_INCREASE * (L-1).
+    
+    Returns: Dictionary of classes {class_name: progression_dict}
+    Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
+    """
+    # Check if file exists
+    if not os.path.exists(filename):
+        raise MissingDataFileError(f"Progression file not found: {filename}")
+    
+    # Try to read the file
+    try:
+        with open(filename, 'r') as file:
+            content = file.read()
+    except Exception as e:
+        raise CorruptedDataError(f"Could not read progression file: {e}")
+    
+    # Parse classes (separated by blank lines)
+    progression = {}
+    class_blocks = content.strip().split('\n\n')
+    
+    try:
+        for block in class_blocks:
+            if not block.strip():
+                continue
+            
+            # Parse this class block
+            lines = block.strip().split('\n')
+            curve = parse_progression_block(lines)
+            
+            # Validate the class
+            validate_progression_data(curve)
+            
+            # Store by class name
+            progression[curve['class']] = curve
+    
+    except InvalidDataFormatError:
+        raise
+    except Exception as e:
+        raise CorruptedDataError(f"Error parsing progression data: {e}")
+    
+    # Drop indexes of earlier loads, then precompute the level tables
+    _clear_index_cache(_progression_indexes)
+    get_progression_index(progression)
+    
+    return progression
+
+
+# ============================================================================
+# CATALOG INDEXES
+# ============================================================================
+
+class QuestIndex:
+    """
+    Eligibility indexes over a quest catalog
+    
+    Built once per catalog so finding available quests doesn't scan
+    every quest:
+    - requirements: quest ID -> compiled QuestRequirement
+    - objectives: quest ID -> tuple of QuestObjective (empty if none)
+    - unlocks: quest ID -> quests that mention it in their prerequisites
+    - roots: quests with no prerequisite
+    - level_of / ordinal: required level and catalog position of each quest
+    - levels / level_quests: quests sorted by required level, with a
+      parallel list of levels for bisect range queries
+    - graph: QuestGraph of the prerequisites between quests
+    
+    Raises: InvalidDataFormatError if the prerequisites form a cycle
+    """
+    
+    def __init__(self, quest_data_dict):
+        """Build all indexes from {quest_id: quest_data_dict}"""
+        self.quests = quest_data_dict
+        self.size = len(quest_data_dict)
+        self.stale = False
+        
+        self.ordinal = {}
+        self.level_of = {}
+        self.requirements = {}
+        self.objectives = {}
+        self.roots = []
+        self.unlocks = {}
+        prerequisites = {}
+        for ordinal, (quest_id, quest) in enumerate(quest_data_dict.items()):
+            requirement = QuestRequirement(quest)
+            self.ordinal[quest_id] = ordinal
+            self.level_of[quest_id] = requirement.level
+            self.requirements[quest_id] = requirement
+            self.objectives[quest_id] = parse_objectives(quest.get('objective', 'NONE'))
+            prerequisites[quest_id] = requirement.groups
+            
+            if not requirement.quest_ids:
+                self.roots.append(quest_id)
+            for prerequisite in requirement.quest_ids:
+                self.unlocks.setdefault(prerequisite, []).append(quest_id)
+        
+        # Sorted by required level for bisect (stable, so ties keep catalog order)
+        by_level = sorted(quest_data_dict, key=self.level_of.__getitem__)
+        self.levels = [self.level_of[quest_id] for quest_id in by_level]
+        self.level_quests = [quest_data_dict[quest_id] for quest_id in by_level]
+        self.distinct_levels = sorted(set(self.levels))
+        
+        self.graph = QuestGraph(prerequisites)
+    
+    def is_current(self, quest_data_dict):
+        """Check if this index still describes the given catalog"""
+        return not self.stale and self.quests is quest_data_dict and self.size == len(quest_data_dict)
+    
+    def quests_in_level_range(self, min_level, max_level):
+        """
+        Get quests whose required level is within [min_level, max_level]
+        
+        Returns: List of quest dictionaries, lowest level first
+        """
+        start = bisect.bisect_left(self.levels, min_level)
+        stop = bisect.bisect_right(self.levels, max_level)
+        return self.level_quests[start:stop]
+    
+    def levels_in_range(self, low, high):
+        """Get the distinct required levels L with low < L <= high"""
+        start = bisect.bisect_right(self.distinct_levels, low)
+        stop = bisect.bisect_right(self.distinct_levels, high)
+        return self.distinct_levels[start:stop]
+
+
+class QuestRequirement:
+    """
+    A quest's acceptance requirements, compiled once per catalog
+    
+    Attributes:
+        level: Minimum character level
+        groups: Tuple of prerequisite groups; every group must have at
+            least one completed quest (AND of ORs)
+        quest_ids: Every quest mentioned in groups, in order
+        item: Item ID the character must carry, or None
+        gold: Minimum gold, or 0
+    """
+    
+    __slots__ = ('level', 'groups', 'quest_ids', 'item', 'gold')
+    
+    def __init__(self, quest):
+        """Compile the requirements of one quest dictionary"""
+        self.level = quest.get('required_level', 1)
+        self.groups = parse_prerequisite_expression(quest.get('prerequisite', 'NONE'))
+        self.quest_ids = tuple(dict.fromkeys(q for group in self.groups for q in group))
+        item = quest.get('required_item', 'NONE')
+        self.item = None if item == 'NONE' else item
+        self.gold = quest.get('required_gold', 0)
+    
+    def prerequisites_met(self, completed):
+        """Check the prerequisite groups against a collection of completed quest IDs"""
+        for group in self.groups:
+            for quest_id in group:
+                if quest_id in completed:
+                    break
+            else:
+                return False
+        return True
+    
+    def resources_met(self, character):
+        """Check the required item and gold"""
+        if self.gold and character.get('gold', 0) < self.gold:
+            return False
+        if self.item is not None and self.item not in character.get('inventory', ()):
+            return False
+        return True
+    
+    def is_met(self, character):
+        """Check every requirement; returns True or False"""
+        return (character['level'] >= self.level
+                and self.prerequisites_met(character.get('completed_quests') or ())
+                and self.resources_met(character))
+    
+    def check(self, character):
+        """
+        Check every requirement, raising on the first one that fails
+        
+        Raises:
+            InsufficientLevelError if the character's level is too low
+            QuestRequirementsNotMetError if a prerequisite, item or gold
+                requirement isn't met
+        """
+        if character['level'] < self.level:
+            raise InsufficientLevelError(
+                f"Character level {character['level']} below required {self.level}"
+            )
+        
+        completed = character.get('completed_quests') or ()
+        for group in self.groups:
+            if not any(quest_id in completed for quest_id in group):
+                if len(group) == 1:
+                    raise QuestRequirementsNotMetError(f"Must complete '{group[0]}' first")
+                options = ", ".join(f"'{quest_id}'" for quest_id in group)
+                raise QuestRequirementsNotMetError(f"Must complete one of {options} first")
+        
+        if self.item is not None and self.item not in character.get('inventory', ()):
+            raise QuestRequirementsNotMetError(f"Requires item '{self.item}'")
+        
+        if self.gold and character.get('gold', 0) < self.gold:
+            raise QuestRequirementsNotMetError(f"Requires at least {self.gold} gold")
+
+
+class QuestGraph:
+    """
+    Prerequisite graph of a quest catalog
+    
+    A quest needs every one of its prerequisite groups, and a group is
+    met by any one of its quests (AND of ORs). The constructor works out
+    the order quests become reachable (ties in catalog order) and
+    rejects quests that can only be reached through each other. For each
+    OR group, the quest that met it first becomes the path prerequisite,
+    so ancestors and chain describe one valid way to unlock a quest.
+    Ancestor and descendant sets are computed the first time they're
+    asked for and then memoized.
+    
+    Prerequisites that aren't in the catalog are ignored here; use
+    quest_handler.validate_quest_prerequisites to report them.
+    """
+    
+    def __init__(self, prerequisite_groups):
+        """
+        Build the graph from {quest_id: tuple_of_prerequisite_groups}
+        
+        Raises: InvalidDataFormatError if the prerequisites form a cycle
+        """
+        self.groups = {}
+        for quest_id, groups in prerequisite_groups.items():
+            known = (tuple(p for p in group if p in prerequisite_groups) for group in groups)
+            self.groups[quest_id] = tuple(group for group in known if group)
+        self.dependents = {quest_id: [] for quest_id in prerequisite_groups}
+        for quest_id, groups in self.groups.items():
+            for prerequisite in dict.fromkeys(p for group in groups for p in group):
+                self.dependents[prerequisite].append(quest_id)
+        
+        # Path prerequisites {quest_id: quests that met its groups}
+        self.prerequisites = {}
+        self.order = self._topological_order()
+        self.position = {quest_id: pos for pos, quest_id in enumerate(self.order)}
+        self._ancestors = {}
+        self._descendants = {}
+        self._chains = {}
+    
+    def _topological_order(self):
+        """
+        Kahn's algorithm over prerequisite groups; a group is met by the
+        first of its quests to be reached
+        
+        Raises InvalidDataFormatError if some quests are never reached.
+        """
+        waiting = {quest_id: len(groups) for quest_id, groups in self.groups.items()}
+        met_by = {quest_id: [None] * len(groups) for quest_id, groups in self.groups.items()}
+        ready = [quest_id for quest_id, count in waiting.items() if count == 0]
+        ready.reverse()
+        
+        order = []
+        while ready:
+            quest_id = ready.pop()
+            order.append(quest_id)
+            self.prerequisites[quest_id] = tuple(dict.fromkeys(met_by[quest_id]))
+            unlocked = []
+            for dependent in self.dependents[quest_id]:
+                if waiting[dependent] == 0:
+                    continue
+                picks = met_by[dependent]
+                for position, group in enumerate(self.groups[dependent]):
+                    if picks[position] is None and quest_id in group:
+                        picks[position] = quest_id
+                        waiting[dependent] -= 1
+                if waiting[dependent] == 0:
+                    unlocked.append(dependent)
+            ready.extend(reversed(unlocked))
+        
+        if len(order) < len(self.groups):
+            raise InvalidDataFormatError(
+                "Quest prerequisites form a cycle: " + " -> ".join(self._find_cycle(met_by))
+            )
+        return order
+    
+    def _find_cycle(self, met_by):
+        """
+        Walk unmet groups from a quest that was never reached until one repeats
+        
+        Every quest in an unmet group was never reached either, so the
+        walk stays among them.
+        """
+        start = next(quest_id for quest_id in self.groups if quest_id not in self.prerequisites)
+        seen = {}
+        path = []
+        quest_id = start
+        while quest_id not in seen:
+            seen[quest_id] = len(path)
+            path.append(quest_id)
+            unmet = next(group for group, pick in zip(self.groups[quest_id], met_by[quest_id])
+                         if pick is None)
+            quest_id = unmet[0]
+        return path[seen[quest_id]:] + [quest_id]
+    
+    def _closure(self, quest_id, edges, memo):
+        """Every quest reachable from quest_id along edges (memoized)"""
+        reached = memo.get(quest_id)
+        if reached is None:
+            found = set()
+            stack = list(edges[quest_id])
+            while stack:
+                other = stack.pop()
+                if other in found:
+                    continue
+                known = memo.get(other)
+                if known is not None:
+                    found.add(other)
+                    found.update(known)
+                else:
+                    found.add(other)
+                    stack.extend(edges[other])
+            reached = memo[quest_id] = frozenset(found)
+        return reached
+    
+    def ancestors(self, quest_id):
+        """Get every quest on quest_id's unlock path (one alternative per OR group)"""
+        return self._closure(quest_id, self.prerequisites, self._ancestors)
+    
+    def descendants(self, quest_id):
+        """Get every quest that completing quest_id helps unlock"""
+        return self._closure(quest_id, self.dependents, self._descendants)
+    
+    def chain(self, quest_id):
+        """
+        Get quest_id and the prerequisites on its unlock path, earliest first
+        
+        Returns: Tuple of quest IDs in topological order
+        """
+        chain = self._chains.get(quest_id)
+        if chain is None:
+            earlier = sorted(self.ancestors(quest_id), key=self.position.__getitem__)
+            chain = self._chains[quest_id] = tuple(earlier) + (quest_id,)
+        return chain
+
+
+def get_quest_index(quest_data_dict):
+    """
+    Get the index for a quest catalog, building it if needed
+    
+    After editing a quest in place, call invalidate_indexes(catalog).
+    
+    Returns: QuestIndex
+    Raises: InvalidDataFormatError if the prerequisites form a cycle
+    """
+    return _cached_index(_quest_indexes, quest_data_dict, QuestIndex)
+
+
+class ItemIndex:
+    """
+    Secondary indexes over an item catalog
+    
+    Built once per catalog so shop queries don't scan every item:
+    - by type: item IDs sorted by cost, with a parallel cost list for bisect
+    - by name: lowercase names sorted for prefix lookups
+    """
+    
+    def __init__(self, item_data_dict):
+        """Build all indexes from {item_id: item_data_dict}"""
+        self.items = item_data_dict
+        self.size = len(item_data_dict)
+        self.stale = False
+        
+        # Group (cost, item_id) pairs by type; None holds every item
+        groups = {None: []}
+        for item_id, item in item_data_dict.items():
+            entry = (item.get('cost', 0), item_id)
+            groups[None].append(entry)
+            groups.setdefault(item.get('type'), []).append(entry)
+        
+        # Parallel sorted lists: costs for bisect, IDs for slicing
+        self.costs = {}
+        self.ids = {}
+        for item_type, entries in groups.items():
+            entries.sort()
+            self.costs[item_type] = [cost for cost, _ in entries]
+            self.ids[item_type] = [item_id for _, item_id in entries]
+        
+        # Sorted lowercase names for prefix search
+        names = sorted(
+            (item.get('name', item_id).lower(), item_id)
+            for item_id, item in item_data_dict.items()
+        )
+        self.names = [name for name, _ in names]
+        self.name_ids = [item_id for _, item_id in names]
+    
+    def is_current(self, item_data_dict):
+        """Check if this index still describes the given catalog"""
+        return not self.stale and self.items is item_data_dict and self.size == len(item_data_dict)
+    
+    def _cost_range(self, item_type, min_cost, max_cost):
+        """Return (ids, start, stop) for items of a type within a cost range"""
+        costs = self.costs.get(item_type)
+        if costs is None:
+            return [], 0, 0
+        
+        start = 0 if min_cost is None else bisect.bisect_left(costs, min_cost)
+        stop = len(costs) if max_cost is None else bisect.bisect_right(costs, max_cost)
+        return self.ids[item_type], start, max(start, stop)
+    
+    def _prefix_matches(self, name_prefix, item_type, min_cost, max_cost):
+        """Return item IDs whose name starts with name_prefix, filtered"""
+        prefix = name_prefix.lower()
+        start = bisect.bisect_left(self.names, prefix)
+        stop = bisect.bisect_left(self.names, prefix + '\uffff')
+        
+        matches = []
+        for item_id in self.name_ids[start:stop]:
+            item = self.items[item_id]
+            cost = item.get('cost', 0)
+            if item_type is not None and item.get('type') != item_type:
+                continue
+            if min_cost is not None and cost < min_cost:
+                continue
+            if max_cost is not None and cost > max_cost:
+                continue
+            matches.append(item_id)
+        return matches
+    
+    def query(self, item_type=None, min_cost=None, max_cost=None,
+              name_prefix=None, offset=0, limit=None):
+        """
+        Find items matching all given filters
+        
+        Results are ordered by cost (or by name when name_prefix is given).
+        
+        Returns: List of item dictionaries
+        """
+        if name_prefix:
+            ids = self._prefix_matches(name_prefix, item_type, min_cost, max_cost)
+            start, stop = 0, len(ids)
+        else:
+            ids, start, stop = self._cost_range(item_type, min_cost, max_cost)
+        
+        start += offset
+        if limit is not None:
+            stop = min(stop, start + limit)
+        return [self.items[item_id] for item_id in ids[start:stop]]
+    
+    def count(self, item_type=None, min_cost=None, max_cost=None, name_prefix=None):
+        """Count items matching all given filters"""
+        if name_prefix:
+            return len(self._prefix_matches(name_prefix, item_type, min_cost, max_cost))
+        _, start, stop = self._cost_range(item_type, min_cost, max_cost)
+        return stop - start
+
+
+def _cached_index(cache, catalog, build):
+    """
+    Get a catalog's index from a cache, building it with build(catalog)
+    and storing it (evicting the oldest entry if full) if needed
+    """
+    with _index_lock:
+        index = cache.get(id(catalog))
+        if index is None or not index.is_current(catalog):
+            index = build(catalog)
+            if len(cache) >= MAX_CACHED_INDEXES:
+                cache.pop(next(iter(cache)), None)
+            cache[id(catalog)] = index
+        return index
+
+
+def _clear_index_cache(cache):
+    """Drop every index in one cache"""
+    with _index_lock:
+        cache.clear()
+
+
+def invalidate_indexes(catalog):
+    """
+    Drop every cached index built over a catalog
+    
+    Indexes notice entries being added or removed, but not edits inside
+    an entry. Call this after changing an item's cost, type or name, or
+    a quest's level, prerequisite or objective, in place; the next query
+    rebuilds the index, along with any quest frontiers and trackers
+    built on the old one.
+    """
+    with _index_lock:
+        for cache in (_quest_indexes, _item_indexes, _enemy_indexes, _progression_indexes):
+            index = cache.pop(id(catalog), None)
+            if index is not None:
+                index.stale = True
+
+
+def get_item_index(item_data_dict):
+    """
+    Get the index for an item catalog, building it if needed
+    
+    Returns: ItemIndex
+    """
+    return _cached_index(_item_indexes, item_data_dict, ItemIndex)
+
+
+def items_by(item_data_dict, item_type=None, min_cost=None, max_cost=None,
+             name_prefix=None, offset=0, limit=None):
+    """
+    Query an item catalog through its indexes
+    
+    Args:
+        item_data_dict: Dictionary of all item data
+        item_type: Only items of this type (weapon, armor, consumable)
+        min_cost / max_cost: Inclusive cost bounds
+        name_prefix: Only items whose display name starts with this text
+        offset / limit: Page through the results
+    
+    Example: items_by(items, item_type='weapon', max_cost=200, limit=10)
+    
+    After editing an item in place, call invalidate_indexes(catalog).
+    
+    Returns: List of item dictionaries, cheapest first
+    """
+    index = get_item_index(item_data_dict)
+    return index.query(item_type, min_cost, max_cost, name_prefix, offset, limit)
+
+
+def count_items_by(item_data_dict, item_type=None, min_cost=None, max_cost=None,
+                   name_prefix=None):
+    """
+    Count items matching the same filters as items_by()
+    
+    Returns: Integer count
+    """
+    index = get_item_index(item_data_dict)
+    return index.count(item_type, min_cost, max_cost, name_prefix)
+
+
+class SpawnTable:
+    """
+    Weighted random choice using the alias method
+    
+    Building the table is O(n); every draw is O(1): pick a column
+    uniformly, then take it or its alias with one random number.
+    """
+    
+    __slots__ = ('enemy_ids', 'probability', 'alias')
+    
+    def __init__(self, weighted_ids):
+        """Build from a list of (enemy_id, weight) pairs"""
+        self.enemy_ids = [enemy_id for enemy_id, _ in weighted_ids]
+        count = len(weighted_ids)
+        total = sum(weight for _, weight in weighted_ids)
+        
+        # Scale weights so the average column holds exactly 1.0
+        scaled = [weight * count / total for _, weight in weighted_ids]
+        self.probability = [1.0] * count
+        self.alias = list(range(count))
+        
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        
+        # Pair each under-full column with an over-full one
+        while small and large:
+            low = small.pop()
+            high = large.pop()
+            self.probability[low] = scaled[low]
+            self.alias[low] = high
+            scaled[high] -= 1.0 - scaled[low]
+            if scaled[high] < 1.0:
+                small.append(high)
+            else:
+                large.append(high)
+    
+    def draw(self, rng=random):
+        """Pick one enemy ID according to the weights"""
+        column = rng.randrange(len(self.enemy_ids))
+        if rng.random() < self.probability[column]:
+            return self.enemy_ids[column]
+        return self.enemy_ids[self.alias[column]]
+
+
+class EnemyIndex:
+    """
+    Spawn tables for every character level
+    
+    Levels are split into bands wherever some enemy's level range starts
+    or ends. Each band gets one SpawnTable, and tables_by_level maps each
+    level straight to its band's table, so finding the table is a list
+    lookup. Levels past the last boundary share the final table.
+    """
+    
+    def __init__(self, enemy_data_dict):
+        """Build spawn tables from {enemy_id: enemy_data_dict}"""
+        self.enemies = enemy_data_dict
+        self.size = len(enemy_data_dict)
+        self.stale = False
+        
+        # Every level where the set of eligible enemies can change
+        boundaries = {1}
+        for enemy in enemy_data_dict.values():
+            boundaries.add(max(1, enemy['min_level']))
+            if enemy['max_level'] is not None:
+                boundaries.add(enemy['max_level'] + 1)
+        boundaries = sorted(boundaries)
+        
+        # One table per band, indexed directly by level
+        self.tables_by_level = [None]
+        for band, start in enumerate(boundaries):
+            table = self._build_table(start)
+            stop = boundaries[band + 1] if band + 1 < len(boundaries) else start + 1
+            self.tables_by_level.extend([table] * (stop - start))
+    
+    def _build_table(self, level):
+        """Build the spawn table for enemies eligible at a level"""
+        weighted = [
+            (enemy_id, enemy['spawn_weight'])
+            for enemy_id, enemy in self.enemies.items()
+            if enemy['min_level'] <= level
+            and (enemy['max_level'] is None or level <= enemy['max_level'])
+            and enemy['spawn_weight'] > 0
+        ]
+        return SpawnTable(weighted) if weighted else None
+    
+    def is_current(self, enemy_data_dict):
+        """Check if this index still describes the given catalog"""
+        return not self.stale and self.enemies is enemy_data_dict and self.size == len(enemy_data_dict)
+    
+    def spawn_table(self, level):
+        """
+        Get the spawn table for a character level
+        
+        Returns: SpawnTable, or None if no enemy spawns at that level
+        """
+        level = max(1, level)
+        if level >= len(self.tables_by_level):
+            return self.tables_by_level[-1]
+        return self.tables_by_level[level]
+
+
+def get_enemy_index(enemy_data_dict):
+    """
+    Get the spawn index for an enemy catalog, building it if needed
+    
+    Returns: EnemyIndex
+    """
+    return _cached_index(_enemy_indexes, enemy_data_dict, EnemyIndex)
+
+
+class ProgressionCurve:
+    """
+    Precomputed level tables for one character class
+    
+    cumulative_xp[L] is the total XP spent getting from level 1 to level
+    L, and max_health_at / strength_at / magic_at hold the class's stats
+    at each level, so level lookups up to the table size are list
+    indexing. Past the table the same arithmetic series is solved in
+    closed form.
+    """
+    
+    def __init__(self, progression, table_levels=PROGRESSION_TABLE_LEVELS):
+        """Build the tables from one class's progression dictionary"""
+        self.character_class = progression['class']
+        self.base_health = progression['base_health']
+        self.base_strength = progression['base_strength']
+        self.base_magic = progression['base_magic']
+        self.health_per_level = progression['health_per_level']
+        self.strength_per_level = progression['strength_per_level']
+        self.magic_per_level = progression['magic_per_level']
+        self.xp_first_level = progression['xp_first_level']
+        self.xp_increase = progression['xp_increase']
+        
+        # Index 0 is unused so every table is indexed by level
+        self.cumulative_xp = [0, 0]
+        for level in range(1, table_levels):
+            self.cumulative_xp.append(self.cumulative_xp[-1] + self.xp_for_level(level))
+        levels_gained = [max(level, 1) - 1 for level in range(table_levels + 1)]
+        self.max_health_at = [self.base_health + self.health_per_level * n for n in levels_gained]
+        self.strength_at = [self.base_strength + self.strength_per_level * n for n in levels_gained]
+        self.magic_at = [self.base_magic + self.magic_per_level * n for n in levels_gained]
+    
+    def xp_for_level(self, level):
+        """XP needed to go from level to level + 1"""
+        return self.xp_first_level + self.xp_increase * (level - 1)
+    
+    def xp_to_advance(self, level, levels=1):
+        """XP needed to go up a number of levels starting from level"""
+        return levels * self.xp_for_level(level) + self.xp_increase * (levels * (levels - 1) // 2)
+    
+    def stats_at(self, level):
+        """
+        Get the class's base stats at a level
+        
+        Returns: Tuple (max_health, strength, magic)
+        """
+        if level < len(self.max_health_at):
+            return self.max_health_at[level], self.strength_at[level], self.magic_at[level]
+        gained = level - 1
+        return (self.base_health + self.health_per_level * gained,
+                self.base_strength + self.strength_per_level * gained,
+                self.base_magic + self.magic_per_level * gained)
+    
+    def levels_gained(self, level, experience):
+        """
+        Work out how many levels a pool of experience buys
+        
+        Returns: Tuple (levels_gained, xp_spent)
+        """
+        if level < 1 or experience < self.xp_for_level(level):
+            return 0, 0
+        
+        # Inside the table the answer is one bisect
+        last = len(self.cumulative_xp) - 1
+        if level < last:
+            target = bisect.bisect_right(
+                self.cumulative_xp, self.cumulative_xp[level] + experience, level
+            ) - 1
+            if target < last:
+                return target - level, self.cumulative_xp[target] - self.cumulative_xp[level]
+        
+        levels = self._solve_levels(level, experience)
+        return levels, self.xp_to_advance(level, levels)
+    
+    def _solve_levels(self, level, experience):
+        """
+        Largest n with xp_to_advance(level, n) <= experience
+        
+        Solves xp_increase*n^2 + (2*cost - xp_increase)*n - 2*experience <= 0
+        where cost is the XP for the current level.
+        """
+        cost = self.xp_for_level(level)
+        step = self.xp_increase
+        if step == 0:
+            return experience // cost
+        
+        b = 2 * cost - step
+        levels = (math.isqrt(b * b + 8 * step * experience) - b) // (2 * step)
+        
+        # The integer root can be one off when b is odd
+        while self.xp_to_advance(level, levels + 1) <= experience:
+            levels += 1
+        while levels > 0 and self.xp_to_advance(level, levels) > experience:
+            levels -= 1
+        return levels
+
+
+class ProgressionIndex:
+    """Progression curves for every class in a progression catalog"""
+    
+    def __init__(self, progression_dict):
+        """Build curves from {class_name: progression_dict}"""
+        self.progression = progression_dict
+        self.size = len(progression_dict)
+        self.stale = False
+        self.curves = {
+            class_name: ProgressionCurve(progression)
+            for class_name, progression in progression_dict.items()
+        }
+    
+    def is_current(self, progression_dict):
+        """Check if this index still describes the given catalog"""
+        return not self.stale and self.progression is progression_dict and self.size == len(progression_dict)
+
+
+def get_progression_index(progression_dict):
+    """
+    Get the progression curves for a catalog, building them if needed
+    
+    Returns: ProgressionIndex
+    """
+    return _cached_index(_progression_indexes, progression_dict, ProgressionIndex)
+
+
 # ============================================================================
 # VALIDATION FUNCTIONS
 # ============================================================================
@@ -137,6 +1021,7 @@ def validate_quest_data(quest_dict):
     
     Required fields: quest_id, title, description, reward_xp, 
                     reward_gold, required_level, prerequisite
+    Optional fields: required_item, required_gold, objective
     
     Returns: True if valid
     Raises: InvalidDataFormatError if missing required fields
@@ -164,6 +1049,17 @@ def validate_quest_data(quest_dict):
                 f"got {type(quest_dict[field]).__name__}"
             )
     
+    # Check optional requirement fields
+    if not isinstance(quest_dict.get('required_item', 'NONE'), str):
+        raise InvalidDataFormatError("Invalid type for field 'required_item': expected str")
+    
+    required_gold = quest_dict.get('required_gold', 0)
+    if not isinstance(required_gold, int) or required_gold < 0:
+        raise InvalidDataFormatError("Field 'required_gold' must be a non-negative integer")
+    
+    if not isinstance(quest_dict.get('objective', 'NONE'), str):
+        raise InvalidDataFormatError("Invalid type for field 'objective': expected str")
+    
     return True
 
 
@@ -223,6 +1119,110 @@ def validate_item_data(item_dict):
     return True
 
 
+def validate_enemy_data(enemy_dict):
+    """
+    Validate that enemy dictionary has all required fields
+    
+    Required fields: enemy_id, name, health, strength, magic, xp_reward,
+                    gold_reward, min_level, max_level, spawn_weight
+    
+    max_level may be None (no upper limit)
+    
+    Returns: True if valid
+    Raises: InvalidDataFormatError if missing fields or invalid values
+    """
+    required_fields = {
+        'enemy_id': str,
+        'name': str,
+        'health': int,
+        'strength': int,
+        'magic': int,
+        'xp_reward': int,
+        'gold_reward': int,
+        'min_level': int,
+        'max_level': (int, type(None)),
+        'spawn_weight': int
+    }
+    
+    # Check each required field
+    for field, field_type in required_fields.items():
+        # Check if field exists
+        if field not in enemy_dict:
+            raise InvalidDataFormatError(f"Missing required field: {field}")
+        
+        # Check field type
+        if not isinstance(enemy_dict[field], field_type):
+            raise InvalidDataFormatError(
+                f"Invalid type for field '{field}' in enemy data: "
+                f"got {type(enemy_dict[field]).__name__}"
+            )
+    
+    # Check values make sense
+    if enemy_dict['health'] <= 0:
+        raise InvalidDataFormatError(f"Enemy '{enemy_dict['enemy_id']}' must have positive health")
+    
+    if enemy_dict['spawn_weight'] < 0:
+        raise InvalidDataFormatError(f"Enemy '{enemy_dict['enemy_id']}' has a negative spawn weight")
+    
+    if enemy_dict['max_level'] is not None and enemy_dict['max_level'] < enemy_dict['min_level']:
+        raise InvalidDataFormatError(
+            f"Enemy '{enemy_dict['enemy_id']}' has MAX_LEVEL below MIN_LEVEL"
+        )
+    
+    return True
+
+
+def validate_progression_data(progression_dict):
+    """
+    Validate that a class progression dictionary has all required fields
+    
+    Required fields: class, base_health, base_strength, base_magic,
+                    health_per_level, strength_per_level, magic_per_level,
+                    xp_first_level, xp_increase
+    
+    Returns: True if valid
+    Raises: InvalidDataFormatError if missing fields or invalid values
+    """
+    required_fields = {
+        'class': str,
+        'base_health': int,
+        'base_strength': int,
+        'base_magic': int,
+        'health_per_level': int,
+        'strength_per_level': int,
+        'magic_per_level': int,
+        'xp_first_level': int,
+        'xp_increase': int
+    }
+    
+    # Check each required field
+    for field, field_type in required_fields.items():
+        # Check if field exists
+        if field not in progression_dict:
+            raise InvalidDataFormatError(f"Missing required field: {field}")
+        
+        # Check field type
+        if not isinstance(progression_dict[field], field_type):
+            raise InvalidDataFormatError(
+                f"Invalid type for field '{field}' in progression data: "
+                f"got {type(progression_dict[field]).__name__}"
+            )
+    
+    # Check values make sense
+    class_name = progression_dict['class']
+    if progression_dict['base_health'] <= 0:
+        raise InvalidDataFormatError(f"Class '{class_name}' must have positive base health")
+    
+    if progression_dict['xp_first_level'] <= 0:
+        raise InvalidDataFormatError(f"Class '{class_name}' must have a positive XP_FIRST_LEVEL")
+    
+    for field in ('health_per_level', 'strength_per_level', 'magic_per_level', 'xp_increase'):
+        if progression_dict[field] < 0:
+            raise InvalidDataFormatError(f"Class '{class_name}' has a negative {field.upper()}")
+    
+    return True
+
+
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
@@ -270,7 +1270,15 @@ def parse_quest_block(lines):
             elif key == 'required_level':
                 quest['required_level'] = int(value)
             elif key == 'prerequisite':
+                parse_prerequisite_expression(value)
                 quest['prerequisite'] = value
+            elif key == 'required_item':
+                quest['required_item'] = value
+            elif key == 'required_gold':
+                quest['required_gold'] = int(value)
+            elif key == 'objective':
+                parse_objectives(value)
+                quest['objective'] = value
             else:
                 raise InvalidDataFormatError(f"Unknown field in quest: {key}")
     
@@ -284,6 +1292,75 @@ def parse_quest_block(lines):
     return quest
 
 
+def parse_prerequisite_expression(text):
+    """
+    Parse a PREREQUISITE value into groups of quest IDs
+    
+    Commas separate groups that must all be met; | separates quests
+    within a group, any one of which is enough.
+    Example: "a, b|c" → (('a',), ('b', 'c'))   (a AND (b OR c))
+    
+    Returns: Tuple of tuples of quest IDs (empty for NONE)
+    Raises: InvalidDataFormatError if a group or quest ID is empty
+    """
+    text = text.strip()
+    if not text or text == 'NONE':
+        return ()
+    
+    groups = []
+    for group_text in text.split(','):
+        group = tuple(quest_id.strip() for quest_id in group_text.split('|'))
+        if not all(group):
+            raise InvalidDataFormatError(f"Empty quest ID in prerequisite: {text}")
+        groups.append(group)
+    return tuple(groups)
+
+
+def parse_objectives(text):
+    """
+    Parse an OBJECTIVE value into quest objectives
+    
+    Objectives are separated by commas:
+    - kill:goblin:3          defeat 3 goblins (goblin|orc counts either)
+    - buy:weapon|armor:1     buy 1 item of that item ID or item type
+    - level:10               reach level 10
+    
+    Returns: Tuple of QuestObjective (empty for NONE)
+    Raises: InvalidDataFormatError if an objective is malformed
+    """
+    text = text.strip()
+    if not text or text == 'NONE':
+        return ()
+    
+    objectives = []
+    for objective_text in text.split(','):
+        parts = [part.strip() for part in objective_text.split(':')]
+        kind = parts[0].lower()
+        if kind not in OBJECTIVE_KINDS:
+            raise InvalidDataFormatError(f"Unknown objective type '{parts[0]}' in: {text}")
+        
+        expected_parts = 3 if OBJECTIVE_KINDS[kind] else 2
+        if len(parts) != expected_parts:
+            raise InvalidDataFormatError(f"Malformed objective '{objective_text.strip()}'")
+        
+        if OBJECTIVE_KINDS[kind]:
+            subjects = tuple(subject.strip().lower() for subject in parts[1].split('|'))
+            if not all(subjects):
+                raise InvalidDataFormatError(f"Empty subject in objective '{objective_text.strip()}'")
+        else:
+            subjects = (None,)
+        
+        try:
+            target = int(parts[-1])
+        except ValueError:
+            raise InvalidDataFormatError(f"Objective target must be a number: {objective_text.strip()}")
+        if target <= 0:
+            raise InvalidDataFormatError(f"Objective target must be positive: {objective_text.strip()}")
+        
+        objectives.append(QuestObjective(kind, subjects, target))
+    return tuple(objectives)
+
+
 def parse_item_block(lines):
     """
     Parse a block of lines into an item dictionary
@@ -341,6 +1418,112 @@ def parse_item_block(lines):
     return item
 
 
+def parse_enemy_block(lines):
+    """
+    Parse a block of lines into an enemy dictionary
+    
+    Args:
+        lines: List of strings representing one enemy
+    
+    Returns: Dictionary with enemy data
+    Raises: InvalidDataFormatError if parsing fails
+    """
+    enemy = {}
+    int_fields = {
+        'health', 'strength', 'magic', 'xp_reward', 'gold_reward',
+        'min_level', 'spawn_weight'
+    }
+    
+    try:
+        for line in lines:
+            line = line.strip()
+            
+            # Skip empty lines
+            if not line:
+                continue
+            
+            # Check for colon separator
+            if ':' not in line:
+                raise InvalidDataFormatError(f"Malformed line in enemy data: {line}")
+            
+            # Split on colon and strip whitespace
+            key, value = line.split(':', 1)
+            key = key.strip().lower()
+            value = value.strip()
+            
+            # Parse different field types
+            if key == 'enemy_id':
+                enemy['enemy_id'] = value.lower()
+            elif key == 'name':
+                enemy['name'] = value
+            elif key in int_fields:
+                enemy[key] = int(value)
+            elif key == 'max_level':
+                enemy['max_level'] = None if value.upper() == 'NONE' else int(value)
+            else:
+                raise InvalidDataFormatError(f"Unknown field in enemy: {key}")
+    
+    except ValueError as e:
+        raise InvalidDataFormatError(f"Could not convert value to correct type: {e}")
+    except InvalidDataFormatError:
+        raise
+    except Exception as e:
+        raise InvalidDataFormatError(f"Error parsing enemy block: {e}")
+    
+    return enemy
+
+
+def parse_progression_block(lines):
+    """
+    Parse a block of lines into a class progression dictionary
+    
+    Args:
+        lines: List of strings representing one class
+    
+    Returns: Dictionary with progression data
+    Raises: InvalidDataFormatError if parsing fails
+    """
+    progression = {}
+    int_fields = {
+        'base_health', 'base_strength', 'base_magic', 'health_per_level',
+        'strength_per_level', 'magic_per_level', 'xp_first_level', 'xp_increase'
+    }
+    
+    try:
+        for line in lines:
+            line = line.strip()
+            
+            # Skip empty lines
+            if not line:
+                continue
+            
+            # Check for colon separator
+            if ':' not in line:
+                raise InvalidDataFormatError(f"Malformed line in progression data: {line}")
+            
+            # Split on colon and strip whitespace
+            key, value = line.split(':', 1)
+            key = key.strip().lower()
+            value = value.strip()
+            
+            # Parse different field types
+            if key == 'class':
+                progression['class'] = value
+            elif key in int_fields:
+                progression[key] = int(value)
+            else:
+                raise InvalidDataFormatError(f"Unknown field in progression: {key}")
+    
+    except ValueError as e:
+        raise InvalidDataFormatError(f"Could not convert value to correct type: {e}")
+    except InvalidDataFormatError:
+        raise
+    except Exception as e:
+        raise InvalidDataFormatError(f"Error parsing progression block: {e}")
+    
+    return progression
+
+
 def create_default_data_files():
     """
     Create default data files if they don't exist
@@ -431,6 +1614,99 @@ DESCRIPTION: Forged from real dragon scales. Extremely protective."""
             print(f"✓ Created default items file: {items_file}")
         except Exception as e:
             print(f"Warning: Could not create default items file: {e}")
+    
+    # Create default enemies file
+    enemies_file = "data/enemies.txt"
+    if not os.path.exists(enemies_file):
+        try:
+            default_enemies = """ENEMY_ID: goblin
+NAME: Goblin
+HEALTH: 50
+STRENGTH: 8
+MAGIC: 2
+XP_REWARD: 25
+GOLD_REWARD: 10
+MIN_LEVEL: 1
+MAX_LEVEL: 2
+SPAWN_WEIGHT: 10
+
+ENEMY_ID: orc
+NAME: Orc
+HEALTH: 80
+STRENGTH: 12
+MAGIC: 5
+XP_REWARD: 50
+GOLD_REWARD: 25
+MIN_LEVEL: 3
+MAX_LEVEL: 5
+SPAWN_WEIGHT: 10
+
+ENEMY_ID: dragon
+NAME: Dragon
+HEALTH: 200
+STRENGTH: 25
+MAGIC: 15
+XP_REWARD: 200
+GOLD_REWARD: 100
+MIN_LEVEL: 6
+MAX_LEVEL: NONE
+SPAWN_WEIGHT: 10"""
+            
+            with open(enemies_file, 'w') as f:
+                f.write(default_enemies)
+            print(f"✓ Created default enemies file: {enemies_file}")
+        except Exception as e:
+            print(f"Warning: Could not create default enemies file: {e}")
+    
+    # Create default progression file
+    progression_file = "data/progression.txt"
+    if not os.path.exists(progression_file):
+        try:
+            default_progression = """CLASS: Warrior
+BASE_HEALTH: 120
+BASE_STRENGTH: 15
+BASE_MAGIC: 5
+HEALTH_PER_LEVEL: 10
+STRENGTH_PER_LEVEL: 2
+MAGIC_PER_LEVEL: 2
+XP_FIRST_LEVEL: 100
+XP_INCREASE: 100
+
+CLASS: Mage
+BASE_HEALTH: 80
+BASE_STRENGTH: 8
+BASE_MAGIC: 20
+HEALTH_PER_LEVEL: 10
+STRENGTH_PER_LEVEL: 2
+MAGIC_PER_LEVEL: 2
+XP_FIRST_LEVEL: 100
+XP_INCREASE: 100
+
+CLASS: Rogue
+BASE_HEALTH: 90
+BASE_STRENGTH: 12
+BASE_MAGIC: 10
+HEALTH_PER_LEVEL: 10
+STRENGTH_PER_LEVEL: 2
+MAGIC_PER_LEVEL: 2
+XP_FIRST_LEVEL: 100
+XP_INCREASE: 100
+
+CLASS: Cleric
+BASE_HEALTH: 100
+BASE_STRENGTH: 10
+BASE_MAGIC: 15
+HEALTH_PER_LEVEL: 10
+STRENGTH_PER_LEVEL: 2
+MAGIC_PER_LEVEL: 2
+XP_FIRST_LEVEL: 100
+XP_INCREASE: 100"""
+            
+            with open(progression_file, 'w') as f:
+                f.write(default_progression)
+            print(f"✓ Created default progression file: {progression_file}")
+        except Exception as e:
+            print(f"Warning: Could not create default progression file: {e}")
 
 
 # ============================================================================
@@ -473,6 +1749,21 @@ if __name__ == "__main__":
     except CorruptedDataError as e:
         print(f"✗ Corrupted item data: {e}\n")
     
+    # Test loading enemies
+    try:
+        enemies = load_enemies()
+        print(f"✓ Loaded {len(enemies)} enemies")
+        for enemy_id, enemy in enemies.items():
+            max_level = enemy['max_level'] if enemy['max_level'] is not None else '+'
+            print(f"  - {enemy['name']} (ID: {enemy_id}, Levels: {enemy['min_level']}-{max_level})")
+        print()
+    except MissingDataFileError as e:
+        print(f"✗ Enemy file not found: {e}\n")
+    except InvalidDataFormatError as e:
+        print(f"✗ Invalid enemy format: {e}\n")
+    except CorruptedDataError as e:
+        print(f"✗ Corrupted enemy data: {e}\n")
+    
     # Test validation
     try:
         test_quest = {
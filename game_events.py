@@ -0,0 +1,200 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Game Events Module
+
+Name: Charlestone Mayenga
+
+AI Usage: [Document any AI assistance used]
+
+A small in-process event bus. Modules publish facts ("this character
+gained gold", "this enemy was defeated") instead of calling each other,
+and any module can subscribe to the event types it cares about.
+
+Subscribers are indexed by exact event class, so publishing costs one
+dictionary lookup plus one call per subscriber.
+"""
+
+import asyncio
+import threading
+
+# Subscribers {event_class: [handler, ...]}
+_subscribers = {}
+
+# Events queued for batched delivery
+_pending = []
+
+# Guards _subscribers and _pending (sessions publish from worker threads);
+# handlers are always called outside it
+_lock = threading.Lock()
+
+# ============================================================================
+# EVENT TYPES
+# ============================================================================
+
+class GameEvent:
+    """Base class for all game events; every event names its character"""
+    
+    __slots__ = ('character',)
+    
+    def __init__(self, character):
+        self.character = character
+    
+    def __repr__(self):
+        fields = ", ".join(
+            f"{name}={getattr(self, name)!r}"
+            for cls in reversed(type(self).__mro__)
+            for name in getattr(cls, '__slots__', ())
+            if name != 'character'
+        )
+        return f"{type(self).__name__}({fields})"
+
+
+class GoldChanged(GameEvent):
+    """A character's gold went up or down by amount (now gold)"""
+    
+    __slots__ = ('amount', 'gold')
+    
+    def __init__(self, character, amount, gold):
+        self.character = character
+        self.amount = amount
+        self.gold = gold
+
+
+class LevelUp(GameEvent):
+    """A character went from old_level to new_level (possibly several levels)"""
+    
+    __slots__ = ('old_level', 'new_level')
+    
+    def __init__(self, character, old_level, new_level):
+        self.character = character
+        self.old_level = old_level
+        self.new_level = new_level
+
+
+class EnemyDefeated(GameEvent):
+    """A character won a battle"""
+    
+    __slots__ = ('enemy_type', 'xp_reward', 'gold_reward')
+    
+    def __init__(self, character, enemy_type, xp_reward, gold_reward):
+        self.character = character
+        self.enemy_type = enemy_type
+        self.xp_reward = xp_reward
+        self.gold_reward = gold_reward
+
+
+class ItemAcquired(GameEvent):
+    """A character gained quantity of an item; source is e.g. 'shop'"""
+    
+    __slots__ = ('item_id', 'item_type', 'quantity', 'source')
+    
+    def __init__(self, character, item_id, item_type, quantity=1, source=None):
+        self.character = character
+        self.item_id = item_id
+        self.item_type = item_type
+        self.quantity = quantity
+        self.source = source
+
+# ============================================================================
+# SUBSCRIBING
+# ============================================================================
+
+def subscribe(event_type, handler):
+    """
+    Call handler(event) whenever an event of exactly event_type is published
+    
+    Subscribing to GameEvent itself does not receive subclasses.
+    """
+    with _lock:
+        handlers = _subscribers.setdefault(event_type, [])
+        if handler not in handlers:
+            handlers.append(handler)
+
+
+def unsubscribe(event_type, handler):
+    """Stop calling handler for event_type (no error if not subscribed)"""
+    with _lock:
+        handlers = _subscribers.get(event_type)
+        if handlers and handler in handlers:
+            handlers.remove(handler)
+            if not handlers:
+                del _subscribers[event_type]
+
+# ============================================================================
+# PUBLISHING
+# ============================================================================
+
+def publish(event):
+    """
+    Deliver an event to its subscribers right away
+    
+    Handlers subscribed when the event is published all receive it, even
+    if one of them subscribes or unsubscribes others along the way.
+    """
+    with _lock:
+        handlers = tuple(_subscribers.get(event.__class__, ()))
+    for handler in handlers:
+        handler(event)
+
+
+def publish_later(event):
+    """Queue an event for the next flush() or deliver_pending()"""
+    with _lock:
+        _pending.append(event)
+
+
+def flush():
+    """
+    Deliver every queued event in the order it was queued
+    
+    Returns: Number of events delivered
+    """
+    delivered = 0
+    while True:
+        with _lock:
+            batch = _pending[:]
+            _pending.clear()
+        if not batch:
+            return delivered
+        for event in batch:
+            publish(event)
+        delivered += len(batch)
+
+
+async def deliver_pending(batch_size=100):
+    """
+    Deliver queued events in batches, yielding to the event loop between
+    batches so other coroutines keep running
+    
+    Returns: Number of events delivered
+    """
+    delivered = 0
+    while True:
+        with _lock:
+            batch = _pending[:batch_size]
+            del _pending[:batch_size]
+        if not batch:
+            return delivered
+        for event in batch:
+            publish(event)
+        delivered += len(batch)
+        await asyncio.sleep(0)
+
+
+# ============================================================================
+# TESTING
+# ============================================================================
+
+if __name__ == "__main__":
+    print("=== GAME EVENTS TEST ===\n")
+    
+    received = []
+    subscribe(GoldChanged, received.append)
+    
+    publish(GoldChanged({'name': 'Test'}, 25, 125))
+    publish_later(GoldChanged({'name': 'Test'}, -10, 115))
+    print(f"Before flush: {received}")
+    flush()
+    print(f"After flush: {received}")
+    
+    print("\n=== GAME EVENTS TESTS COMPLETE ===")
@@ -0,0 +1,191 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Game Server Module
+
+Name: Charlestone Mayenga
+
+AI Usage: [Document any AI assistance used]
+
+This module hosts many players in one process. Each connection gets its
+own GameSession (its own character and battle) while the quest and item
+catalogs are loaded once and shared. A session is a coroutine that waits
+for a command line, runs it, and writes the reply, so idle players cost
+one suspended coroutine each. Commands run on worker threads, so one
+player's slow save or load doesn't hold up everyone else, and a command
+that fails gets an error reply instead of closing the connection.
+
+Protocol (UTF-8 lines):
+- The client sends one command per line ("explore", "buy iron_sword 2").
+- Every reply ends with a line holding a single ".". Reply lines that
+  start with "." get an extra "." in front (remove it when reading).
+
+Only localhost TCP or a Unix socket is supported:
+    python game_server.py --port 8163
+    python game_server.py --unix /tmp/quest_chronicles.sock
+"""
+
+import asyncio
+import argparse
+
+import game_session
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8163
+
+# Hosts the TCP server is allowed to bind to
+LOCAL_HOSTS = ("127.0.0.1", "::1", "localhost")
+
+# Line that ends every reply
+END_OF_REPLY = "."
+
+WELCOME_TEXT = (
+    "Welcome to Quest Chronicles!\n"
+    "Use 'new <name> <class>' or 'load <name>' to start (type 'help' for commands)."
+)
+
+# ============================================================================
+# PROTOCOL
+# ============================================================================
+
+def frame_reply(text):
+    """
+    Encode a reply for the wire: dot-stuffed lines plus the end marker
+    
+    Returns: bytes
+    """
+    lines = []
+    if text:
+        for line in text.split("\n"):
+            lines.append("." + line if line.startswith(".") else line)
+    lines.append(END_OF_REPLY)
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+async def read_reply(reader):
+    """
+    Read one reply from a server connection
+    
+    Returns: Reply text (without the end marker)
+    Raises: ConnectionError if the server closes the connection mid-reply
+    """
+    lines = []
+    while True:
+        raw = await reader.readline()
+        if not raw:
+            raise ConnectionError("Server closed the connection")
+        line = raw.decode("utf-8").rstrip("\n")
+        if line == END_OF_REPLY:
+            return "\n".join(lines)
+        lines.append(line[1:] if line.startswith("..") else line)
+
+# ============================================================================
+# GAME SERVER
+# ============================================================================
+
+class GameServer:
+    """
+    Serves game sessions over a local socket
+    
+    Attributes:
+        quests / items: Catalogs shared by every session
+        save_directory: Where characters are saved
+        sessions: Sessions currently connected
+    """
+    
+    def __init__(self, quests, items, save_directory="data/save_games"):
+        self.quests = quests
+        self.items = items
+        self.save_directory = save_directory
+        self.sessions = set()
+        self.server = None
+    
+    async def run_command(self, session, line):
+        """
+        Run one command line on a worker thread
+        
+        Returns: Reply text, ending with an error line if the command failed
+        """
+        try:
+            return await asyncio.to_thread(session.execute, line)
+        except Exception as e:
+            session.say(f"✗ Error: {e}")
+            return session.take_output()
+    
+    async def handle_connection(self, reader, writer):
+        """Run one player's session until they quit or disconnect"""
+        session = game_session.GameSession(self.quests, self.items, self.save_directory)
+        self.sessions.add(session)
+        try:
+            writer.write(frame_reply(WELCOME_TEXT))
+            await writer.drain()
+            
+            while session.running:
+                raw = await reader.readline()
+                if not raw:
+                    break
+                reply = await self.run_command(session, raw.decode("utf-8", "replace").strip())
+                writer.write(frame_reply(reply))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            # Keep progress from dropped connections
+            if session.running:
+                session.battle = None
+                await asyncio.to_thread(session.save)
+            self.sessions.discard(session)
+            writer.close()
+    
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT, path=None):
+        """
+        Start listening on localhost TCP, or on a Unix socket if path is given
+        
+        Returns: The asyncio server
+        Raises: ValueError if host is not a localhost address
+        """
+        if path is not None:
+            self.server = await asyncio.start_unix_server(self.handle_connection, path)
+        else:
+            if host not in LOCAL_HOSTS:
+                raise ValueError(f"Game server only listens on localhost, not {host}")
+            self.server = await asyncio.start_server(self.handle_connection, host, port)
+        return self.server
+    
+    async def serve_forever(self, host=DEFAULT_HOST, port=DEFAULT_PORT, path=None):
+        """Start the server and keep serving until cancelled"""
+        server = await self.start(host, port, path)
+        async with server:
+            await server.serve_forever()
+    
+    @property
+    def port(self):
+        """Port the TCP server is bound to (useful when started on port 0)"""
+        return self.server.sockets[0].getsockname()[1]
+
+
+# ============================================================================
+# MAIN EXECUTION
+# ============================================================================
+
+def main(argv=None):
+    """Load the catalogs and serve until interrupted"""
+    parser = argparse.ArgumentParser(description="Quest Chronicles game server")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="localhost address to bind")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="TCP port")
+    parser.add_argument("--unix", metavar="PATH", help="serve on a Unix socket instead of TCP")
+    parser.add_argument("--save-dir", default="data/save_games", help="save game directory")
+    args = parser.parse_args(argv)
+    
+    quests, items = game_session.load_catalogs()
+    server = GameServer(quests, items, args.save_dir)
+    
+    where = args.unix or f"{args.host}:{args.port}"
+    print(f"Quest Chronicles server listening on {where}")
+    try:
+        asyncio.run(server.serve_forever(args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        print("\nServer stopped.")
+
+
+if __name__ == "__main__":
+    main()
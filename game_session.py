@@ -0,0 +1,562 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Game Session Module
+
+Name: Charlestone Mayenga
+
+AI Usage: [Document any AI assistance used]
+
+This module holds one player's game state and a text command interface
+to it. A GameSession owns its character and current battle and shares
+the read-only quest and item catalogs with every other session, so one
+process can host many players.
+
+execute() runs one command line ("buy iron_sword 2", "explore",
+"accept goblin_hunter") through the same game logic as the menus and
+returns the output as text instead of printing it.
+"""
+
+import character_manager
+import inventory_system
+import quest_handler
+import quest_tracker
+import combat_system
+import game_data
+from custom_exceptions import (
+    MissingDataFileError,
+    CharacterNotFoundError,
+    SaveFileCorruptedError,
+    InvalidSaveDataError,
+    InvalidCharacterClassError,
+    InvalidCharacterNameError,
+    CharacterDeadError,
+    InvalidTargetError,
+    InventoryFullError,
+    InsufficientResourcesError,
+    ItemNotFoundError,
+    InvalidItemTypeError,
+    QuestNotFoundError,
+    QuestNotActiveError,
+    QuestAlreadyCompletedError,
+    QuestRequirementsNotMetError,
+    InsufficientLevelError
+)
+
+# Gold needed to revive a dead character
+REVIVE_COST = 50
+
+# Number of items shown per shop page
+SHOP_PAGE_SIZE = 10
+
+# Session states (which commands are allowed)
+NO_CHARACTER = 'no_character'
+PLAYING = 'playing'
+IN_BATTLE = 'in_battle'
+DEAD = 'dead'
+
+# ============================================================================
+# CATALOGS
+# ============================================================================
+
+def load_catalogs():
+    """
+    Load the shared game data every session reads from
+    
+    Creates the default data files first if any are missing. Enemy
+    templates and class progression are loaded into their modules.
+    
+    Returns: Tuple (quests, items)
+    Raises: InvalidDataFormatError, CorruptedDataError
+    """
+    try:
+        quests = game_data.load_quests()
+        items = game_data.load_items()
+        combat_system.load_enemy_templates()
+        character_manager.load_progression()
+    except MissingDataFileError:
+        game_data.create_default_data_files()
+        quests = game_data.load_quests()
+        items = game_data.load_items()
+        combat_system.load_enemy_templates()
+        character_manager.load_progression()
+    return quests, items
+
+# ============================================================================
+# GAME SESSION
+# ============================================================================
+
+class GameSession:
+    """
+    One player's game state
+    
+    Attributes:
+        quests / items: Shared catalogs (sessions never modify them)
+        character: The loaded character, or None
+        battle: The SimpleBattle in progress, or None
+        running: False once the player has quit
+        save_directory: Where this session's character is saved
+        autosave: Save new characters, on quit and after every command
+                  that changes the character ('save' always saves)
+        input_func: Where the interactive menus read input from
+                    (None means input(); replays and recordings swap it)
+    """
+    
+    def __init__(self, quests, items, save_directory="data/save_games", autosave=True):
+        self.quests = quests
+        self.items = items
+        self.save_directory = save_directory
+        self.autosave = autosave
+        self.character = None
+        self.battle = None
+        self.running = True
+        self.shop_page = 0
+        self.shop_filters = {'item_type': None, 'max_cost': None}
+        self.output = []
+        self.input_func = None
+    
+    @property
+    def state(self):
+        """Current session state (decides which commands are allowed)"""
+        if self.character is None:
+            return NO_CHARACTER
+        if self.battle is not None:
+            return IN_BATTLE
+        if self.character['health'] <= 0:
+            return DEAD
+        return PLAYING
+    
+    def say(self, text=""):
+        """Add text to the output of the current command"""
+        self.output.append(text)
+    
+    def take_output(self):
+        """Return and clear everything said since the last call"""
+        text = "\n".join(self.output)
+        self.output.clear()
+        return text
+    
+    def ask(self, prompt=""):
+        """Read one line of player input for the interactive menus"""
+        return (self.input_func or input)(prompt)
+    
+    def begin(self, character):
+        """
+        Start playing a character (newly created or just loaded)
+        
+        Brings the character's quest reward totals up to date and
+        builds its objective tracker.
+        """
+        self.character = character
+        self.battle = None
+        self.running = True
+        quest_handler.reconcile_quest_stats(character, self.quests)
+        quest_tracker.get_tracker(character, self.quests)
+    
+    def save(self):
+        """Save the character (if one is loaded)"""
+        if self.character is None:
+            return
+        try:
+            character_manager.save_character(self.character, self.save_directory)
+        except Exception as e:
+            self.say(f"Warning: Could not save game: {e}")
+    
+    def execute(self, line):
+        """
+        Run one command line
+        
+        Example: session.execute("buy health_potion 2, iron_sword")
+        
+        Returns: Output of the command as a string
+        """
+        words = line.split(None, 1)
+        if not words:
+            return ""
+        verb = words[0].lower()
+        argument = words[1].strip() if len(words) > 1 else ""
+        
+        command = COMMANDS.get(verb)
+        if command is None:
+            self.say(f"Unknown command: {verb} (type 'help' for commands)")
+            return self.take_output()
+        
+        handler, states, changes = command
+        if self.state not in states:
+            self.say(STATE_HINTS[self.state])
+            return self.take_output()
+        
+        # Keep this character's objective tracker cached between commands
+        if self.character is not None:
+            quest_tracker.get_tracker(self.character, self.quests)
+        
+        try:
+            handler(self, argument)
+        except ValueError:
+            self.say("Invalid input.")
+        
+        if changes and self.autosave and self.running:
+            self.save()
+        return self.take_output()
+    
+    # ------------------------------------------------------------------
+    # Characters
+    # ------------------------------------------------------------------
+    
+    def do_help(self, argument):
+        """help - list the commands available right now"""
+        self.say("Commands:")
+        shown = set()
+        for handler, states, changes in COMMANDS.values():
+            if self.state in states and handler.__doc__ not in shown:
+                shown.add(handler.__doc__)
+                self.say(f"  {handler.__doc__}")
+    
+    def do_characters(self, argument):
+        """characters - list saved characters"""
+        names = character_manager.list_saved_characters(self.save_directory)
+        self.say("Saved characters: " + (", ".join(sorted(names)) if names else "none"))
+    
+    def do_new(self, argument):
+        """new <name> <class> - create a character"""
+        parts = argument.rsplit(None, 1)
+        if len(parts) < 2:
+            self.say("Usage: new <name> <class>")
+            return
+        name, character_class = parts[0], parts[1].capitalize()
+        try:
+            self.begin(character_manager.create_character(name, character_class))
+        except (InvalidCharacterClassError, InvalidCharacterNameError) as e:
+            self.say(f"✗ {e}")
+            return
+        if self.autosave:
+            self.save()
+        self.say(f"✓ Created {name} the {character_class}!")
+    
+    def do_load(self, argument):
+        """load <name> - load a saved character"""
+        if not argument:
+            self.say("Usage: load <name>")
+            return
+        try:
+            character = character_manager.load_character(argument, self.save_directory)
+        except (CharacterNotFoundError, InvalidCharacterNameError) as e:
+            self.say(f"✗ Character not found: {e}")
+            return
+        except (SaveFileCorruptedError, InvalidSaveDataError) as e:
+            self.say(f"✗ Could not load character: {e}")
+            return
+        
+        self.begin(character)
+        self.say(f"✓ Loaded {character['name']}!")
+    
+    def do_stats(self, argument):
+        """stats - show character stats"""
+        if self.battle is not None:
+            self.battle.show_stats()
+            return
+        char = self.character
+        self.say(f"{char['name']} the {char['class']} - Level {char['level']}")
+        self.say(f"Health: {char['health']}/{char['max_health']}  "
+                 f"Strength: {char['strength']}  Magic: {char['magic']}")
+        self.say(f"Experience: {char['experience']}  Gold: {char['gold']}")
+        self.say(f"Active Quests: {len(char.get('active_quests', []))}  "
+                 f"Completed Quests: {len(char.get('completed_quests', []))}")
+    
+    def do_save(self, argument):
+        """save - save the game"""
+        self.save()
+        self.say("✓ Game saved!")
+    
+    def do_quit(self, argument):
+        """quit - save and leave"""
+        self.battle = None
+        if self.autosave:
+            self.save()
+        self.running = False
+        self.say("Goodbye!")
+    
+    def do_revive(self, argument):
+        """revive - pay 50 gold to come back to life"""
+        if self.character['gold'] < REVIVE_COST:
+            self.say(f"✗ Not enough gold! (Need {REVIVE_COST}, have {self.character['gold']})")
+            return
+        character_manager.add_gold(self.character, -REVIVE_COST)
+        character_manager.revive_character(self.character)
+        self.say(f"✓ Revived! Gold spent: {REVIVE_COST}")
+    
+    # ------------------------------------------------------------------
+    # Inventory
+    # ------------------------------------------------------------------
+    
+    def do_inventory(self, argument):
+        """inventory [page] - show the inventory"""
+        page = int(argument) - 1 if argument else 0
+        self.say(inventory_system.render_inventory(self.character, self.items, max(page, 0)))
+    
+    def _catalog_item(self, item_id):
+        """Look up an item, reporting unknown IDs"""
+        item = self.items.get(item_id)
+        if item is None:
+            self.say(f"Item '{item_id}' not found.")
+        return item
+    
+    def do_use(self, argument):
+        """use <item_id> - use a consumable"""
+        item = self._catalog_item(argument)
+        if item is None:
+            return
+        try:
+            self.say("✓ " + inventory_system.use_item(self.character, argument, item))
+        except (ItemNotFoundError, InvalidItemTypeError) as e:
+            self.say(f"✗ {e}")
+    
+    def do_equip(self, argument):
+        """equip <item_id> - equip a weapon or armor"""
+        item = self._catalog_item(argument)
+        if item is None:
+            return
+        equip = inventory_system.equip_armor if item['type'] == 'armor' else inventory_system.equip_weapon
+        try:
+            self.say("✓ " + equip(self.character, argument, item))
+        except (ItemNotFoundError, InvalidItemTypeError, InventoryFullError) as e:
+            self.say(f"✗ {e}")
+    
+    def do_unequip(self, argument):
+        """unequip weapon|armor - take off equipment"""
+        if argument not in ('weapon', 'armor'):
+            self.say("Usage: unequip weapon|armor")
+            return
+        unequip = inventory_system.unequip_weapon if argument == 'weapon' else inventory_system.unequip_armor
+        try:
+            if unequip(self.character):
+                self.say(f"✓ Unequipped {argument}")
+            else:
+                self.say(f"No {argument} equipped.")
+        except InventoryFullError as e:
+            self.say(f"✗ {e}")
+    
+    def do_drop(self, argument):
+        """drop <item_id> - drop an item"""
+        try:
+            inventory_system.remove_item_from_inventory(self.character, argument)
+            self.say(f"✓ Dropped {argument}")
+        except ItemNotFoundError as e:
+            self.say(f"✗ {e}")
+    
+    # ------------------------------------------------------------------
+    # Shop
+    # ------------------------------------------------------------------
+    
+    def do_shop(self, argument):
+        """shop [page] - list shop items"""
+        total = game_data.count_items_by(self.items, **self.shop_filters)
+        page_count = max(1, (total + SHOP_PAGE_SIZE - 1) // SHOP_PAGE_SIZE)
+        if argument:
+            self.shop_page = int(argument) - 1
+        self.shop_page = max(0, min(self.shop_page, page_count - 1))
+        
+        page_items = game_data.items_by(
+            self.items, offset=self.shop_page * SHOP_PAGE_SIZE, limit=SHOP_PAGE_SIZE,
+            **self.shop_filters
+        )
+        self.say(f"Your Gold: {self.character['gold']}")
+        self.say(f"Shop Items (page {self.shop_page + 1}/{page_count}, {total} items):")
+        for item in page_items:
+            self.say(inventory_system.get_item_row(item['item_id'], item, 'shop'))
+    
+    def do_filter(self, argument):
+        """filter [type|all] [max_cost] - filter shop items"""
+        parts = argument.split()
+        item_type = parts[0].lower() if parts else 'all'
+        self.shop_filters['item_type'] = None if item_type == 'all' else item_type
+        self.shop_filters['max_cost'] = int(parts[1]) if len(parts) > 1 else None
+        self.shop_page = 0
+        self.do_shop("")
+    
+    def do_buy(self, argument):
+        """buy <item_id> [qty], ... - buy items"""
+        order = inventory_system.parse_item_order(argument)
+        try:
+            result = inventory_system.purchase_items(self.character, order, self.items)
+            self.say(f"✓ Purchased {result['items']} item(s) for {result['gold_spent']} Gold!")
+        except (ItemNotFoundError, InsufficientResourcesError, InventoryFullError) as e:
+            self.say(f"✗ {e}")
+    
+    def do_sell(self, argument):
+        """sell <item_id> [qty], ... - sell items"""
+        order = inventory_system.parse_item_order(argument)
+        try:
+            result = inventory_system.sell_items(self.character, order, self.items)
+            self.say(f"✓ Sold {result['items']} item(s) for {result['gold_received']} Gold!")
+        except ItemNotFoundError as e:
+            self.say(f"✗ {e}")
+    
+    # ------------------------------------------------------------------
+    # Quests
+    # ------------------------------------------------------------------
+    
+    def _say_quests(self, quests):
+        """List quests one per line with their ID, level and rewards"""
+        for quest in quests:
+            self.say(f"  {quest['quest_id']}: {quest['title']} "
+                     f"(Level {quest['required_level']}, {quest['reward_xp']} XP, "
+                     f"{quest['reward_gold']} Gold)")
+    
+    def do_quests(self, argument):
+        """quests [active|available|completed] - list quests"""
+        which = argument.lower() or 'active'
+        if which == 'active':
+            active = quest_handler.get_active_quests(self.character, self.quests)
+            self.say("Active Quests:" if active else "No active quests.")
+            for quest in active:
+                self._say_quests([quest])
+                for line in quest_tracker.describe_progress(self.character, quest['quest_id'], self.quests):
+                    self.say(f"    {line}")
+        elif which == 'available':
+            self.say("Available Quests:")
+            self._say_quests(quest_handler.get_available_quests(self.character, self.quests))
+        elif which == 'completed':
+            completed = quest_handler.get_completed_quests(self.character, self.quests)
+            self.say("Completed Quests:" if completed else "No completed quests.")
+            self._say_quests(completed)
+        else:
+            self.say("Usage: quests [active|available|completed]")
+    
+    def do_accept(self, argument):
+        """accept <quest_id> - accept a quest"""
+        try:
+            quest_handler.accept_quest(self.character, argument, self.quests)
+            self.say(f"✓ Accepted quest: {self.quests[argument]['title']}")
+        except (QuestNotFoundError, InsufficientLevelError,
+                QuestRequirementsNotMetError, QuestAlreadyCompletedError) as e:
+            self.say(f"✗ {e}")
+    
+    def do_abandon(self, argument):
+        """abandon <quest_id> - abandon an active quest"""
+        try:
+            quest_handler.abandon_quest(self.character, argument)
+            self.say("✓ Abandoned quest")
+        except QuestNotActiveError as e:
+            self.say(f"✗ {e}")
+    
+    def do_complete(self, argument):
+        """complete <quest_id> - turn in a finished quest"""
+        try:
+            result = quest_handler.complete_quest(self.character, argument, self.quests)
+            self.say(f"✓ Completed: {result['quest_title']}")
+            self.say(f"  Rewards: {result['xp_reward']} XP, {result['gold_reward']} Gold")
+        except (QuestNotActiveError, QuestRequirementsNotMetError) as e:
+            self.say(f"✗ {e}")
+    
+    # ------------------------------------------------------------------
+    # Exploring and combat
+    # ------------------------------------------------------------------
+    
+    def do_explore(self, argument):
+        """explore - look for a battle"""
+        try:
+            enemy = combat_system.get_random_enemy_for_level(self.character['level'])
+        except InvalidTargetError as e:
+            self.say(f"✗ {e}")
+            return
+        self.say(f"You encountered a {enemy['name']}!")
+        battle = combat_system.SimpleBattle(self.character, enemy, output=self.say)
+        try:
+            battle.announce()
+        except CharacterDeadError as e:
+            self.say(f"✗ {e}")
+            return
+        self.battle = battle
+        battle.show_stats()
+        self.say("Your turn: attack, ability or run")
+    
+    def do_fight(self, action):
+        """attack | ability | run - act in battle"""
+        result = self.battle.play_round(action)
+        if result is None:
+            self.battle.show_stats()
+            self.say("Your turn: attack, ability or run")
+            return
+        
+        self.battle = None
+        if result['winner'] == 'player':
+            character_manager.add_gold(self.character, result['gold_gained'])
+            character_manager.gain_experience(self.character, result['xp_gained'])
+            self.say("✓ Victory!")
+            self.say(f"  XP Gained: {result['xp_gained']}")
+            self.say(f"  Gold Gained: {result['gold_gained']}")
+            self.say(f"  Level: {self.character['level']}")
+        elif result['winner'] == 'escaped':
+            self.say("You got away safely.")
+        else:
+            self.character['health'] = 0
+            self.say("✗ You were defeated!")
+            self.say(STATE_HINTS[DEAD])
+
+
+def _fight_command(action):
+    """Build the handler for one battle action verb"""
+    def handler(session, argument):
+        session.do_fight(action)
+    handler.__doc__ = GameSession.do_fight.__doc__
+    return handler
+
+
+# Which commands each state allows
+ANY_STATE = (NO_CHARACTER, PLAYING, IN_BATTLE, DEAD)
+WITH_CHARACTER = (PLAYING, IN_BATTLE, DEAD)
+
+# Commands {verb: (handler, allowed states, changes the character)}
+COMMANDS = {
+    'help': (GameSession.do_help, ANY_STATE, False),
+    'characters': (GameSession.do_characters, (NO_CHARACTER,), False),
+    'new': (GameSession.do_new, (NO_CHARACTER,), False),
+    'load': (GameSession.do_load, (NO_CHARACTER,), False),
+    'stats': (GameSession.do_stats, WITH_CHARACTER, False),
+    'inventory': (GameSession.do_inventory, (PLAYING,), False),
+    'use': (GameSession.do_use, (PLAYING,), True),
+    'equip': (GameSession.do_equip, (PLAYING,), True),
+    'unequip': (GameSession.do_unequip, (PLAYING,), True),
+    'drop': (GameSession.do_drop, (PLAYING,), True),
+    'shop': (GameSession.do_shop, (PLAYING,), False),
+    'filter': (GameSession.do_filter, (PLAYING,), False),
+    'buy': (GameSession.do_buy, (PLAYING,), True),
+    'sell': (GameSession.do_sell, (PLAYING,), True),
+    'quests': (GameSession.do_quests, (PLAYING,), False),
+    'accept': (GameSession.do_accept, (PLAYING,), True),
+    'abandon': (GameSession.do_abandon, (PLAYING,), True),
+    'complete': (GameSession.do_complete, (PLAYING,), True),
+    'explore': (GameSession.do_explore, (PLAYING,), False),
+    'attack': (_fight_command('attack'), (IN_BATTLE,), True),
+    'ability': (_fight_command('ability'), (IN_BATTLE,), True),
+    'run': (_fight_command('run'), (IN_BATTLE,), True),
+    'revive': (GameSession.do_revive, (DEAD,), True),
+    'save': (GameSession.do_save, WITH_CHARACTER, False),
+    'quit': (GameSession.do_quit, ANY_STATE, False)
+}
+
+# What to tell a player who uses a command in the wrong state
+STATE_HINTS = {
+    NO_CHARACTER: "No character loaded. Use 'new <name> <class>' or 'load <name>'.",
+    PLAYING: "You can't do that right now (type 'help' for commands).",
+    IN_BATTLE: "You're in a battle! Use attack, ability or run.",
+    DEAD: "You have died! Use 'revive' (costs 50 Gold) or 'quit'."
+}
+
+
+# ============================================================================
+# TESTING
+# ============================================================================
+
+if __name__ == "__main__":
+    print("=== GAME SESSION TEST ===\n")
+    
+    test_quests, test_items = load_catalogs()
+    session = GameSession(test_quests, test_items, autosave=False)
+    
+    for line in ["new SessionTest Warrior", "stats", "buy health_potion 2", "inventory",
+                 "explore", "attack", "quests available"]:
+        print(f"> {line}")
+        print(session.execute(line))
+    
+    print("\n=== GAME SESSION TESTS COMPLETE ===")
@@ -9,6 +9,8 @@ AI Usage: [Document any AI assistance used]
 This module handles inventory management, item usage, and equipment.
 """
 
+import sys
+import game_events
 from custom_exceptions import (
     InventoryFullError,
     ItemNotFoundError,
@@ -19,6 +21,9 @@ from custom_exceptions import (
 # Maximum inventory size
 MAX_INVENTORY_SIZE = 20
 
+# Number of distinct items shown per inventory page
+INVENTORY_PAGE_SIZE = 10
+
 # ============================================================================
 # INVENTORY MANAGEMENT
 # ============================================================================
@@ -414,6 +419,10 @@ def purchase_item(character, item_id, item_data):
     # Add item to inventory
     add_item_to_inventory(character, item_id)
     
+    # Announce the purchase
+    game_events.publish(game_events.GoldChanged(character, -cost, character['gold']))
+    game_events.publish(game_events.ItemAcquired(character, item_id, item_data.get('type'), 1, 'shop'))
+    
     return True
 
 
@@ -448,9 +457,146 @@ def sell_item(character, item_id, item_data):
     
     # Add gold to character
     character['gold'] += sell_price
+    game_events.publish(game_events.GoldChanged(character, sell_price, character['gold']))
     
     return sell_price
 
+
+def _total_order_quantities(order, item_data_dict):
+    """
+    Combine an order into {item_id: total_quantity}
+    
+    Raises:
+        ItemNotFoundError if an item is not in item_data_dict
+        ValueError if a quantity is not positive
+    """
+    totals = {}
+    for item_id, quantity in order:
+        if item_id not in item_data_dict:
+            raise ItemNotFoundError(f"Item '{item_id}' not found")
+        if quantity <= 0:
+            raise ValueError(f"Quantity for '{item_id}' must be positive, got {quantity}")
+        totals[item_id] = totals.get(item_id, 0) + quantity
+    return totals
+
+
+def purchase_items(character, order, item_data_dict):
+    """
+    Purchase several items in one transaction
+    
+    Args:
+        character: Character dictionary
+        order: List of (item_id, quantity) pairs
+        item_data_dict: Dictionary of all item data
+    
+    Gold and inventory space are checked once for the whole order, and
+    either every item is bought or nothing changes.
+    
+    Returns: Dictionary with 'items' (units bought) and 'gold_spent'
+    Raises:
+        ItemNotFoundError if an item doesn't exist
+        InsufficientResourcesError if not enough gold for the whole order
+        InventoryFullError if the whole order doesn't fit
+    """
+    totals = _total_order_quantities(order, item_data_dict)
+    
+    total_cost = 0
+    total_units = 0
+    for item_id, quantity in totals.items():
+        total_cost += item_data_dict[item_id].get('cost', 0) * quantity
+        total_units += quantity
+    
+    # Check everything before changing anything
+    if character['gold'] < total_cost:
+        raise InsufficientResourcesError(
+            f"Not enough gold! Need {total_cost}, have {character['gold']}"
+        )
+    
+    if len(character['inventory']) + total_units > MAX_INVENTORY_SIZE:
+        raise InventoryFullError(
+            f"Not enough inventory space! Need {total_units}, "
+            f"have {get_inventory_space_remaining(character)}"
+        )
+    
+    # Apply the whole order
+    character['gold'] -= total_cost
+    for item_id, quantity in totals.items():
+        character['inventory'].extend([item_id] * quantity)
+    
+    # Announce the purchase
+    game_events.publish(game_events.GoldChanged(character, -total_cost, character['gold']))
+    for item_id, quantity in totals.items():
+        item_type = item_data_dict[item_id].get('type')
+        game_events.publish(game_events.ItemAcquired(character, item_id, item_type, quantity, 'shop'))
+    
+    return {'items': total_units, 'gold_spent': total_cost}
+
+
+def sell_items(character, order, item_data_dict):
+    """
+    Sell several items in one transaction, each for half its cost
+    
+    Args:
+        character: Character dictionary
+        order: List of (item_id, quantity) pairs
+        item_data_dict: Dictionary of all item data
+    
+    Either every item is sold or nothing changes.
+    
+    Returns: Dictionary with 'items' (units sold) and 'gold_received'
+    Raises:
+        ItemNotFoundError if an item doesn't exist or not enough are owned
+        ValueError if a quantity is not positive
+    """
+    totals = _total_order_quantities(order, item_data_dict)
+    
+    # Check every item is owned in the requested quantity
+    for item_id, quantity in totals.items():
+        owned = count_item(character, item_id)
+        if owned < quantity:
+            raise ItemNotFoundError(
+                f"Cannot sell {quantity} '{item_id}': only {owned} in inventory"
+            )
+    
+    # Remove the sold units in a single pass over the inventory
+    to_remove = dict(totals)
+    kept = []
+    for item_id in character['inventory']:
+        if to_remove.get(item_id, 0) > 0:
+            to_remove[item_id] -= 1
+        else:
+            kept.append(item_id)
+    character['inventory'][:] = kept
+    
+    gold_received = 0
+    total_units = 0
+    for item_id, quantity in totals.items():
+        gold_received += (item_data_dict[item_id].get('cost', 0) // 2) * quantity
+        total_units += quantity
+    character['gold'] += gold_received
+    game_events.publish(game_events.GoldChanged(character, gold_received, character['gold']))
+    
+    return {'items': total_units, 'gold_received': gold_received}
+
+
+def parse_item_order(text):
+    """
+    Parse an order like "health_potion 3, iron_sword" into (item_id, quantity) pairs
+    
+    Quantity defaults to 1 when omitted.
+    
+    Returns: List of (item_id, quantity) tuples
+    Raises: ValueError if a quantity is not a number
+    """
+    order = []
+    for entry in text.split(','):
+        parts = entry.split()
+        if not parts:
+            continue
+        quantity = int(parts[1]) if len(parts) > 1 else 1
+        order.append((parts[0], quantity))
+    return order
+
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
@@ -505,66 +651,101 @@ def apply_stat_effect(character, stat_name, value):
             character['health'] = min(character['health'], character['max_health'])
 
 
-def display_inventory(character, item_data_dict):
+def get_item_row(item_id, item_data, row_kind='inventory'):
     """
-    Display character's inventory in formatted way
+    Get the formatted display row for an item
     
     Args:
-        character: Character dictionary
-        item_data_dict: Dictionary of all item data
+        item_id: Item identifier
+        item_data: Item information dictionary (may be empty)
+        row_kind: 'inventory' or 'shop'
     
-    Shows item names, types, and quantities
+    Returns: Formatted row string (without trailing newline)
+    """
+    name = item_data.get('name', item_id)
+    item_type = item_data.get('type', 'unknown')
+    if row_kind == 'shop':
+        return f"  {item_id}: {name} - {item_data.get('cost', 0)} Gold ({item_type})"
+    return f"  • {name} ({item_type})"
+
+
+def get_inventory_page_count(character, page_size=INVENTORY_PAGE_SIZE):
+    """
+    Calculate how many pages the inventory display needs
+    
+    Returns: Integer number of pages (at least 1)
     """
-    # TODO: Implement inventory display
-    # Count items (some may appear multiple times)
-    # Display with item names from item_data_dict
+    unique_items = len(set(character.get('inventory', [])))
+    return max(1, (unique_items + page_size - 1) // page_size)
+
+
+def render_inventory(character, item_data_dict, page=0, page_size=INVENTORY_PAGE_SIZE):
+    """
+    Build one page of the inventory display as a single string
+    
+    Only the rows on the requested page are formatted.
     
+    Returns: Display text
+    """
     inventory = character.get('inventory', [])
     
     if not inventory:
-        print("Inventory is empty!")
-        return
-    
-    print("\n--- Inventory ---")
-    print(f"Capacity: {len(inventory)}/{MAX_INVENTORY_SIZE}")
+        return "Inventory is empty!\n"
     
     # Count unique items
     item_counts = {}
     for item_id in inventory:
-        if item_id not in item_counts:
-            item_counts[item_id] = 0
-        item_counts[item_id] += 1
-    
-    # Display items
-    for item_id, count in sorted(item_counts.items()):
-        item_data = item_data_dict.get(item_id, {})
-        item_name = item_data.get('name', item_id)
-        item_type = item_data.get('type', 'unknown')
-        
-        if count > 1:
-            print(f"  • {item_name} ({item_type}) x{count}")
-        else:
-            print(f"  • {item_name} ({item_type})")
+        item_counts[item_id] = item_counts.get(item_id, 0) + 1
+    
+    item_ids = sorted(item_counts)
+    page_count = max(1, (len(item_ids) + page_size - 1) // page_size)
+    page = max(0, min(page, page_count - 1))
+    
+    lines = ["\n--- Inventory ---", f"Capacity: {len(inventory)}/{MAX_INVENTORY_SIZE}"]
+    if page_count > 1:
+        lines.append(f"Page {page + 1}/{page_count}")
+    
+    # Format only the visible page
+    for item_id in item_ids[page * page_size:(page + 1) * page_size]:
+        row = get_item_row(item_id, item_data_dict.get(item_id, {}))
+        count = item_counts[item_id]
+        lines.append(f"{row} x{count}" if count > 1 else row)
     
     # Display equipped items
-    print("\n--- Equipment ---")
-    if 'equipped_weapon' in character and character['equipped_weapon']:
-        weapon_id = character['equipped_weapon']
-        weapon_data = item_data_dict.get(weapon_id, {})
-        weapon_name = weapon_data.get('name', weapon_id)
-        print(f"  Weapon: {weapon_name}")
+    lines.append("\n--- Equipment ---")
+    weapon_id = character.get('equipped_weapon')
+    if weapon_id:
+        lines.append(f"  Weapon: {item_data_dict.get(weapon_id, {}).get('name', weapon_id)}")
     else:
-        print(f"  Weapon: None")
+        lines.append("  Weapon: None")
     
-    if 'equipped_armor' in character and character['equipped_armor']:
-        armor_id = character['equipped_armor']
-        armor_data = item_data_dict.get(armor_id, {})
-        armor_name = armor_data.get('name', armor_id)
-        print(f"  Armor: {armor_name}")
+    armor_id = character.get('equipped_armor')
+    if armor_id:
+        lines.append(f"  Armor: {item_data_dict.get(armor_id, {}).get('name', armor_id)}")
     else:
-        print(f"  Armor: None")
+        lines.append("  Armor: None")
     
-    print("-" * 30)
+    lines.append("-" * 30)
+    return "\n".join(lines) + "\n"
+
+
+def display_inventory(character, item_data_dict, page=0, page_size=INVENTORY_PAGE_SIZE):
+    """
+    Display character's inventory in formatted way
+    
+    Args:
+        character: Character dictionary
+        item_data_dict: Dictionary of all item data
+        page: Zero-based page of items to show
+        page_size: Number of distinct items per page
+    
+    Shows item names, types, and quantities
+    The page is written to the terminal in a single write.
+    
+    Returns: Total number of pages
+    """
+    sys.stdout.write(render_inventory(character, item_data_dict, page, page_size))
+    return get_inventory_page_count(character, page_size)
 
 # ============================================================================
 # TESTING
@@ -8,31 +8,60 @@ AI Usage: [Document any AI assistance used]
 
 This is the main game file that ties all modules together.
 Demonstrates module integration and complete game flow.
+
+All per-player state lives in a game_session.GameSession that every
+menu function takes explicitly; the quest and item catalogs it points
+to are loaded once and shared.
+
+Besides the interactive menus, the game can run scripted commands:
+    python main.py --script actions.txt    (one command per line)
+    python main.py --json < commands.jsonl (JSON lines in and out)
+Commands are the GameSession verbs ("new Hero Warrior", "explore",
+"buy iron_sword 2", "accept goblin_hunter", "quit").
+
+Sessions can be recorded and replayed (see session_replay):
+    python main.py --record session.log [--seed N]
+    python main.py --replay session.log
 """
 
+import sys
+import json
+import argparse
+
 # Import all our custom modules
 import character_manager
 import inventory_system
 import quest_handler
+import quest_tracker
 import combat_system
 import game_data
+import game_session
+import session_replay
 from custom_exceptions import *
 
 # ============================================================================
-# GAME STATE
+# MENU TEXT
 # ============================================================================
 
-# Global variables for game data
-current_character = None
-all_quests = {}
-all_items = {}
-game_running = False
+# Number of items shown per shop page
+SHOP_PAGE_SIZE = game_session.SHOP_PAGE_SIZE
+
+# Static menu text, built once instead of on every redraw
+SHOP_MENU_TEXT = (
+    "\n1. Buy Item\n2. Sell Item\n3. Back\n4. Next Page\n5. Previous Page\n"
+    "6. Filter Items\n" + "=" * 50 + "\n"
+)
+
+INVENTORY_MENU_TEXT = (
+    "\n1. Use Item\n2. Equip Weapon\n3. Equip Armor\n4. Unequip Weapon\n"
+    "5. Unequip Armor\n6. Drop Item\n7. Back\n8. Next Page\n9. Previous Page\n"
+)
 
 # ============================================================================
 # MAIN MENU
 # ============================================================================
 
-def main_menu():
+def main_menu(session=None):
     """
     Display main menu and get player choice
     
@@ -41,6 +70,8 @@ def main_menu():
     2. Load Game
     3. Exit
     
+    Input is read through session.ask (input() if no session is given).
+    
     Returns: Integer choice (1-3)
     """
     # TODO: Implement main menu display
@@ -54,9 +85,10 @@ def main_menu():
     print("3. Exit")
     print("=" * 50)
     
+    read = session.ask if session is not None else input
     while True:
         try:
-            choice = int(input("\nEnter your choice (1-3): "))
+            choice = int(read("\nEnter your choice (1-3): "))
             if 1 <= choice <= 3:
                 return choice
             else:
@@ -65,7 +97,7 @@ def main_menu():
             print("Invalid input. Please enter a number (1-3).")
 
 
-def new_game():
+def new_game(session):
     """
     Start a new game
     
@@ -73,10 +105,8 @@ def new_game():
     - Character name
     - Character class
     
-    Creates character and starts game loop
+    Creates character and starts game loop in the given session
     """
-    global current_character
-    
     # TODO: Implement new game creation
     # Get name and class, create character, save, start loop
     
@@ -85,53 +115,50 @@ def new_game():
     print("=" * 50)
     
     # Get character name
-    name = input("Enter your character name: ").strip()
-    if not name:
+    name = session.ask("Enter your character name: ").strip()
+    if not character_manager.is_valid_character_name(name):
         print("Invalid name. Using 'Hero'.")
         name = "Hero"
     
     # Display class options
     print("\nAvailable classes:")
-    print("1. Warrior (HP=120, STR=15, MAG=5)")
-    print("2. Mage (HP=80, STR=8, MAG=20)")
-    print("3. Rogue (HP=90, STR=12, MAG=10)")
-    print("4. Cleric (HP=100, STR=10, MAG=15)")
-    
-    class_map = {'1': 'Warrior', '2': 'Mage', '3': 'Rogue', '4': 'Cleric'}
+    class_map = {}
+    for number, class_name in enumerate(character_manager.get_progression(), 1):
+        health, strength, magic = character_manager.get_progression_curve(class_name).stats_at(1)
+        print(f"{number}. {class_name} (HP={health}, STR={strength}, MAG={magic})")
+        class_map[str(number)] = class_name
     
     while True:
-        choice = input("\nSelect class (1-4): ").strip()
+        choice = session.ask(f"\nSelect class (1-{len(class_map)}): ").strip()
         if choice in class_map:
             character_class = class_map[choice]
             break
         else:
-            print("Invalid choice. Please select 1-4.")
+            print(f"Invalid choice. Please select 1-{len(class_map)}.")
     
     # Create character
     try:
-        current_character = character_manager.create_character(name, character_class)
+        session.begin(character_manager.create_character(name, character_class))
         print(f"\n✓ Created {name} the {character_class}!")
         
         # Save character
-        character_manager.save_character(current_character)
+        character_manager.save_character(session.character, session.save_directory)
         print(f"✓ Character saved!")
         
         # Start game loop
-        game_loop()
+        game_loop(session)
     
     except InvalidCharacterClassError as e:
         print(f"✗ Error: {e}")
 
 
-def load_game():
+def load_game(session):
     """
     Load an existing saved game
     
     Shows list of saved characters
     Prompts user to select one
     """
-    global current_character
-    
     # TODO: Implement game loading
     # Show saved characters, get choice, load character, start loop
     
@@ -140,7 +167,7 @@ def load_game():
     print("=" * 50)
     
     # Get saved characters
-    saved_chars = character_manager.list_saved_characters()
+    saved_chars = character_manager.list_saved_characters(session.save_directory)
     
     if not saved_chars:
         print("No saved characters found.")
@@ -154,7 +181,7 @@ def load_game():
     # Get player choice
     while True:
         try:
-            choice = int(input(f"\nSelect character (1-{len(saved_chars)}): "))
+            choice = int(session.ask(f"\nSelect character (1-{len(saved_chars)}): "))
             if 1 <= choice <= len(saved_chars):
                 selected_char = saved_chars[choice - 1]
                 break
@@ -165,13 +192,13 @@ def load_game():
     
     # Load character
     try:
-        current_character = character_manager.load_character(selected_char)
-        print(f"\n✓ Loaded {current_character['name']}!")
+        session.begin(character_manager.load_character(selected_char, session.save_directory))
+        print(f"\n✓ Loaded {session.character['name']}!")
         
         # Start game loop
-        game_loop()
+        game_loop(session)
     
-    except CharacterNotFoundError as e:
+    except (CharacterNotFoundError, InvalidCharacterNameError) as e:
         print(f"✗ Character not found: {e}")
     except SaveFileCorruptedError as e:
         print(f"✗ Save file corrupted: {e}")
@@ -183,49 +210,47 @@ def load_game():
 # GAME LOOP
 # ============================================================================
 
-def game_loop():
+def game_loop(session):
     """
     Main game loop - shows game menu and processes actions
     """
-    global game_running, current_character
-    
-    game_running = True
+    session.running = True
     
     # TODO: Implement game loop
     # While loop: show menu, get choice, execute action, save
     
-    while game_running:
-        if current_character['health'] <= 0:
-            handle_character_death()
-            if not game_running:
+    while session.running:
+        if session.character['health'] <= 0:
+            handle_character_death(session)
+            if not session.running:
                 break
             continue
         
-        choice = game_menu()
+        choice = game_menu(session)
         
         if choice == 1:
-            view_character_stats()
+            view_character_stats(session)
         elif choice == 2:
-            view_inventory()
+            view_inventory(session)
         elif choice == 3:
-            quest_menu()
+            quest_menu(session)
         elif choice == 4:
-            explore()
+            explore(session)
         elif choice == 5:
-            shop()
+            shop(session)
         elif choice == 6:
-            save_game()
+            save_game(session)
             print("\n✓ Game saved!")
-            game_running = False
+            session.running = False
         else:
             print("Invalid choice.")
         
         # Auto-save after each action (except quit)
-        if choice != 6 and game_running:
-            save_game()
+        if choice != 6 and session.running:
+            save_game(session)
 
 
-def game_menu():
+def game_menu(session):
     """
     Display game menu and get player choice
     
@@ -242,7 +267,7 @@ def game_menu():
     # TODO: Implement game menu
     
     print("\n" + "=" * 50)
-    print(f"GAME MENU - {current_character['name']}")
+    print(f"GAME MENU - {session.character['name']}")
     print("=" * 50)
     print("1. View Character Stats")
     print("2. View Inventory")
@@ -254,7 +279,7 @@ def game_menu():
     
     while True:
         try:
-            choice = int(input("\nEnter your choice (1-6): "))
+            choice = int(session.ask("\nEnter your choice (1-6): "))
             if 1 <= choice <= 6:
                 return choice
             else:
@@ -267,14 +292,12 @@ def game_menu():
 # GAME ACTIONS
 # ============================================================================
 
-def view_character_stats():
+def view_character_stats(session):
     """Display character information"""
-    global current_character
-    
     # TODO: Implement stats display
     # Show: name, class, level, health, stats, gold, etc.
     
-    char = current_character
+    char = session.character
     
     print("\n" + "=" * 50)
     print("CHARACTER STATS")
@@ -292,40 +315,33 @@ def view_character_stats():
     print("=" * 50)
 
 
-def view_inventory():
+def view_inventory(session):
     """Display and manage inventory"""
-    global current_character, all_items
-    
     # TODO: Implement inventory menu
     # Show inventory, options: use item, equip, drop
     
+    page = 0
+    
     while True:
-        print("\n" + "=" * 50)
-        print("INVENTORY MENU")
-        print("=" * 50)
+        sys.stdout.write("\n" + "=" * 50 + "\nINVENTORY MENU\n" + "=" * 50 + "\n")
         
-        # Display inventory
-        inventory_system.display_inventory(current_character, all_items)
+        # Display the current page of the inventory
+        page_count = inventory_system.display_inventory(session.character, session.items, page)
+        page = min(page, page_count - 1)
         
         # Show options
-        print("\n1. Use Item")
-        print("2. Equip Weapon")
-        print("3. Equip Armor")
-        print("4. Unequip Weapon")
-        print("5. Unequip Armor")
-        print("6. Drop Item")
-        print("7. Back")
+        sys.stdout.write(INVENTORY_MENU_TEXT)
         
         try:
-            choice = int(input("\nEnter your choice (1-7): "))
+            choice = int(session.ask("\nEnter your choice (1-9): "))
             
             if choice == 1:
                 # Use item
-                item_id = input("Enter item ID to use: ").strip()
-                if item_id in all_items:
+                item_id = session.ask("Enter item ID to use: ").strip()
+                if item_id in session.items:
                     try:
                         message = inventory_system.use_item(
-                            current_character, item_id, all_items[item_id]
+                            session.character, item_id, session.items[item_id]
                         )
                         print(f"✓ {message}")
                     except (ItemNotFoundError, InvalidItemTypeError) as e:
@@ -335,11 +351,11 @@ def view_inventory():
             
             elif choice == 2:
                 # Equip weapon
-                item_id = input("Enter weapon ID to equip: ").strip()
-                if item_id in all_items:
+                item_id = session.ask("Enter weapon ID to equip: ").strip()
+                if item_id in session.items:
                     try:
                         message = inventory_system.equip_weapon(
-                            current_character, item_id, all_items[item_id]
+                            session.character, item_id, session.items[item_id]
                         )
                         print(f"✓ {message}")
                     except (ItemNotFoundError, InvalidItemTypeError, InventoryFullError) as e:
@@ -349,11 +365,11 @@ def view_inventory():
             
             elif choice == 3:
                 # Equip armor
-                item_id = input("Enter armor ID to equip: ").strip()
-                if item_id in all_items:
+                item_id = session.ask("Enter armor ID to equip: ").strip()
+                if item_id in session.items:
                     try:
                         message = inventory_system.equip_armor(
-                            current_character, item_id, all_items[item_id]
+                            session.character, item_id, session.items[item_id]
                         )
                         print(f"✓ {message}")
                     except (ItemNotFoundError, InvalidItemTypeError, InventoryFullError) as e:
@@ -364,7 +380,7 @@ def view_inventory():
             elif choice == 4:
                 # Unequip weapon
                 try:
-                    weapon_id = inventory_system.unequip_weapon(current_character)
+                    weapon_id = inventory_system.unequip_weapon(session.character)
                     if weapon_id:
                         print(f"✓ Unequipped weapon")
                     else:
@@ -375,7 +391,7 @@ def view_inventory():
             elif choice == 5:
                 # Unequip armor
                 try:
-                    armor_id = inventory_system.unequip_armor(current_character)
+                    armor_id = inventory_system.unequip_armor(session.character)
                     if armor_id:
                         print(f"✓ Unequipped armor")
                     else:
@@ -385,9 +401,9 @@ def view_inventory():
             
             elif choice == 6:
                 # Drop item
-                item_id = input("Enter item ID to drop: ").strip()
+                item_id = session.ask("Enter item ID to drop: ").strip()
                 try:
-                    inventory_system.remove_item_from_inventory(current_character, item_id)
+                    inventory_system.remove_item_from_inventory(session.character, item_id)
                     print(f"✓ Dropped {item_id}")
                 except ItemNotFoundError as e:
                     print(f"✗ {e}")
@@ -395,6 +411,20 @@ def view_inventory():
             elif choice == 7:
                 break
             
+            elif choice == 8:
+                # Next page
+                if page + 1 < page_count:
+                    page += 1
+                else:
+                    print("Already on the last page.")
+            
+            elif choice == 9:
+                # Previous page
+                if page > 0:
+                    page -= 1
+                else:
+                    print("Already on the first page.")
+            
             else:
                 print("Invalid choice.")
         
@@ -402,10 +432,8 @@ def view_inventory():
             print("Invalid input.")
 
 
-def quest_menu():
+def quest_menu(session):
     """Quest management menu"""
-    global current_character, all_quests
-    
     # TODO: Implement quest menu
     # Show active, available, completed quests; accept, abandon, complete
     
@@ -423,26 +451,31 @@ def quest_menu():
         print("=" * 50)
         
         try:
-            choice = int(input("\nEnter your choice (1-7): "))
+            choice = int(session.ask("\nEnter your choice (1-7): "))
             
             if choice == 1:
                 # View active quests
-                active = quest_handler.get_active_quests(current_character, all_quests)
+                active = quest_handler.get_active_quests(session.character, session.quests)
                 if active:
                     print("\nActive Quests:")
                     quest_handler.display_quest_list(active)
+                    for quest in active:
+                        for line in quest_tracker.describe_progress(
+                            session.character, quest['quest_id'], session.quests
+                        ):
+                            print(f"  {quest['title']} - {line}")
                 else:
                     print("\nNo active quests.")
             
             elif choice == 2:
                 # View available quests
                 print("\nAvailable Quests:")
-                available = quest_handler.get_available_quests(current_character, all_quests)
+                available = quest_handler.get_available_quests(session.character, session.quests)
                 quest_handler.display_quest_list(available)
             
             elif choice == 3:
                 # View completed quests
-                completed = quest_handler.get_completed_quests(current_character, all_quests)
+                completed = quest_handler.get_completed_quests(session.character, session.quests)
                 if completed:
                     print("\nCompleted Quests:")
                     quest_handler.display_quest_list(completed)
@@ -451,31 +484,31 @@ def quest_menu():
             
             elif choice == 4:
                 # Accept quest
-                quest_id = input("\nEnter quest ID to accept: ").strip()
+                quest_id = session.ask("\nEnter quest ID to accept: ").strip()
                 try:
-                    quest_handler.accept_quest(current_character, quest_id, all_quests)
-                    print(f"✓ Accepted quest: {all_quests[quest_id]['title']}")
+                    quest_handler.accept_quest(session.character, quest_id, session.quests)
+                    print(f"✓ Accepted quest: {session.quests[quest_id]['title']}")
                 except (QuestNotFoundError, InsufficientLevelError, 
                         QuestRequirementsNotMetError, QuestAlreadyCompletedError) as e:
                     print(f"✗ {e}")
             
             elif choice == 5:
                 # Abandon quest
-                quest_id = input("\nEnter quest ID to abandon: ").strip()
+                quest_id = session.ask("\nEnter quest ID to abandon: ").strip()
                 try:
-                    quest_handler.abandon_quest(current_character, quest_id)
+                    quest_handler.abandon_quest(session.character, quest_id)
                     print(f"✓ Abandoned quest")
                 except QuestNotActiveError as e:
                     print(f"✗ {e}")
             
             elif choice == 6:
                 # Complete quest
-                quest_id = input("\nEnter quest ID to complete: ").strip()
+                quest_id = session.ask("\nEnter quest ID to complete: ").strip()
                 try:
-                    result = quest_handler.complete_quest(current_character, quest_id, all_quests)
+                    result = quest_handler.complete_quest(session.character, quest_id, session.quests)
                     print(f"✓ Completed: {result['quest_title']}")
                     print(f"  Rewards: {result['xp_reward']} XP, {result['gold_reward']} Gold")
-                except QuestNotActiveError as e:
+                except (QuestNotActiveError, QuestRequirementsNotMetError) as e:
                     print(f"✗ {e}")
             
             elif choice == 7:
@@ -488,10 +521,8 @@ def quest_menu():
             print("Invalid input.")
 
 
-def explore():
+def explore(session):
     """Find and fight random enemies"""
-    global current_character
-    
     # TODO: Implement exploration
     # Generate enemy, start battle, handle results
     
@@ -500,12 +531,16 @@ def explore():
     print("=" * 50)
     
     # Get random enemy for character level
-    enemy = combat_system.get_random_enemy_for_level(current_character['level'])
+    try:
+        enemy = combat_system.get_random_enemy_for_level(session.character['level'])
+    except InvalidTargetError as e:
+        print(f"✗ {e}")
+        return
     print(f"\nYou encountered a {enemy['name']}!")
     
     # Start battle
     try:
-        battle = combat_system.SimpleBattle(current_character, enemy)
+        battle = combat_system.SimpleBattle(session.character, enemy, input_func=session.input_func)
         result = battle.start_battle()
         
         if result['winner'] == 'player':
@@ -513,77 +548,104 @@ def explore():
             xp_gained = result['xp_gained']
             gold_gained = result['gold_gained']
             
-            current_character['gold'] += gold_gained
-            character_manager.gain_experience(current_character, xp_gained)
+            character_manager.add_gold(session.character, gold_gained)
+            character_manager.gain_experience(session.character, xp_gained)
             
             print(f"\n✓ Victory!")
             print(f"  XP Gained: {xp_gained}")
             print(f"  Gold Gained: {gold_gained}")
-            print(f"  New Level: {current_character['level']}")
+            print(f"  New Level: {session.character['level']}")
+        elif result['winner'] == 'escaped':
+            print("\nYou got away safely.")
         else:
             # Character died
             print(f"\n✗ You were defeated!")
-            current_character['health'] = 0
+            session.character['health'] = 0
     
     except CharacterDeadError as e:
         print(f"✗ {e}")
 
 
-def shop():
+def shop(session):
     """Shop menu for buying/selling items"""
-    global current_character, all_items
-    
     # TODO: Implement shop
     # Show items, gold, options: buy, sell, back
     
+    # Current page and catalog filters
+    page = 0
+    filters = {'item_type': None, 'max_cost': None}
+    
     while True:
-        print("\n" + "=" * 50)
-        print("SHOP")
-        print("=" * 50)
-        print(f"Your Gold: {current_character['gold']}")
-        print("\nShop Items:")
-        for item_id, item in all_items.items():
-            print(f"  {item_id}: {item['name']} - {item['cost']} Gold ({item['type']})")
+        # Only fetch the visible page from the catalog index
+        total = game_data.count_items_by(session.items, **filters)
+        page_count = max(1, (total + SHOP_PAGE_SIZE - 1) // SHOP_PAGE_SIZE)
+        page = min(page, page_count - 1)
+        page_items = game_data.items_by(
+            session.items, offset=page * SHOP_PAGE_SIZE, limit=SHOP_PAGE_SIZE, **filters
+        )
         
-        print("\n1. Buy Item")
-        print("2. Sell Item")
-        print("3. Back")
-        print("=" * 50)
+        # Build the whole screen, then write it once
+        lines = [
+            "\n" + "=" * 50,
+            "SHOP",
+            "=" * 50,
+            f"Your Gold: {session.character['gold']}",
+            f"\nShop Items (page {page + 1}/{page_count}, {total} items):"
+        ]
+        for item in page_items:
+            lines.append(inventory_system.get_item_row(item['item_id'], item, 'shop'))
+        sys.stdout.write("\n".join(lines) + "\n" + SHOP_MENU_TEXT)
         
         try:
-            choice = int(input("\nEnter your choice (1-3): "))
+            choice = int(session.ask("\nEnter your choice (1-6): "))
             
             if choice == 1:
-                # Buy item
-                item_id = input("\nEnter item ID to buy: ").strip()
-                if item_id in all_items:
-                    try:
-                        inventory_system.purchase_item(
-                            current_character, item_id, all_items[item_id]
-                        )
-                        print(f"✓ Purchased {all_items[item_id]['name']}!")
-                    except (InsufficientResourcesError, InventoryFullError) as e:
-                        print(f"✗ {e}")
-                else:
-                    print(f"Item '{item_id}' not found.")
+                # Buy items (one transaction for the whole order)
+                order = inventory_system.parse_item_order(
+                    session.ask("\nEnter items to buy (e.g. health_potion 3, iron_sword): ")
+                )
+                try:
+                    result = inventory_system.purchase_items(session.character, order, session.items)
+                    print(f"✓ Purchased {result['items']} item(s) for {result['gold_spent']} Gold!")
+                except (ItemNotFoundError, InsufficientResourcesError, InventoryFullError) as e:
+                    print(f"✗ {e}")
             
             elif choice == 2:
-                # Sell item
-                item_id = input("\nEnter item ID to sell: ").strip()
-                if item_id in all_items:
-                    try:
-                        gold_received = inventory_system.sell_item(
-                            current_character, item_id, all_items[item_id]
-                        )
-                        print(f"✓ Sold {all_items[item_id]['name']} for {gold_received} Gold!")
-                    except ItemNotFoundError as e:
-                        print(f"✗ {e}")
-                else:
-                    print(f"Item '{item_id}' not found.")
+                # Sell items (one transaction for the whole order)
+                order = inventory_system.parse_item_order(
+                    session.ask("\nEnter items to sell (e.g. health_potion 3, iron_sword): ")
+                )
+                try:
+                    result = inventory_system.sell_items(session.character, order, session.items)
+                    print(f"✓ Sold {result['items']} item(s) for {result['gold_received']} Gold!")
+                except ItemNotFoundError as e:
+                    print(f"✗ {e}")
             
             elif choice == 3:
                 break
             
+            elif choice == 4:
+                # Next page
+                if page + 1 < page_count:
+                    page += 1
+                else:
+                    print("Already on the last page.")
+            
+            elif choice == 5:
+                # Previous page
+                if page > 0:
+                    page -= 1
+                else:
+                    print("Already on the first page.")
+            
+            elif choice == 6:
+                # Filter by type and maximum cost (blank clears a filter)
+                item_type = session.ask("Item type (weapon/armor/consumable, blank for all): ").strip().lower()
+                max_cost = session.ask("Maximum cost (blank for any): ").strip()
+                filters['item_type'] = item_type or None
+                filters['max_cost'] = int(max_cost) if max_cost else None
+                page = 0
+            
             else:
                 print("Invalid choice.")
         
@@ -595,43 +657,37 @@ def shop():
 # HELPER FUNCTIONS
 # ============================================================================
 
-def save_game():
+def save_game(session):
     """Save current game state"""
-    global current_character
-    
     # TODO: Implement save
     # Use character_manager.save_character()
     
     try:
-        character_manager.save_character(current_character)
+        character_manager.save_character(session.character, session.save_directory)
     except Exception as e:
         print(f"Warning: Could not save game: {e}")
 
 
 def load_game_data():
-    """Load all quest and item data from files"""
-    global all_quests, all_items
+    """
+    Load all quest, item, enemy and class progression data from files
     
+    Missing files are replaced with the defaults.
+    
+    Returns: Tuple (quests, items) shared by every game session
+    """
     # TODO: Implement data loading
     # Load quests and items, handle missing files
     
     try:
-        all_quests = game_data.load_quests()
-        all_items = game_data.load_items()
-    except MissingDataFileError:
-        print("Game data files not found. Creating defaults...")
-        game_data.create_default_data_files()
-        all_quests = game_data.load_quests()
-        all_items = game_data.load_items()
+        return game_session.load_catalogs()
     except (InvalidDataFormatError, CorruptedDataError) as e:
         print(f"Error loading game data: {e}")
         raise
 
 
-def handle_character_death():
+def handle_character_death(session):
     """Handle character death"""
-    global current_character, game_running
-    
     # TODO: Implement death handling
     # Display message, offer revive or quit
     
@@ -644,21 +700,21 @@ def handle_character_death():
     
     while True:
         try:
-            choice = int(input("\nEnter your choice (1-2): "))
+            choice = int(session.ask("\nEnter your choice (1-2): "))
             
             if choice == 1:
                 # Revive
-                if current_character['gold'] >= 50:
-                    current_character['gold'] -= 50
-                    character_manager.revive_character(current_character)
+                if session.character['gold'] >= 50:
+                    character_manager.add_gold(session.character, -50)
+                    character_manager.revive_character(session.character)
                     print(f"✓ Revived! Gold spent: 50")
                     break
                 else:
-                    print(f"✗ Not enough gold! (Need 50, have {current_character['gold']})")
+                    print(f"✗ Not enough gold! (Need 50, have {session.character['gold']})")
             
             elif choice == 2:
                 # Quit
-                game_running = False
+                session.running = False
                 break
             
             else:
@@ -678,32 +734,180 @@ def display_welcome():
     print()
 
 # ============================================================================
-# MAIN EXECUTION
+# SCRIPTED MODE
 # ============================================================================
 
-def main():
-    """Main game execution function"""
+def run_script(lines, quests, items, save_directory="data/save_games", autosave=True,
+               recorder=None):
+    """
+    Run scripted commands through game sessions
+    
+    Each line is one command. Blank lines and lines starting with # are
+    skipped. After 'quit' the next command starts a fresh session, so
+    one script can hold many play sessions. If a
+    session_replay.InputLogWriter is given, every command is recorded.
+    
+    Returns: List of (command, output) pairs
+    """
+    session = game_session.GameSession(quests, items, save_directory, autosave)
+    results = []
+    
+    for line in lines:
+        command = line.strip()
+        if not command or command.startswith('#'):
+            continue
+        if not session.running:
+            session = game_session.GameSession(quests, items, save_directory, autosave)
+        if recorder is not None:
+            recorder.write_step(command, session_replay.state_digest(session))
+        results.append((command, session.execute(command)))
+    
+    if recorder is not None:
+        recorder.close(session_replay.state_digest(session))
+    return results
+
+
+def format_script_results(results):
+    """
+    Format script results as a transcript ("> command" then its output)
     
-    # Display welcome message
-    display_welcome()
+    Returns: String
+    """
+    lines = []
+    for command, output in results:
+        lines.append(f"> {command}")
+        if output:
+            lines.append(output)
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+def run_json_lines(input_stream, output_stream, quests, items,
+                   save_directory="data/save_games", autosave=True):
+    """
+    Run commands read as JSON lines, answering each with one JSON line
     
-    # Load game data
+    Each input line is a JSON string ("explore") or an object with a
+    "command" key ({"command": "buy iron_sword 2"}). Each reply is
+    {"command": ..., "output": ..., "state": ...}, or {"error": ...} for
+    a line that isn't valid JSON. After 'quit' the next command starts
+    a fresh session.
+    
+    Returns: Number of commands run
+    """
+    session = game_session.GameSession(quests, items, save_directory, autosave)
+    count = 0
+    
+    for line in input_stream:
+        if not line.strip():
+            continue
+        try:
+            request = json.loads(line)
+            command = request['command'] if isinstance(request, dict) else request
+            if not isinstance(command, str):
+                raise ValueError("command must be a string")
+        except (ValueError, KeyError, TypeError) as e:
+            output_stream.write(json.dumps({'error': f"Bad request: {e}"}) + "\n")
+            continue
+        
+        if not session.running:
+            session = game_session.GameSession(quests, items, save_directory, autosave)
+        output = session.execute(command)
+        reply = {'command': command, 'output': output, 'state': session.state}
+        output_stream.write(json.dumps(reply, ensure_ascii=False) + "\n")
+        count += 1
+    
+    return count
+
+
+def parse_arguments(argv=None):
+    """Parse the command line options"""
+    parser = argparse.ArgumentParser(description="Quest Chronicles")
+    parser.add_argument("--script", metavar="FILE",
+                        help="run commands from FILE ('-' for stdin) instead of the menus")
+    parser.add_argument("--json", action="store_true",
+                        help="read JSON-lines commands from stdin and answer in JSON lines")
+    parser.add_argument("--save-dir", default="data/save_games", help="save game directory")
+    parser.add_argument("--no-autosave", action="store_true",
+                        help="in scripted modes, only save on an explicit 'save'")
+    parser.add_argument("--record", metavar="LOG",
+                        help="record every input line and the random seed to LOG")
+    parser.add_argument("--replay", metavar="LOG",
+                        help="replay a recorded LOG headlessly and report divergence and timing")
+    parser.add_argument("--seed", type=int, help="random seed (recorded sessions pick one if not given)")
+    return parser.parse_args(argv)
+
+
+def run_batch(args):
+    """
+    Run the --script or --json mode
+    
+    Returns: Process exit status
+    """
     try:
-        load_game_data()
-        print("✓ Game data loaded successfully!\n")
+        quests, items = load_game_data()
     except (MissingDataFileError, InvalidDataFormatError, CorruptedDataError) as e:
-        print(f"✗ Error loading game data: {e}")
-        print("Please check your data files and try again.")
-        return
+        print(f"✗ Error loading game data: {e}", file=sys.stderr)
+        return 1
+    autosave = not args.no_autosave
+    
+    if args.json:
+        run_json_lines(sys.stdin, sys.stdout, quests, items, args.save_dir, autosave)
+        return 0
     
-    # Main menu loop
+    try:
+        if args.script == '-':
+            lines = sys.stdin.readlines()
+        else:
+            with open(args.script, 'r') as script_file:
+                lines = script_file.readlines()
+    except OSError as e:
+        print(f"✗ Could not read script: {e}", file=sys.stderr)
+        return 1
+    
+    recorder = None
+    if args.record:
+        seed = session_replay.choose_seed(args.seed)
+        recorder = session_replay.InputLogWriter(args.record, seed, session_replay.COMMANDS_MODE,
+                                                  autosave)
+    elif args.seed is not None:
+        session_replay.choose_seed(args.seed)
+    
+    # Output is buffered and written once at the end
+    results = run_script(lines, quests, items, args.save_dir, autosave, recorder)
+    sys.stdout.write(format_script_results(results))
+    return 0
+
+
+def run_replay(args):
+    """
+    Run the --replay mode
+    
+    Returns: Process exit status (1 if the replay diverged or stopped early)
+    """
+    try:
+        quests, items = load_game_data()
+        report = session_replay.replay_input_log(args.replay, quests, items, args.save_dir)
+    except (OSError, ValueError, GameError) as e:
+        print(f"✗ Could not replay {args.replay}: {e}", file=sys.stderr)
+        return 1
+    
+    print(session_replay.format_replay_report(report))
+    diverged = report['divergences'] or report['final_matches'] is False
+    return 1 if diverged or report['error'] else 0
+
+# ============================================================================
+# MAIN EXECUTION
+# ============================================================================
+
+def play(session):
+    """Run the main menu loop until the player exits"""
     while True:
-        choice = main_menu()
+        choice = main_menu(session)
         
         if choice == 1:
-            new_game()
+            new_game(session)
         elif choice == 2:
-            load_game()
+            load_game(session)
         elif choice == 3:
             print("\nThanks for playing Quest Chronicles!")
             break
@@ -711,5 +915,51 @@ def main():
             print("Invalid choice. Please select 1-3.")
 
 
+def main(argv=None):
+    """
+    Main game execution function
+    
+    Returns: Process exit status (1 if the game data can't be loaded)
+    """
+    args = parse_arguments(argv)
+    if args.replay:
+        return run_replay(args)
+    if args.script or args.json:
+        return run_batch(args)
+    
+    # Display welcome message
+    display_welcome()
+    
+    # Load game data
+    try:
+        quests, items = load_game_data()
+        print("✓ Game data loaded successfully!\n")
+    except (MissingDataFileError, InvalidDataFormatError, CorruptedDataError) as e:
+        print(f"✗ Error loading game data: {e}")
+        print("Please check your data files and try again.")
+        return 1
+    
+    # One session holds the player's state for the whole run
+    session = game_session.GameSession(quests, items, args.save_dir)
+    
+    if not args.record:
+        if args.seed is not None:
+            session_replay.choose_seed(args.seed)
+        play(session)
+        return 0
+    
+    # Log every line typed, with the seed, so the session can be replayed
+    seed = session_replay.choose_seed(args.seed)
+    recorder = session_replay.InputLogWriter(args.record, seed)
+    session.input_func = session_replay.recording_input(session, recorder)
+    try:
+        play(session)
+        recorder.close(session_replay.state_digest(session))
+    finally:
+        recorder.close()
+    print(f"Session recorded to {args.record} (seed {seed})")
+    return 0
+
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
@@ -9,6 +9,11 @@ AI Usage: [Document any AI assistance used]
 This module handles quest management, dependencies, and completion.
 """
 
+import threading
+
+import game_data
+import character_manager
+import quest_tracker
 from custom_exceptions import (
     QuestNotFoundError,
     QuestRequirementsNotMetError,
@@ -17,6 +22,14 @@ from custom_exceptions import (
     InsufficientLevelError
 )
 
+# Maximum number of plain-dictionary characters whose quest frontier is cached
+# (Character records keep their own frontier)
+MAX_CACHED_FRONTIERS = 64
+
+# Cache of quest frontiers for plain dictionaries {id(character): QuestFrontier}
+_frontiers = {}
+_frontiers_lock = threading.Lock()
+
 # ============================================================================
 # QUEST MANAGEMENT
 # ============================================================================
@@ -32,7 +45,8 @@ def accept_quest(character, quest_id, quest_data_dict):
     
     Requirements to accept quest:
     - Character level >= quest required_level
-    - Prerequisite quest completed (if any)
+    - Prerequisite quests completed (if any)
+    - Required item carried and required gold held (if any)
     - Quest not already completed
     - Quest not already active
     
@@ -40,7 +54,7 @@ def accept_quest(character, quest_id, quest_data_dict):
     Raises:
         QuestNotFoundError if quest_id not in quest_data_dict
         InsufficientLevelError if character level too low
-        QuestRequirementsNotMetError if prerequisite not completed
+        QuestRequirementsNotMetError if prerequisite, item or gold missing
         QuestAlreadyCompletedError if quest already done
     """
     # TODO: Implement quest acceptance
@@ -50,28 +64,24 @@ def accept_quest(character, quest_id, quest_data_dict):
     if quest_id not in quest_data_dict:
         raise QuestNotFoundError(f"Quest '{quest_id}' not found")
     
-    quest = quest_data_dict[quest_id]
+    completed = _quest_list(character, 'completed_quests')
+    active = _quest_list(character, 'active_quests')
     
-    if quest_id in character.get('completed_quests', []):
+    if quest_id in completed:
         raise QuestAlreadyCompletedError(f"Quest '{quest_id}' already completed")
     
-    if quest_id in character.get('active_quests', []):
+    if quest_id in active:
         return True
     
-    required_level = quest.get('required_level', 1)
-    if character['level'] < required_level:
-        raise InsufficientLevelError(
-            f"Character level {character['level']} below required {required_level}"
-        )
-    
-    prerequisite = quest.get('prerequisite', 'NONE')
-    if prerequisite != 'NONE':
-        if prerequisite not in character.get('completed_quests', []):
-            raise QuestRequirementsNotMetError(f"Must complete '{prerequisite}' first")
+    # Level, prerequisites, item and gold (compiled when the catalog loads)
+    game_data.get_quest_index(quest_data_dict).requirements[quest_id].check(character)
     
-    if 'active_quests' not in character:
-        character['active_quests'] = []
-    character['active_quests'].append(quest_id)
+    frontier = _cached_frontier(character)
+    tracker = quest_tracker.get_tracker(character, quest_data_dict)
+    active.append(quest_id)
+    if frontier is not None:
+        frontier.accepted(quest_id)
+    tracker.started(quest_id)
     
     return True
 
@@ -93,12 +103,14 @@ def complete_quest(character, quest_id, quest_data_dict):
     Raises:
         QuestNotFoundError if quest_id not in quest_data_dict
         QuestNotActiveError if quest not in active_quests
+        QuestRequirementsNotMetError if the quest's objectives aren't done
     """
     # TODO: Implement quest completion
     # Check quest exists and is active, award rewards, move to completed
     
     # Check if quest is active
-    if quest_id not in character.get('active_quests', []):
+    active = _quest_list(character, 'active_quests')
+    if quest_id not in active:
         raise QuestNotActiveError(f"Quest '{quest_id}' is not active")
     
     # Get quest data
@@ -107,26 +119,37 @@ def complete_quest(character, quest_id, quest_data_dict):
     
     quest = quest_data_dict[quest_id]
     
+    # Objectives (e.g. "kill:goblin:3") must be finished first
+    if not quest_tracker.objectives_complete(character, quest_id, quest_data_dict):
+        progress = "; ".join(quest_tracker.describe_progress(character, quest_id, quest_data_dict))
+        raise QuestRequirementsNotMetError(f"Objectives not complete: {progress}")
+    
     # Get rewards
     xp_reward = quest.get('reward_xp', 0)
     gold_reward = quest.get('reward_gold', 0)
     quest_title = quest.get('title', quest_id)
     
+    # Make sure the running totals exist before this quest is added
+    _ensure_quest_totals(character, quest_data_dict)
+    
     # Award XP (causes leveling if needed)
     if xp_reward > 0:
-        import character_manager
         character_manager.gain_experience(character, xp_reward)
     
     # Award gold
     if gold_reward > 0:
-        import character_manager
         character_manager.add_gold(character, gold_reward)
     
     # Move from active to completed
-    character['active_quests'].remove(quest_id)
-    if 'completed_quests' not in character:
-        character['completed_quests'] = []
-    character['completed_quests'].append(quest_id)
+    completed = _quest_list(character, 'completed_quests')
+    frontier = _cached_frontier(character)
+    active.remove(quest_id)
+    completed.append(quest_id)
+    quest_tracker.quest_stopped(character, quest_id)
+    character['quest_xp_earned'] += xp_reward
+    character['quest_gold_earned'] += gold_reward
+    if frontier is not None:
+        frontier.completed(quest_id)
     
     # Return result
     return {
@@ -145,13 +168,32 @@ def abandon_quest(character, quest_id):
     """
     # TODO: Implement quest abandonment
     
-    if quest_id not in character.get('active_quests', []):
+    active = _quest_list(character, 'active_quests')
+    if quest_id not in active:
         raise QuestNotActiveError(f"Quest '{quest_id}' is not active")
     
-    character['active_quests'].remove(quest_id)
+    frontier = _cached_frontier(character)
+    active.remove(quest_id)
+    if frontier is not None:
+        frontier.abandoned(quest_id)
+    quest_tracker.quest_stopped(character, quest_id)
     return True
 
 
+def _quest_list(character, key):
+    """
+    Get one of a character's quest lists as a QuestList
+    
+    Plain lists (e.g. from characters built as dictionaries) are upgraded
+    once so later membership checks are O(1).
+    """
+    quest_ids = character.get(key)
+    if not isinstance(quest_ids, character_manager.QuestList):
+        quest_ids = character_manager.QuestList(quest_ids or ())
+        character[key] = quest_ids
+    return quest_ids
+
+
 def get_active_quests(character, quest_data_dict):
     """
     Get full data for all active quests
@@ -188,32 +230,18 @@ def get_available_quests(character, quest_data_dict):
     """
     Get quests that character can currently accept
     
-    Available = meets level req + prerequisite done + not completed + not active
+    Available = meets level req + prerequisites done + has required item
+                and gold + not completed + not active
+    
+    Uses the character's quest frontier, so the cost is proportional to
+    the number of quests returned rather than the size of the catalog.
     
     Returns: List of quest dictionaries
     """
     # TODO: Implement available quest search
     
-    available = []
-    
-    for quest_id, quest in quest_data_dict.items():
-        if quest_id in character.get('completed_quests', []):
-            continue
-        if quest_id in character.get('active_quests', []):
-            continue
-        
-        required_level = quest.get('required_level', 1)
-        if character['level'] < required_level:
-            continue
-        
-        prerequisite = quest.get('prerequisite', 'NONE')
-        if prerequisite != 'NONE':
-            if prerequisite not in character.get('completed_quests', []):
-                continue
-        
-        available.append(quest)
-    
-    return available
+    frontier = get_quest_frontier(character, quest_data_dict)
+    return [quest_data_dict[quest_id] for quest_id in frontier.available(character)]
 
 # ============================================================================
 # QUEST TRACKING
@@ -253,24 +281,14 @@ def can_accept_quest(character, quest_id, quest_data_dict):
     if quest_id not in quest_data_dict:
         return False
     
-    quest = quest_data_dict[quest_id]
-    
     if quest_id in character.get('completed_quests', []):
         return False
     
     if quest_id in character.get('active_quests', []):
         return False
     
-    required_level = quest.get('required_level', 1)
-    if character['level'] < required_level:
-        return False
-    
-    prerequisite = quest.get('prerequisite', 'NONE')
-    if prerequisite != 'NONE':
-        if prerequisite not in character.get('completed_quests', []):
-            return False
-    
-    return True
+    requirement = game_data.get_quest_index(quest_data_dict).requirements[quest_id]
+    return requirement.is_met(character)
 
 
 def get_quest_prerequisite_chain(quest_id, quest_data_dict):
@@ -281,36 +299,192 @@ def get_quest_prerequisite_chain(quest_id, quest_data_dict):
     Example: If Quest C requires Quest B, which requires Quest A:
              Returns ["quest_a", "quest_b", "quest_c"]
     
-    Raises: QuestNotFoundError if quest doesn't exist
+    Raises:
+        QuestNotFoundError if quest doesn't exist
+        InvalidDataFormatError if the prerequisites form a cycle
     """
     # TODO: Implement prerequisite chain tracing
     
     if quest_id not in quest_data_dict:
         raise QuestNotFoundError(f"Quest '{quest_id}' not found")
     
-    chain = []
-    current_id = quest_id
-    visited = set()
+    graph = game_data.get_quest_index(quest_data_dict).graph
+    return list(graph.chain(quest_id))
+
+
+def get_quests_unlocked_by(quest_id, quest_data_dict):
+    """
+    Get every quest that completing a quest helps unlock, directly or
+    further down its prerequisite chain
+    
+    Returns: List of quest IDs in prerequisite order
+    Raises: QuestNotFoundError if quest doesn't exist
+    """
+    if quest_id not in quest_data_dict:
+        raise QuestNotFoundError(f"Quest '{quest_id}' not found")
     
-    while current_id is not None:
-        if current_id in visited:
-            break
-        visited.add(current_id)
-        
-        if current_id not in quest_data_dict:
-            break
-        
-        chain.insert(0, current_id)
+    graph = game_data.get_quest_index(quest_data_dict).graph
+    return sorted(graph.descendants(quest_id), key=graph.position.__getitem__)
+
+# ============================================================================
+# QUEST FRONTIER
+# ============================================================================
+
+class QuestFrontier:
+    """
+    Quests one character could accept once their level is high enough
+    
+    The frontier holds every quest whose prerequisites are done and that
+    is neither completed nor active. Quests the character's level already
+    meets are in `ready`; the rest wait in `locked`, bucketed by required
+    level, and move to `ready` the first time the character is seen at
+    that level. accept/complete/abandon update the frontier in place.
+    
+    The stamp records the versions of the character's QuestLists; if the
+    lists are changed outside this module (or replaced), the stamp no
+    longer matches and the frontier is rebuilt.
+    
+    Item and gold requirements change with every purchase, so they're
+    checked when the quests are listed rather than stored here.
+    """
+    
+    __slots__ = ('character', 'index', 'done', 'taken', 'level', 'ready', 'locked', 'stamp')
+    
+    def __init__(self, character, index):
+        """Build the frontier for a character from scratch"""
+        self.character = character
+        self.index = index
+        self.done = set(_quest_list(character, 'completed_quests'))
+        self.taken = set(_quest_list(character, 'active_quests'))
+        self.level = character['level']
+        self.ready = set()
+        self.locked = {}
         
-        quest = quest_data_dict[current_id]
-        prerequisite = quest.get('prerequisite', 'NONE')
+        for quest_id in index.roots:
+            self._offer(quest_id)
+        for completed_id in self.done:
+            for quest_id in index.unlocks.get(completed_id, ()):
+                self._offer(quest_id)
+        self.stamp = self._current_stamp()
+    
+    def _current_stamp(self):
+        # Plain lists have no version, so replacing a QuestList never matches
+        return (getattr(self.character.get('completed_quests'), 'version', None),
+                getattr(self.character.get('active_quests'), 'version', None))
+    
+    def is_current(self):
+        """Check if the character's quest lists match this frontier"""
+        return self.index.is_current(self.index.quests) and self.stamp == self._current_stamp()
+    
+    def _offer(self, quest_id):
+        """Add a quest if its prerequisites are done and it isn't done or taken"""
+        if quest_id in self.done or quest_id in self.taken:
+            return
+        if not self.index.requirements[quest_id].prerequisites_met(self.done):
+            return
+        required_level = self.index.level_of[quest_id]
+        if required_level <= self.level:
+            self.ready.add(quest_id)
+        else:
+            self.locked.setdefault(required_level, set()).add(quest_id)
+    
+    def _withdraw(self, quest_id):
+        """Remove a quest from the frontier wherever it is"""
+        if quest_id in self.ready:
+            self.ready.discard(quest_id)
+        else:
+            bucket = self.locked.get(self.index.level_of.get(quest_id))
+            if bucket is not None:
+                bucket.discard(quest_id)
+    
+    def accepted(self, quest_id):
+        """Update after quest_id moved into active_quests"""
+        self.taken.add(quest_id)
+        self._withdraw(quest_id)
+        self.stamp = self._current_stamp()
+    
+    def completed(self, quest_id):
+        """Update after quest_id moved from active to completed"""
+        self.taken.discard(quest_id)
+        self.done.add(quest_id)
+        for unlocked_id in self.index.unlocks.get(quest_id, ()):
+            self._offer(unlocked_id)
+        self.stamp = self._current_stamp()
+    
+    def abandoned(self, quest_id):
+        """Update after quest_id was removed from active_quests"""
+        self.taken.discard(quest_id)
+        if quest_id in self.index.requirements:
+            self._offer(quest_id)
+        self.stamp = self._current_stamp()
+    
+    def available(self, character):
+        """
+        Get IDs of quests the character can accept now, in catalog order
         
-        if prerequisite == 'NONE':
-            break
+        Returns: List of quest IDs
+        """
+        level = character['level']
+        if level > self.level:
+            for required_level in self.index.levels_in_range(self.level, level):
+                bucket = self.locked.pop(required_level, None)
+                if bucket:
+                    self.ready.update(bucket)
+            self.level = level
+        elif level < self.level:
+            for quest_id in [q for q in self.ready if self.index.level_of[q] > level]:
+                self.ready.discard(quest_id)
+                self.locked.setdefault(self.index.level_of[quest_id], set()).add(quest_id)
+            self.level = level
         
-        current_id = prerequisite
+        requirements = self.index.requirements
+        return [
+            quest_id for quest_id in sorted(self.ready, key=self.index.ordinal.__getitem__)
+            if requirements[quest_id].resources_met(character)
+        ]
+
+
+def _cached_frontier(character):
+    """Get the character's frontier if one is kept and still current"""
+    frontier = getattr(character, '_quest_frontier', None)
+    if frontier is None:
+        with _frontiers_lock:
+            frontier = _frontiers.get(id(character))
+    if frontier is not None and frontier.character is character and frontier.is_current():
+        return frontier
+    return None
+
+
+def _store_frontier(character, frontier):
+    """
+    Keep a character's frontier
     
-    return chain
+    Character records hold their own frontier, so every live character
+    keeps one however many are playing. Plain dictionaries can't, so
+    theirs go in a small cache, evicting the oldest entry if full.
+    """
+    if isinstance(character, character_manager.Character):
+        character._quest_frontier = frontier
+        return
+    with _frontiers_lock:
+        _frontiers.pop(id(character), None)
+        if len(_frontiers) >= MAX_CACHED_FRONTIERS:
+            _frontiers.pop(next(iter(_frontiers)), None)
+        _frontiers[id(character)] = frontier
+
+
+def get_quest_frontier(character, quest_data_dict):
+    """
+    Get the quest frontier for a character, building it if needed
+    
+    Returns: QuestFrontier
+    """
+    index = game_data.get_quest_index(quest_data_dict)
+    frontier = _cached_frontier(character)
+    if frontier is None or frontier.index is not index:
+        frontier = QuestFrontier(character, index)
+        _store_frontier(character, frontier)
+    return frontier
 
 # ============================================================================
 # QUEST STATISTICS
@@ -338,10 +512,22 @@ def get_total_quest_rewards_earned(character, quest_data_dict):
     """
     Calculate total XP and gold earned from completed quests
     
+    Reads the running totals kept by complete_quest; they're only
+    rebuilt from the completed quest list if the character has none yet.
+    
     Returns: Dictionary with 'total_xp' and 'total_gold'
     """
     # TODO: Implement reward calculation
     
+    _ensure_quest_totals(character, quest_data_dict)
+    return {
+        'total_xp': character['quest_xp_earned'],
+        'total_gold': character['quest_gold_earned']
+    }
+
+
+def _sum_quest_rewards(character, quest_data_dict):
+    """Add up the rewards of every completed quest (full scan)"""
     total_xp = 0
     total_gold = 0
     
@@ -351,28 +537,47 @@ def get_total_quest_rewards_earned(character, quest_data_dict):
             total_xp += quest.get('reward_xp', 0)
             total_gold += quest.get('reward_gold', 0)
     
-    return {
-        'total_xp': total_xp,
-        'total_gold': total_gold
-    }
+    return total_xp, total_gold
+
+
+def _ensure_quest_totals(character, quest_data_dict):
+    """Create the running reward totals from the completed list if missing"""
+    if 'quest_xp_earned' not in character or 'quest_gold_earned' not in character:
+        character['quest_xp_earned'], character['quest_gold_earned'] = (
+            _sum_quest_rewards(character, quest_data_dict)
+        )
+
+
+def reconcile_quest_stats(character, quest_data_dict):
+    """
+    Rebuild the running quest reward totals from the completed quest list
+    
+    Call once after loading a save, so totals that are missing or out of
+    step with the save's completed quests (or the current quest catalog)
+    are corrected.
+    
+    Returns: True if the totals had to be changed, False if they matched
+    """
+    total_xp, total_gold = _sum_quest_rewards(character, quest_data_dict)
+    changed = (character.get('quest_xp_earned') != total_xp
+               or character.get('quest_gold_earned') != total_gold)
+    character['quest_xp_earned'] = total_xp
+    character['quest_gold_earned'] = total_gold
+    return changed
 
 
 def get_quests_by_level(quest_data_dict, min_level, max_level):
     """
     Get all quests within a level range
     
-    Returns: List of quest dictionaries
+    Uses the catalog's sorted level index, so the cost is O(log n + k).
+    
+    Returns: List of quest dictionaries, lowest required level first
     """
     # TODO: Implement level filtering
     
-    quests = []
-    
-    for quest_id, quest in quest_data_dict.items():
-        required_level = quest.get('required_level', 1)
-        if min_level <= required_level <= max_level:
-            quests.append(quest)
-    
-    return quests
+    index = game_data.get_quest_index(quest_data_dict)
+    return index.quests_in_level_range(min_level, max_level)
 
 # ============================================================================
 # DISPLAY FUNCTIONS
@@ -397,6 +602,13 @@ def display_quest_info(quest_data):
     if prerequisite != 'NONE':
         print(f"  Prerequisite: {prerequisite}")
     
+    required_item = quest_data.get('required_item', 'NONE')
+    if required_item != 'NONE':
+        print(f"  Item: {required_item}")
+    
+    if quest_data.get('required_gold', 0):
+        print(f"  Gold: {quest_data['required_gold']}")
+    
     print(f"\nRewards:")
     print(f"  Experience: {quest_data.get('reward_xp', 0)} XP")
     print(f"  Gold: {quest_data.get('reward_gold', 0)} Gold")
@@ -467,16 +679,21 @@ def validate_quest_prerequisites(quest_data_dict):
     Validate that all quest prerequisites exist
     
     Checks that every prerequisite (that's not "NONE") refers to a real quest
+    and that no quest depends on itself through a chain of prerequisites
     
     Returns: True if all valid
-    Raises: QuestNotFoundError if invalid prerequisite found
+    Raises:
+        QuestNotFoundError if invalid prerequisite found
+        InvalidDataFormatError if the prerequisites form a cycle
     """
     # TODO: Implement prerequisite validation
     
-    for quest_id, quest in quest_data_dict.items():
-        prerequisite = quest.get('prerequisite', 'NONE')
-        
-        if prerequisite != 'NONE':
+    # Building the quest index compiles every prerequisite expression
+    # and rejects prerequisite cycles
+    index = game_data.get_quest_index(quest_data_dict)
+    
+    for quest_id, requirement in index.requirements.items():
+        for prerequisite in requirement.quest_ids:
             if prerequisite not in quest_data_dict:
                 raise QuestNotFoundError(
                     f"Quest '{quest_id}' has invalid prerequisite '{prerequisite}'"
@@ -0,0 +1,354 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Quest Tracker Module
+
+Name: Charlestone Mayenga
+
+AI Usage: [Document any AI assistance used]
+
+This module tracks progress on quest objectives ("defeat 3 goblins",
+"buy a weapon", "reach level 10"). It listens for EnemyDefeated,
+ItemAcquired and LevelUp game events; each character's tracker only
+wakes the active objectives listening for that kind of event.
+"""
+
+import copy
+import threading
+
+import game_data
+import game_events
+import character_manager
+
+# Maximum number of plain-dictionary characters whose tracker is cached
+# (Character records keep their own tracker)
+MAX_CACHED_TRACKERS = 64
+
+# Cache of quest trackers for plain dictionaries {id(character): QuestTracker}
+_trackers = {}
+_trackers_lock = threading.Lock()
+
+# Objective descriptions for display
+OBJECTIVE_VERBS = {'kill': "Defeat", 'buy': "Buy", 'level': "Reach level"}
+
+# ============================================================================
+# QUEST TRACKER
+# ============================================================================
+
+class QuestProgress(dict):
+    """
+    Objective counts {quest_id: [count per objective]} for one character
+    
+    Saved like a plain dictionary. It also remembers (in memory only)
+    the quest index the counts belong to, so a character whose tracker
+    was dropped gets it rebuilt against its own quest catalog.
+    """
+    
+    __slots__ = ('index',)
+    
+    def __init__(self, counts=(), index=None):
+        super().__init__(counts)
+        self.index = index
+    
+    def __copy__(self):
+        return QuestProgress(self, self.index)
+    
+    def __deepcopy__(self, memo):
+        # Copies share the (read-only) index; only the counts are copied
+        return QuestProgress(copy.deepcopy(dict(self), memo), self.index)
+    
+    def __reduce__(self):
+        # Unpickled records forget the index until get_tracker is called
+        return (QuestProgress, (dict(self),))
+
+
+class QuestTracker:
+    """
+    Objective listeners for one character's active quests
+    
+    listeners maps (event kind, subject) -> [(quest_id, objective number)],
+    so an event only touches the objectives waiting for it. Progress
+    counts live on the character in character['quest_progress'] (a
+    QuestProgress, {quest_id: [count per objective]}) so they are saved
+    with it.
+    
+    Like the quest frontier, the tracker remembers the version of the
+    character's active QuestList and is rebuilt if the list is changed
+    outside quest_handler.
+    """
+    
+    __slots__ = ('character', 'index', 'listeners', 'stamp')
+    
+    def __init__(self, character, index):
+        """Build listeners for every active quest that has objectives"""
+        self.character = character
+        self.index = index
+        self.listeners = {}
+        active = character.get('active_quests')
+        if not isinstance(active, character_manager.QuestList):
+            active = character['active_quests'] = character_manager.QuestList(active or ())
+        progress = character.get('quest_progress')
+        if progress is not None:
+            if not isinstance(progress, QuestProgress):
+                progress = character['quest_progress'] = QuestProgress(progress)
+            progress.index = index
+        for quest_id in active:
+            self._listen(quest_id)
+        self.stamp = self._current_stamp()
+    
+    def _current_stamp(self):
+        return getattr(self.character.get('active_quests'), 'version', None)
+    
+    def is_current(self):
+        """Check if the character's active quests match this tracker"""
+        return self.index.is_current(self.index.quests) and self.stamp == self._current_stamp()
+    
+    def _listen(self, quest_id):
+        """Register a quest's objectives and make sure its counts exist"""
+        objectives = self.index.objectives.get(quest_id)
+        if not objectives:
+            return
+        
+        progress = self.character.get('quest_progress')
+        if progress is None:
+            progress = self.character['quest_progress'] = QuestProgress(index=self.index)
+        counts = progress.get(quest_id)
+        if counts is None or len(counts) != len(objectives):
+            counts = progress[quest_id] = [0] * len(objectives)
+        
+        for position, objective in enumerate(objectives):
+            if objective.kind == 'level':
+                counts[position] = max(counts[position], self.character['level'])
+            for subject in objective.subjects:
+                self.listeners.setdefault((objective.kind, subject), []).append((quest_id, position))
+    
+    def started(self, quest_id):
+        """Update after quest_id was added to active_quests"""
+        self._listen(quest_id)
+        self.stamp = self._current_stamp()
+    
+    def stopped(self, quest_id):
+        """Update after quest_id left active_quests (completed or abandoned)"""
+        for objective in self.index.objectives.get(quest_id, ()):
+            for subject in objective.subjects:
+                key = (objective.kind, subject)
+                remaining = [entry for entry in self.listeners.get(key, ()) if entry[0] != quest_id]
+                if remaining:
+                    self.listeners[key] = remaining
+                else:
+                    self.listeners.pop(key, None)
+        
+        progress = self.character.get('quest_progress')
+        if progress:
+            progress.pop(quest_id, None)
+        self.stamp = self._current_stamp()
+    
+    def record(self, kind, subject, amount):
+        """Apply one event to the objectives listening for it"""
+        entries = self.listeners.get((kind, subject))
+        if not entries:
+            return
+        
+        progress = self.character['quest_progress']
+        for quest_id, position in entries:
+            counts = progress[quest_id]
+            target = self.index.objectives[quest_id][position].target
+            if kind == 'level':
+                counts[position] = max(counts[position], amount)
+            else:
+                counts[position] = min(target, counts[position] + amount)
+
+
+def _cached_tracker(character):
+    """Get the tracker kept for a character, if any"""
+    tracker = getattr(character, '_quest_tracker', None)
+    if tracker is None:
+        with _trackers_lock:
+            tracker = _trackers.get(id(character))
+    if tracker is not None and tracker.character is character:
+        return tracker
+    return None
+
+
+def _store_tracker(character, tracker):
+    """
+    Keep a character's tracker
+    
+    Character records hold their own tracker, so it lives exactly as
+    long as the character. Plain dictionaries can't, so theirs go in a
+    small cache, evicting the oldest entry if full.
+    """
+    if isinstance(character, character_manager.Character):
+        character._quest_tracker = tracker
+        return
+    with _trackers_lock:
+        _trackers.pop(id(character), None)
+        if len(_trackers) >= MAX_CACHED_TRACKERS:
+            _trackers.pop(next(iter(_trackers)), None)
+        _trackers[id(character)] = tracker
+
+
+def _rebuild_tracker(character):
+    """
+    Rebuild a tracker for a character whose progress is tracked but who
+    has no tracker (an evicted dictionary, or a copy of a character)
+    
+    Uses the quest index recorded with the character's progress, as
+    long as its catalog hasn't changed since.
+    
+    Returns: QuestTracker, or None if there's nothing to track
+    """
+    progress = character.get('quest_progress')
+    index = getattr(progress, 'index', None)
+    if not progress or index is None or not index.is_current(index.quests):
+        return None
+    tracker = QuestTracker(character, index)
+    _store_tracker(character, tracker)
+    return tracker
+
+
+def get_tracker(character, quest_data_dict):
+    """
+    Get the objective tracker for a character, building it if needed
+    
+    Call this once after loading a character so events are tracked
+    before the first quest action.
+    
+    Returns: QuestTracker
+    """
+    index = game_data.get_quest_index(quest_data_dict)
+    tracker = _cached_tracker(character)
+    if tracker is None or tracker.index is not index or not tracker.is_current():
+        tracker = QuestTracker(character, index)
+        _store_tracker(character, tracker)
+    return tracker
+
+
+def quest_stopped(character, quest_id):
+    """
+    Stop tracking a quest that left the active list
+    
+    Works without the quest catalog (abandon_quest doesn't get one).
+    """
+    tracker = _cached_tracker(character)
+    if tracker is not None:
+        tracker.stopped(quest_id)
+    else:
+        progress = character.get('quest_progress')
+        if progress:
+            progress.pop(quest_id, None)
+
+# ============================================================================
+# EVENTS
+# ============================================================================
+
+def record_event(character, kind, subject=None, amount=1):
+    """
+    Report something that happened to a character
+    
+    Args:
+        character: The character it happened to
+        kind: 'kill' (subject = enemy type), 'buy' (subject = item ID or
+              item type) or 'level' (amount = the new level)
+        subject: What was killed or bought
+        amount: How many (or the level reached)
+    
+    Does nothing if no active objective is listening for the event.
+    """
+    tracker = _cached_tracker(character)
+    if tracker is None:
+        tracker = _rebuild_tracker(character)
+        if tracker is None:
+            return
+    if not tracker.is_current():
+        tracker = QuestTracker(character, tracker.index)
+        _store_tracker(character, tracker)
+    
+    if subject is not None:
+        subject = subject.lower()
+    tracker.record(kind, subject, amount)
+
+
+def _on_enemy_defeated(event):
+    """Count a won battle toward kill objectives"""
+    record_event(event.character, 'kill', event.enemy_type)
+
+
+def _on_item_acquired(event):
+    """Count a shop purchase toward buy objectives, by item ID and by item type"""
+    if event.source == 'shop':
+        record_event(event.character, 'buy', event.item_id, event.quantity)
+        if event.item_type:
+            record_event(event.character, 'buy', event.item_type, event.quantity)
+
+
+def _on_level_up(event):
+    """Update level objectives with the new level"""
+    record_event(event.character, 'level', amount=event.new_level)
+
+
+game_events.subscribe(game_events.EnemyDefeated, _on_enemy_defeated)
+game_events.subscribe(game_events.ItemAcquired, _on_item_acquired)
+game_events.subscribe(game_events.LevelUp, _on_level_up)
+
+# ============================================================================
+# PROGRESS QUERIES
+# ============================================================================
+
+def objectives_complete(character, quest_id, quest_data_dict):
+    """
+    Check if every objective of a quest has reached its target
+    
+    Quests without objectives are always complete.
+    
+    Returns: True if complete, False otherwise
+    """
+    objectives = game_data.get_quest_index(quest_data_dict).objectives.get(quest_id)
+    if not objectives:
+        return True
+    
+    counts = (character.get('quest_progress') or {}).get(quest_id)
+    if counts is None:
+        return False
+    return all(count >= objective.target for count, objective in zip(counts, objectives))
+
+
+def describe_progress(character, quest_id, quest_data_dict):
+    """
+    Describe a quest's objectives and progress
+    
+    Example: ["Defeat goblin: 1/3"]
+    
+    Returns: List of strings (empty if the quest has no objectives)
+    """
+    objectives = game_data.get_quest_index(quest_data_dict).objectives.get(quest_id, ())
+    counts = (character.get('quest_progress') or {}).get(quest_id) or [0] * len(objectives)
+    
+    lines = []
+    for count, objective in zip(counts, objectives):
+        verb = OBJECTIVE_VERBS[objective.kind]
+        if objective.kind == 'level':
+            lines.append(f"{verb} {objective.target}: {min(count, objective.target)}/{objective.target}")
+        else:
+            subjects = " or ".join(objective.subjects)
+            lines.append(f"{verb} {subjects}: {count}/{objective.target}")
+    return lines
+
+
+# ============================================================================
+# TESTING
+# ============================================================================
+
+if __name__ == "__main__":
+    print("=== QUEST TRACKER TEST ===\n")
+    
+    test_quests = game_data.load_quests()
+    test_char = {'level': 2, 'active_quests': ['goblin_hunter'], 'completed_quests': ['first_steps']}
+    
+    get_tracker(test_char, test_quests)
+    for _ in range(2):
+        record_event(test_char, 'kill', 'goblin')
+    
+    print(f"Progress: {describe_progress(test_char, 'goblin_hunter', test_quests)}")
+    print(f"Complete: {objectives_complete(test_char, 'goblin_hunter', test_quests)}")
+    
+    print("\n=== QUEST TRACKER TESTS COMPLETE ===")
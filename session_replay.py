@@ -0,0 +1,329 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Session Replay Module
+
+Name: Charlestone Mayenga
+
+AI Usage: [Document any AI assistance used]
+
+This module records a play session as a compact input log and replays
+it headlessly against the current code.
+
+A log is JSON lines:
+    {"replay": 1, "mode": "menu", "seed": 12345, "autosave": true}  (header)
+    ["2", "3f9a0c1b2d4e"]       one step per input line
+    {"end": "77b1e0d2c3a4"}     written when the session ends
+
+Each step holds the line the player typed and a digest of the game state
+at the moment the game asked for it. The seed is fed to random.seed()
+before play starts, so enemies, escapes and critical hits come out the
+same on replay. While replaying, each step's digest is recomputed and
+compared, and the time the game spent handling each line is measured.
+
+Modes:
+    'menu'     - input lines typed into main.py's interactive menus
+    'commands' - GameSession commands (main.py --script/--json)
+"""
+
+import io
+import os
+import json
+import time
+import random
+import shutil
+import hashlib
+import tempfile
+import contextlib
+
+import game_session
+
+LOG_VERSION = 1
+
+MENU_MODE = 'menu'
+COMMANDS_MODE = 'commands'
+
+# Number of hex digits kept from each state digest
+DIGEST_LENGTH = 12
+
+# ============================================================================
+# STATE DIGESTS
+# ============================================================================
+
+def state_digest(session):
+    """
+    Summarize the session's game state as a short hash
+    
+    Covers the session state and every character field, so any change
+    to stats, gold, inventory or quests changes the digest.
+    
+    Returns: Hex string of DIGEST_LENGTH characters
+    """
+    snapshot = {'state': session.state, 'character': session.character}
+    if session.battle is not None:
+        snapshot['battle'] = [session.battle.character, session.battle.enemy]
+    text = json.dumps(snapshot, sort_keys=True, default=repr)
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()[:DIGEST_LENGTH]
+
+# ============================================================================
+# RECORDING
+# ============================================================================
+
+class InputLogWriter:
+    """
+    Writes an input log as the session runs
+    
+    Every step is flushed right away, so a session that crashes still
+    leaves a usable log.
+    """
+    
+    def __init__(self, filename, seed, mode=MENU_MODE, autosave=True):
+        self.file = open(filename, 'w', encoding='utf-8')
+        self.steps = 0
+        self._write({'replay': LOG_VERSION, 'mode': mode, 'seed': seed, 'autosave': autosave})
+    
+    def _write(self, record):
+        self.file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.file.flush()
+    
+    def write_step(self, line, digest):
+        """Record one input line and the state digest taken before it"""
+        self._write([line, digest])
+        self.steps += 1
+    
+    def close(self, final_digest=None):
+        """Finish the log (with the final state digest if the session ended)"""
+        if self.file.closed:
+            return
+        if final_digest is not None:
+            self._write({'end': final_digest})
+        self.file.close()
+
+
+def recording_input(session, writer, read=None):
+    """
+    Wrap an input function so every line it returns is logged
+    
+    Install the result as session.input_func.
+    
+    Returns: Function with the same signature as input()
+    """
+    def ask(prompt=""):
+        digest = state_digest(session)
+        line = (read or input)(prompt)
+        writer.write_step(line, digest)
+        return line
+    return ask
+
+
+def choose_seed(seed=None):
+    """
+    Seed the random module for a recorded session
+    
+    Returns: The seed used (a new random one if seed is None)
+    """
+    if seed is None:
+        seed = random.SystemRandom().randrange(2 ** 32)
+    random.seed(seed)
+    return seed
+
+# ============================================================================
+# READING LOGS
+# ============================================================================
+
+def read_input_log(filename):
+    """
+    Read an input log
+    
+    Returns: Dictionary {'seed', 'mode', 'autosave', 'steps': [(line, digest)],
+                         'end': digest or None}
+    Raises: ValueError if the file is not an input log
+    """
+    with open(filename, 'r', encoding='utf-8') as log_file:
+        lines = [line for line in log_file if line.strip()]
+    
+    if not lines:
+        raise ValueError(f"{filename} is empty")
+    header = json.loads(lines[0])
+    if not isinstance(header, dict) or header.get('replay') != LOG_VERSION:
+        raise ValueError(f"{filename} is not a version {LOG_VERSION} input log")
+    
+    log = {'seed': header['seed'], 'mode': header.get('mode', MENU_MODE),
+           'autosave': header.get('autosave', True), 'steps': [], 'end': None}
+    for line in lines[1:]:
+        record = json.loads(line)
+        if isinstance(record, dict):
+            log['end'] = record.get('end')
+        else:
+            log['steps'].append((record[0], record[1]))
+    return log
+
+# ============================================================================
+# REPLAYING
+# ============================================================================
+
+class ReplayInput:
+    """
+    Feeds a log's input lines back to the game and checks each step
+    
+    Attributes:
+        divergences: [(step number, recorded digest, replayed digest)]
+        timings: Seconds the game spent handling each consumed line
+        position: Number of lines consumed so far
+    """
+    
+    def __init__(self, session, steps):
+        self.session = session
+        self.steps = steps
+        self.position = 0
+        self.divergences = []
+        self.timings = []
+        self.resumed_at = None
+    
+    def check(self, step, expected):
+        """Compare the current state with the digest recorded for step"""
+        actual = state_digest(self.session)
+        if actual != expected:
+            self.divergences.append((step, expected, actual))
+    
+    def stop_clock(self):
+        """Charge the time since the last line was handed out to that line"""
+        if self.resumed_at is not None:
+            self.timings.append(time.perf_counter() - self.resumed_at)
+            self.resumed_at = None
+    
+    def __call__(self, prompt=""):
+        self.stop_clock()
+        if self.position >= len(self.steps):
+            raise EOFError("Input log ended before the session did")
+        
+        line, expected = self.steps[self.position]
+        self.check(self.position, expected)
+        self.position += 1
+        self.resumed_at = time.perf_counter()
+        return line
+
+
+def _replay_menu(session, feeder):
+    """Play the interactive menus with input coming from the log"""
+    import main
+    session.input_func = feeder
+    main.play(session)
+
+
+def _replay_commands(session, feeder):
+    """Run the logged commands, starting a fresh session after each quit"""
+    while feeder.position < len(feeder.steps):
+        if not session.running:
+            session = game_session.GameSession(session.quests, session.items,
+                                               session.save_directory, session.autosave)
+            feeder.session = session
+        session.execute(feeder())
+        feeder.stop_clock()
+
+
+def replay_input_log(filename, quests, items, save_directory="data/save_games"):
+    """
+    Replay a recorded session headlessly and report how it went
+    
+    The game runs against a temporary copy of save_directory (so loads
+    see the saved characters and nothing real is overwritten) with all
+    console output discarded.
+    
+    Returns: Dictionary with:
+        'steps': number of input lines in the log
+        'replayed': number of lines the game consumed
+        'divergences': [(step, recorded digest, replayed digest)]
+        'final_matches': True/False, or None if the log has no end record
+        'timings': seconds per consumed line
+        'total_time': seconds for the whole replay
+        'error': description of an exception that stopped the replay, or None
+    Raises: ValueError if the file is not an input log
+    """
+    log = read_input_log(filename)
+    
+    with tempfile.TemporaryDirectory() as workdir:
+        replay_saves = os.path.join(workdir, "save_games")
+        if os.path.isdir(save_directory):
+            shutil.copytree(save_directory, replay_saves)
+        
+        session = game_session.GameSession(quests, items, replay_saves, log['autosave'])
+        feeder = ReplayInput(session, log['steps'])
+        error = None
+        
+        random.seed(log['seed'])
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            try:
+                if log['mode'] == COMMANDS_MODE:
+                    _replay_commands(session, feeder)
+                else:
+                    _replay_menu(session, feeder)
+            except EOFError as e:
+                error = str(e)
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+        feeder.stop_clock()
+        total_time = time.perf_counter() - started
+        
+        final_matches = None
+        if log['end'] is not None:
+            final_matches = state_digest(feeder.session) == log['end']
+    
+    return {
+        'steps': len(log['steps']),
+        'replayed': feeder.position,
+        'divergences': feeder.divergences,
+        'final_matches': final_matches,
+        'timings': feeder.timings,
+        'total_time': total_time,
+        'error': error,
+    }
+
+
+def format_replay_report(report, slowest=5):
+    """
+    Describe a replay report for the console
+    
+    Returns: String
+    """
+    lines = [f"Replayed {report['replayed']}/{report['steps']} steps in {report['total_time']:.3f}s"]
+    
+    if report['error']:
+        lines.append(f"Stopped early: {report['error']}")
+    if report['divergences']:
+        step, expected, actual = report['divergences'][0]
+        lines.append(f"DIVERGED at step {step + 1}: recorded {expected}, replayed {actual} "
+                     f"({len(report['divergences'])} step(s) differ)")
+    elif report['final_matches'] is False:
+        lines.append("DIVERGED: final state differs")
+    else:
+        lines.append("No divergence.")
+    
+    timed = sorted(enumerate(report['timings']), key=lambda entry: entry[1], reverse=True)
+    if timed:
+        lines.append("Slowest steps:")
+        for step, seconds in timed[:slowest]:
+            lines.append(f"  step {step + 1}: {seconds * 1000:.2f} ms")
+    return "\n".join(lines)
+
+
+# ============================================================================
+# TESTING
+# ============================================================================
+
+if __name__ == "__main__":
+    print("=== SESSION REPLAY TEST ===\n")
+    
+    test_quests, test_items = game_session.load_catalogs()
+    with tempfile.TemporaryDirectory() as test_dir:
+        log_path = os.path.join(test_dir, "session.log")
+        test_session = game_session.GameSession(test_quests, test_items, test_dir, autosave=False)
+        writer = InputLogWriter(log_path, choose_seed(), COMMANDS_MODE)
+        for command in ["new Replay Warrior", "explore", "attack", "attack", "stats"]:
+            writer.write_step(command, state_digest(test_session))
+            test_session.execute(command)
+        writer.close(state_digest(test_session))
+        
+        print(format_replay_report(replay_input_log(log_path, test_quests, test_items, test_dir)))
+    
+    print("\n=== SESSION REPLAY TESTS COMPLETE ===")
@@ -0,0 +1,71 @@
+"""
+Test Benchmarks
+Tests the benchmark data generator, runner and comparison
+"""
+
+import pytest
+import sys
+import os
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+import character_manager
+import quest_handler
+import run_benchmarks
+from synthetic_data import SyntheticData
+
+# ============================================================================
+# SYNTHETIC DATA TESTS
+# ============================================================================
+
+def test_synthetic_data_is_valid(tmp_path):
+    """Test that generated files load, and prerequisites form valid chains"""
+    data = SyntheticData(50, str(tmp_path), seed=1)
+    
+    assert len(data.items) == 50
+    assert len(data.quests) == 50
+    assert quest_handler.validate_quest_prerequisites(data.quests)
+    assert len(character_manager.list_saved_characters(data.save_directory)) == 50
+    assert character_manager.load_character("Hero0000049", data.save_directory)['level'] == data.character['level']
+
+def test_synthetic_data_is_deterministic(tmp_path):
+    """Test that the same seed writes the same files"""
+    first = SyntheticData(20, str(tmp_path / "a"), seed=3)
+    second = SyntheticData(20, str(tmp_path / "b"), seed=3)
+    os.makedirs(first.directory)
+    os.makedirs(second.directory)
+    
+    with open(first.quests_file) as a, open(second.quests_file) as b:
+        assert a.read() == b.read()
+
+# ============================================================================
+# RUNNER TESTS
+# ============================================================================
+
+def test_run_benchmarks_records_each_scale():
+    """Test that results hold a measurement per benchmark and scale"""
+    results = run_benchmarks.run_benchmarks(scales=(10,), names=["gain_experience"], repeat=2)
+    measurement = results['results']['gain_experience']['10']
+    
+    assert results['version'] == run_benchmarks.RESULTS_VERSION
+    assert 0 < measurement['best_s'] <= measurement['median_s']
+
+def test_unknown_benchmark_rejected():
+    """Test that an unknown benchmark name raises ValueError"""
+    with pytest.raises(ValueError):
+        run_benchmarks.run_benchmarks(scales=(10,), names=["no_such_benchmark"])
+
+def test_compare_flags_regressions():
+    """Test regression, improvement and new-benchmark statuses"""
+    baseline = {'results': {'a': {'10': {'best_s': 1.0}}, 'b': {'10': {'best_s': 1.0}}}}
+    current = {'results': {'a': {'10': {'best_s': 1.5}}, 'b': {'10': {'best_s': 0.5}},
+                           'c': {'10': {'best_s': 0.1}}}}
+    
+    statuses = {row[0]: row[5] for row in run_benchmarks.compare_results(current, baseline, 0.25)}
+    
+    assert statuses == {'a': 'regression', 'b': 'faster', 'c': 'new'}
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
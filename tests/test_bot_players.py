@@ -0,0 +1,76 @@
+"""
+Test Bot Players
+Tests the synthetic load generator
+"""
+
+import pytest
+import sys
+import os
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import game_data
+import bot_players
+
+@pytest.fixture
+def catalogs():
+    """Default quest and item catalogs"""
+    return game_data.load_quests(), game_data.load_items()
+
+# ============================================================================
+# BOT TESTS
+# ============================================================================
+
+def test_bot_plays_real_flows(catalogs, tmp_path):
+    """Test that a bot creates, saves and reloads a character through commands"""
+    mix = {'explore': 2, 'shop': 1, 'quests': 1, 'reload': 1}
+    bot = bot_players.Bot("Bot00001", *catalogs, str(tmp_path), random.Random(1), mix)
+    bot.play(30)
+    
+    assert bot.timings['create_character']
+    assert bot.timings['start_battle']
+    assert (tmp_path / "Bot00001_save.txt").exists()
+    assert bot.commands >= 31
+
+def test_bot_choices_are_reproducible(catalogs, tmp_path):
+    """Test that the same seed gives the same operations"""
+    # Battles use the game's global random module, so seed it too
+    random.seed(11)
+    first, _ = bot_players.run_bots([1, 2], 20, 'shopper', 7, str(tmp_path / "a"), catalogs)
+    random.seed(11)
+    second, _ = bot_players.run_bots([1, 2], 20, 'shopper', 7, str(tmp_path / "b"), catalogs)
+    
+    assert {op: len(v) for op, v in first.items()} == {op: len(v) for op, v in second.items()}
+
+# ============================================================================
+# REPORT TESTS
+# ============================================================================
+
+def test_percentile_nearest_rank():
+    """Test percentiles on a sorted list"""
+    values = list(range(1, 101))
+    
+    assert bot_players.percentile(values, 50) == 50
+    assert bot_players.percentile(values, 99) == 99
+    assert bot_players.percentile([], 90) == 0.0
+
+def test_load_test_report(tmp_path):
+    """Test a threaded load test reports the key operations"""
+    report = bot_players.run_load_test(bots=4, actions=15, mix='persistence', workers=2,
+                                       seed=3, save_directory=str(tmp_path))
+    
+    assert report['mode'] == 'threads'
+    for operation in ('save_character', 'load_character'):
+        row = report['operations'][operation]
+        assert row['count'] > 0
+        assert row['p50_ms'] <= row['p90_ms'] <= row['p99_ms'] <= row['max_ms']
+    assert "save_character" in bot_players.format_report(report)
+
+def test_unknown_mix_rejected():
+    """Test that an unknown behaviour mix raises ValueError"""
+    with pytest.raises(ValueError):
+        bot_players.run_load_test(bots=1, actions=1, mix='nonsense')
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,146 @@
+"""
+Test Catalog Indexes
+Tests the secondary indexes built over game data catalogs
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+import game_data
+
+# ============================================================================
+# ITEM INDEX TESTS
+# ============================================================================
+
+def test_items_by_type_and_max_cost():
+    """Test filtering items by type and cost through the index"""
+    items = game_data.load_items("data/items.txt")
+    
+    weapons = game_data.items_by(items, item_type='weapon', max_cost=200)
+    
+    assert [item['item_id'] for item in weapons] == ['iron_sword', 'fire_staff']
+    assert game_data.count_items_by(items, item_type='weapon', max_cost=200) == 2
+
+def test_items_by_paging():
+    """Test paging through the catalog with offset and limit"""
+    items = game_data.load_items("data/items.txt")
+    
+    first_page = game_data.items_by(items, offset=0, limit=4)
+    second_page = game_data.items_by(items, offset=4, limit=4)
+    everything = game_data.items_by(items)
+    
+    assert len(everything) == len(items)
+    assert first_page + second_page == everything[:8]
+    assert [item['cost'] for item in everything] == sorted(item['cost'] for item in everything)
+
+def test_items_by_name_prefix():
+    """Test prefix search on item display names"""
+    items = game_data.load_items("data/items.txt")
+    
+    steel = game_data.items_by(items, name_prefix='steel')
+    
+    assert {item['item_id'] for item in steel} == {'steel_sword', 'steel_armor'}
+    assert game_data.items_by(items, name_prefix='steel', item_type='armor')[0]['item_id'] == 'steel_armor'
+
+def test_item_index_rebuilt_when_catalog_changes():
+    """Test that the index notices items added after it was built"""
+    items = game_data.load_items("data/items.txt")
+    items['cheap_dagger'] = {
+        'item_id': 'cheap_dagger', 'name': 'Cheap Dagger', 'type': 'weapon',
+        'effect': 'strength:1', 'cost': 5, 'description': 'Barely sharp'
+    }
+    
+    assert game_data.items_by(items, item_type='weapon', limit=1)[0]['item_id'] == 'cheap_dagger'
+
+def test_invalidate_indexes_after_editing_entries():
+    """Test that in-place edits show up once the catalog is invalidated"""
+    import quest_handler
+    
+    items = game_data.load_items("data/items.txt")
+    quests = game_data.load_quests("data/quests.txt")
+    quest_id = next(iter(quests))
+    game_data.items_by(items, item_type='weapon')
+    quest_handler.get_quests_by_level(quests, 1, 1)
+    
+    items['iron_sword']['cost'] = 1
+    items['steel_sword']['type'] = 'armor'
+    quests[quest_id]['required_level'] = 99
+    game_data.invalidate_indexes(items)
+    game_data.invalidate_indexes(quests)
+    
+    assert game_data.items_by(items, limit=1)[0]['item_id'] == 'iron_sword'
+    assert game_data.count_items_by(items, item_type='armor', name_prefix='steel') == 2
+    assert quests[quest_id] not in quest_handler.get_quests_by_level(quests, 1, 50)
+    assert quest_handler.get_quests_by_level(quests, 99, 99) == [quests[quest_id]]
+
+def test_reload_releases_old_catalog_indexes():
+    """Test that loading a catalog drops the indexes of earlier loads"""
+    old_items = game_data.load_items("data/items.txt")
+    new_items = game_data.load_items("data/items.txt")
+    
+    assert id(old_items) not in game_data._item_indexes
+    assert game_data._item_indexes[id(new_items)].items is new_items
+
+# ============================================================================
+# ENEMY SPAWN INDEX TESTS
+# ============================================================================
+
+def test_load_enemies_level_bands():
+    """Test that enemy level bands and weights are parsed"""
+    enemies = game_data.load_enemies("data/enemies.txt")
+    
+    assert enemies['goblin']['health'] == 50
+    assert (enemies['orc']['min_level'], enemies['orc']['max_level']) == (3, 5)
+    assert enemies['dragon']['max_level'] is None
+    assert all(enemy['spawn_weight'] > 0 for enemy in enemies.values())
+
+def test_spawn_table_respects_bands_and_weights():
+    """Test that spawn tables only draw eligible enemies, by weight"""
+    enemies = {
+        'rat': {'enemy_id': 'rat', 'min_level': 1, 'max_level': 3, 'spawn_weight': 3},
+        'bat': {'enemy_id': 'bat', 'min_level': 1, 'max_level': 3, 'spawn_weight': 1},
+        'wyrm': {'enemy_id': 'wyrm', 'min_level': 4, 'max_level': None, 'spawn_weight': 1}
+    }
+    index = game_data.get_enemy_index(enemies)
+    rng = random.Random(163)
+    
+    draws = [index.spawn_table(2).draw(rng) for _ in range(4000)]
+    
+    assert set(draws) == {'rat', 'bat'}
+    assert 0.70 < draws.count('rat') / len(draws) < 0.80
+    assert index.spawn_table(50).draw(rng) == 'wyrm'
+
+# ============================================================================
+# PROGRESSION INDEX TESTS
+# ============================================================================
+
+def test_load_progression_tables():
+    """Test that progression curves precompute cumulative XP and stats"""
+    progression = game_data.load_progression("data/progression.txt")
+    curve = game_data.get_progression_index(progression).curves['Mage']
+    
+    assert set(progression) == {'Warrior', 'Mage', 'Rogue', 'Cleric'}
+    assert curve.cumulative_xp[1:5] == [0, 100, 300, 600]
+    assert curve.stats_at(1) == (80, 8, 20)
+    assert curve.stats_at(3) == (100, 12, 24)
+
+def test_progression_table_matches_closed_form():
+    """Test that table lookups and the closed form agree at the table edge"""
+    curve = game_data.ProgressionCurve({
+        'class': 'Test', 'base_health': 10, 'base_strength': 1, 'base_magic': 1,
+        'health_per_level': 1, 'strength_per_level': 1, 'magic_per_level': 1,
+        'xp_first_level': 30, 'xp_increase': 7
+    }, table_levels=10)
+    
+    for level in range(1, 14):
+        for experience in range(0, 1500, 11):
+            levels, spent = curve.levels_gained(level, experience)
+            assert spent == curve.xp_to_advance(level, levels) <= experience
+            assert curve.xp_to_advance(level, levels + 1) > experience
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,166 @@
+"""
+Test Character Features
+Tests the compact Character record and progression helpers
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import inventory_system
+from custom_exceptions import InvalidCharacterClassError
+
+# ============================================================================
+# CHARACTER RECORD TESTS
+# ============================================================================
+
+def test_character_dictionary_access():
+    """Test that Character supports dictionary-style access"""
+    char = character_manager.create_character("RecordTest", "Cleric")
+    
+    assert char['gold'] == char.gold == 100
+    char['gold'] += 25
+    assert char.gold == 125
+    assert 'equipped_weapon' not in char
+    assert char.get('equipped_weapon') is None
+    assert character_manager.validate_character_data(char) == True
+
+def test_character_extra_keys_and_copy():
+    """Test unknown keys, copies and equality with plain dictionaries"""
+    char = character_manager.create_character("CopyTest", "Warrior")
+    inventory_system.add_item_to_inventory(char, "iron_sword")
+    inventory_system.equip_weapon(char, "iron_sword", {'type': 'weapon', 'effect': 'defense:2'})
+    
+    assert char['defense'] == 2
+    assert char['equipped_weapon'] == "iron_sword"
+    
+    duplicate = char.copy()
+    duplicate['health'] = 1
+    assert char['health'] == 120
+    assert duplicate.to_dict() == dict(duplicate.items())
+    assert char == char.to_dict()
+
+def test_character_round_trip_through_save(tmp_path):
+    """Test that loading a save returns an equal Character"""
+    char = character_manager.create_character("SaveRecordTest", "Rogue")
+    char['inventory'].append("health_potion")
+    character_manager.save_character(char, str(tmp_path))
+    
+    loaded = character_manager.load_character("SaveRecordTest", str(tmp_path))
+    
+    assert isinstance(loaded, character_manager.Character)
+    assert loaded == char
+
+# ============================================================================
+# QUEST LIST TESTS
+# ============================================================================
+
+def test_quest_list_membership_tracks_changes():
+    """Test that QuestList membership follows every list change"""
+    quests = character_manager.QuestList(['a', 'b', 'a'])
+    
+    quests.remove('a')
+    assert 'a' in quests and quests.count('a') == 1
+    quests.pop()
+    assert 'a' not in quests
+    quests[0] = 'c'
+    quests += ['d']
+    
+    assert quests == ['c', 'd']
+    assert 'b' not in quests and 'c' in quests and 'd' in quests
+
+def test_quest_lists_survive_save_and_load(tmp_path):
+    """Test that quest lists load back as QuestLists"""
+    char = character_manager.create_character("QuestListTest", "Mage")
+    char['completed_quests'].extend(['first_steps', 'goblin_hunter'])
+    character_manager.save_character(char, str(tmp_path))
+    
+    loaded = character_manager.load_character("QuestListTest", str(tmp_path))
+    
+    assert isinstance(loaded['completed_quests'], character_manager.QuestList)
+    assert loaded['completed_quests'] == ['first_steps', 'goblin_hunter']
+    assert 'goblin_hunter' in loaded['completed_quests']
+
+def test_quest_list_deepcopy_keeps_counts():
+    """Test that deep copies of quest lists (and characters) recount"""
+    import copy
+    
+    quests = copy.deepcopy(character_manager.QuestList(['a', 'b']))
+    quests.remove('a')
+    assert 'a' not in quests and quests.count('b') == 1
+    
+    char = character_manager.create_character("CopyTest", "Rogue")
+    char['completed_quests'].extend(['first_steps', 'goblin_hunter'])
+    clone = copy.deepcopy(char)
+    clone['completed_quests'].remove('first_steps')
+    
+    assert 'first_steps' not in clone['completed_quests']
+    assert 'first_steps' in char['completed_quests']
+
+def test_quest_list_pickle_round_trip():
+    """Test that pickled quest lists load back with working membership"""
+    import pickle
+    
+    quests = pickle.loads(pickle.dumps(character_manager.QuestList(['a', 'b', 'a'])))
+    
+    assert isinstance(quests, character_manager.QuestList)
+    assert quests == ['a', 'b', 'a'] and quests.count('a') == 2
+    quests.remove('b')
+    assert 'b' not in quests
+
+# ============================================================================
+# LEVELING TESTS
+# ============================================================================
+
+def test_level_gain_matches_one_level_at_a_time():
+    """Test the closed-form level gain against stepping level by level"""
+    for level in range(1, 12):
+        for experience in range(0, 8000, 37):
+            expected_levels, expected_spent, remaining = 0, 0, experience
+            while remaining >= (level + expected_levels) * 100:
+                remaining -= (level + expected_levels) * 100
+                expected_spent += (level + expected_levels) * 100
+                expected_levels += 1
+            
+            assert character_manager.calculate_level_gain("Warrior", level, experience) == (expected_levels, expected_spent)
+
+def test_huge_experience_grant():
+    """Test that a huge XP grant applies every level's stats at once"""
+    char = character_manager.create_character("Grinder", "Warrior")
+    strength = char['strength']
+    
+    character_manager.gain_experience(char, 10 ** 12)
+    levels = char['level'] - 1
+    
+    assert levels > 100000
+    assert 0 <= char['experience'] < char['level'] * 100
+    assert char['strength'] == strength + 2 * levels
+    assert char['health'] == char['max_health']
+
+def test_progression_file_drives_stats(tmp_path, monkeypatch):
+    """Test that class stats and level-up gains come from the progression file"""
+    progression_file = tmp_path / "progression.txt"
+    progression_file.write_text(
+        "CLASS: Paladin\nBASE_HEALTH: 150\nBASE_STRENGTH: 9\nBASE_MAGIC: 7\n"
+        "HEALTH_PER_LEVEL: 20\nSTRENGTH_PER_LEVEL: 1\nMAGIC_PER_LEVEL: 3\n"
+        "XP_FIRST_LEVEL: 50\nXP_INCREASE: 0\n"
+    )
+    monkeypatch.setattr(character_manager, '_progression', None)
+    character_manager.load_progression(str(progression_file))
+    
+    char = character_manager.create_character("Tank", "Paladin")
+    assert (char['max_health'], char['strength'], char['magic']) == (150, 9, 7)
+    with pytest.raises(InvalidCharacterClassError):
+        character_manager.create_character("Nope", "Warrior")
+    
+    # Flat curve: every level costs 50 XP
+    character_manager.gain_experience(char, 175)
+    assert (char['level'], char['experience']) == (4, 25)
+    assert (char['max_health'], char['strength'], char['magic']) == (210, 12, 16)
+    assert character_manager.get_progression_curve("Paladin").stats_at(4) == (210, 12, 16)
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,127 @@
+"""
+Test Combat Features
+Tests shared enemy templates and per-encounter enemy state
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import combat_system
+from custom_exceptions import InvalidDataFormatError
+
+# ============================================================================
+# ENEMY TEMPLATE TESTS
+# ============================================================================
+
+def test_enemies_share_one_template():
+    """Test that encounters of the same type share their template"""
+    first = combat_system.create_enemy("orc")
+    second = combat_system.create_enemy("ORC")
+    
+    assert first.template is second.template
+    assert first['name'] == "Orc"
+    assert first['health'] == first['max_health'] == 80
+
+def test_enemy_state_is_per_encounter():
+    """Test that damaging one encounter doesn't affect others"""
+    first = combat_system.create_enemy("goblin")
+    second = combat_system.create_enemy("goblin")
+    
+    first['health'] = 5
+    first['strength'] = 99
+    
+    assert second['health'] == 50
+    assert second['strength'] == 8
+    assert combat_system.ENEMY_TEMPLATES['goblin'].strength == 8
+
+def test_battle_copies_enemy_state():
+    """Test that SimpleBattle works on its own copy of the enemy"""
+    char = {'name': 'Hero', 'class': 'Warrior', 'health': 100, 'max_health': 100, 'strength': 15}
+    enemy = combat_system.create_enemy("goblin")
+    battle = combat_system.SimpleBattle(char, enemy)
+    
+    assert battle.enemy == enemy
+    battle.apply_damage(battle.enemy, 20)
+    
+    assert battle.enemy['health'] == 30
+    assert enemy['health'] == 50
+    assert combat_system.get_victory_rewards(enemy) == {'xp': 25, 'gold': 10}
+
+def test_random_enemy_uses_level_bands():
+    """Test that random enemies come from the level's spawn band"""
+    combat_system.load_enemy_templates("data/enemies.txt")
+    
+    low = {combat_system.get_random_enemy_for_level(1)['type'] for _ in range(50)}
+    high = {combat_system.get_random_enemy_for_level(20)['type'] for _ in range(50)}
+    
+    assert low == {'goblin'}
+    assert high == {'dragon'}
+
+def test_shipped_enemies_match_generated_defaults(tmp_path, monkeypatch):
+    """Test that data/enemies.txt holds the same enemies as a regenerated default file"""
+    import game_data
+    
+    shipped = game_data.load_enemies(os.path.abspath("data/enemies.txt"))
+    monkeypatch.chdir(tmp_path)
+    game_data.create_default_data_files()
+    
+    assert game_data.load_enemies("data/enemies.txt") == shipped
+    assert sorted(shipped) == sorted(combat_system.REQUIRED_ENEMY_TYPES)
+
+def enemy_block(enemy_id, min_level, max_level):
+    """One data/enemies.txt block with fixed stats"""
+    return (f"ENEMY_ID: {enemy_id}\nNAME: {enemy_id.title()}\nHEALTH: 50\nSTRENGTH: 8\n"
+            f"MAGIC: 2\nXP_REWARD: 25\nGOLD_REWARD: 10\nMIN_LEVEL: {min_level}\n"
+            f"MAX_LEVEL: {max_level}\nSPAWN_WEIGHT: 1\n")
+
+def test_enemy_file_must_define_required_types(tmp_path):
+    """Test that a file without goblin/orc/dragon keeps the current templates"""
+    path = tmp_path / "enemies.txt"
+    path.write_text(enemy_block("goblin", 1, 2) + "\n" + enemy_block("orc", 3, 5))
+    
+    with pytest.raises(InvalidDataFormatError):
+        combat_system.load_enemy_templates(str(path))
+    
+    assert combat_system.create_enemy("dragon")['name'] == "Dragon"
+
+def test_explore_without_spawns_reports_error(tmp_path, monkeypatch):
+    """Test that exploring past every spawn band is an error, not a crash"""
+    import game_data
+    import game_session
+    
+    path = tmp_path / "enemies.txt"
+    path.write_text("\n".join(enemy_block(e, 1, 5) for e in combat_system.REQUIRED_ENEMY_TYPES))
+    monkeypatch.setattr(combat_system, '_enemy_catalog', None)
+    combat_system.load_enemy_templates(str(path))
+    session = game_session.GameSession(game_data.load_quests(), game_data.load_items(),
+                                       save_directory=str(tmp_path), autosave=False)
+    session.execute("new Wanderer Warrior")
+    session.character['level'] = 10
+    
+    try:
+        assert session.execute("explore") == "✗ No enemies spawn at level 10"
+        assert session.battle is None
+    finally:
+        combat_system.load_enemy_templates("data/enemies.txt")
+
+def test_play_round_without_console(monkeypatch):
+    """Test driving a battle one action at a time with captured output"""
+    char = {'name': 'Hero', 'class': 'Warrior', 'health': 120, 'max_health': 120,
+            'strength': 15, 'magic': 5}
+    lines = []
+    battle = combat_system.SimpleBattle(char, combat_system.create_enemy("goblin"), output=lines.append)
+    
+    assert battle.play_round('attack') is None
+    assert lines[0] == ">>> Hero attacks for 13 damage!"
+    
+    monkeypatch.setattr(combat_system.random, 'random', lambda: 0.0)
+    result = battle.play_round('run')
+    
+    assert result == {'winner': 'escaped', 'xp_gained': 0, 'gold_gained': 0}
+    assert battle.battle_log[-1] == "You escaped from battle!"
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
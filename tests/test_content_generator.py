@@ -0,0 +1,96 @@
+"""
+Test Content Generator
+Tests that generated content is valid, realistic and deterministic
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import game_data
+import quest_handler
+import character_manager
+import inventory_system
+import content_generator
+
+@pytest.fixture
+def content(tmp_path):
+    """A small generated content set"""
+    return content_generator.generate_content(str(tmp_path), 300, 400, 25, seed=5)
+
+# ============================================================================
+# FILE FORMAT TESTS
+# ============================================================================
+
+def test_generated_files_load(content):
+    """Test that game_data and character_manager read every generated file"""
+    items = game_data.load_items(content['items_file'])
+    quests = game_data.load_quests(content['quests_file'])
+    names = character_manager.list_saved_characters(content['save_directory'])
+    
+    assert len(items) == 300
+    assert len(quests) == 400
+    assert quest_handler.validate_quest_prerequisites(quests)
+    assert len(names) == 25
+    for name in names:
+        character_manager.load_character(name, content['save_directory'])
+
+def test_generation_is_deterministic(tmp_path):
+    """Test that the same seed writes identical files and a new seed doesn't"""
+    first = content_generator.generate_content(str(tmp_path / "a"), 50, 50, 5, seed=9)
+    second = content_generator.generate_content(str(tmp_path / "b"), 50, 50, 5, seed=9)
+    third = content_generator.generate_content(str(tmp_path / "c"), 50, 50, 5, seed=10)
+    
+    def read(path):
+        with open(path) as file:
+            return file.read()
+    
+    assert read(first['quests_file']) == read(second['quests_file'])
+    assert read(first['items_file']) == read(second['items_file'])
+    assert read(first['quests_file']) != read(third['quests_file'])
+
+# ============================================================================
+# CONTENT SHAPE TESTS
+# ============================================================================
+
+def test_quest_histories_follow_prerequisites(content):
+    """Test that completed quests are reachable in order and within level"""
+    quests = game_data.load_quests(content['quests_file'])
+    
+    for name in character_manager.list_saved_characters(content['save_directory']):
+        character = character_manager.load_character(name, content['save_directory'])
+        completed = set()
+        for quest_id in character['completed_quests']:
+            quest = quests[quest_id]
+            assert quest['required_level'] <= character['level']
+            groups = game_data.parse_prerequisite_expression(quest['prerequisite'])
+            assert all(any(prerequisite in completed for prerequisite in group) for group in groups)
+            completed.add(quest_id)
+
+def test_characters_match_class_curves():
+    """Test stats, leftover XP and duplicate-heavy inventories"""
+    quests = list(content_generator.generate_quests(200, seed=1))
+    items = [item['item_id'] for item in content_generator.generate_items(100, seed=1)]
+    characters = list(content_generator.generate_characters(
+        20, quests, items, seed=1, inventory_size=inventory_system.MAX_INVENTORY_SIZE))
+    
+    for character in characters:
+        curve = character_manager.get_progression_curve(character['class'])
+        assert curve.stats_at(character['level'])[0] == character['max_health']
+        assert 0 <= character['experience'] < curve.xp_for_level(character['level'])
+        assert len(character['inventory']) == inventory_system.MAX_INVENTORY_SIZE
+        assert len(set(character['inventory'])) <= 6
+
+def test_long_history_on_request():
+    """Test that a requested history length is met when enough quests are reachable"""
+    quests = list(content_generator.generate_quests(2000, seed=2))
+    character = next(content_generator.generate_characters(
+        1, quests, ["health_potion"], seed=2, level=content_generator.MAX_QUEST_LEVEL, history=800))
+    
+    assert len(character['completed_quests']) == 800
+    assert character['quest_xp_earned'] > 0
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,147 @@
+"""
+Test Economy Analytics
+Tests the columnar population loader and vectorized queries
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+np = pytest.importorskip("numpy")
+
+import character_manager
+import economy_analytics
+
+ITEMS = {'health_potion': {}, 'steel_sword': {}, 'iron_sword': {}}
+
+def make_characters():
+    """Create a small population with mixed classes and inventories"""
+    warrior = character_manager.create_character("AnalyticsWarrior", "Warrior")
+    warrior['inventory'] = ['steel_sword', 'health_potion', 'health_potion']
+    mage = character_manager.create_character("AnalyticsMage", "Mage")
+    mage['gold'] = 250
+    mage['inventory'] = ['health_potion']
+    fighter = character_manager.create_character("AnalyticsFighter", "Warrior")
+    fighter['gold'] = 40
+    return [warrior, mage, fighter]
+
+# ============================================================================
+# POPULATION TESTS
+# ============================================================================
+
+def test_population_from_characters():
+    """Test building columnar arrays and item interning"""
+    population = economy_analytics.population_from_characters(make_characters(), ITEMS)
+    
+    assert len(population) == 3
+    assert population.stats.shape == (3, len(economy_analytics.STAT_COLUMNS))
+    assert population.item_ids[:3] == list(ITEMS)
+    assert list(economy_analytics.item_counts_for(population, 'health_potion')) == [2, 1, 0]
+
+def test_item_ownership_queries():
+    """Test owner and unit counts across the population"""
+    population = economy_analytics.population_from_characters(make_characters(), ITEMS)
+    
+    assert economy_analytics.count_owners(population, 'steel_sword') == 1
+    assert economy_analytics.count_owners(population, 'health_potion') == 2
+    assert economy_analytics.count_owners(population, 'iron_sword') == 0
+    assert economy_analytics.total_units_by_item(population)['health_potion'] == 3
+
+def test_totals_by_class():
+    """Test vectorized aggregates grouped by class"""
+    population = economy_analytics.population_from_characters(make_characters(), ITEMS)
+    
+    assert economy_analytics.total_by_class(population, 'gold') == {'Warrior': 140, 'Mage': 250}
+    assert economy_analytics.count_by_class(population) == {'Warrior': 2, 'Mage': 1}
+    assert economy_analytics.stat_summary(population, 'gold')['max'] == 250
+
+def test_load_population_from_save_directory(tmp_path):
+    """Test loading a population straight from save files"""
+    for character in make_characters():
+        character_manager.save_character(character, str(tmp_path))
+    
+    population = economy_analytics.load_population(str(tmp_path), ITEMS)
+    
+    assert sorted(population.names) == ["AnalyticsFighter", "AnalyticsMage", "AnalyticsWarrior"]
+    assert economy_analytics.total_units_by_item(population)['health_potion'] == 3
+
+# ============================================================================
+# QUEST TARGETING TESTS
+# ============================================================================
+
+QUESTS = {
+    'intro': {'quest_id': 'intro', 'required_level': 1, 'prerequisite': 'NONE'},
+    'sequel': {'quest_id': 'sequel', 'required_level': 1, 'prerequisite': 'intro'},
+    'finale': {'quest_id': 'finale', 'required_level': 5, 'prerequisite': 'sequel'}
+}
+
+def test_quest_bitsets_match_character_lists():
+    """Test that quest bits mirror each character's quest lists"""
+    warrior, mage, fighter = make_characters()
+    warrior['completed_quests'].append('intro')
+    mage['active_quests'].append('intro')
+    fighter['completed_quests'].extend(['intro', 'sequel', 'unlisted'])
+    
+    population = economy_analytics.population_from_characters([warrior, mage, fighter], ITEMS, QUESTS)
+    
+    assert population.quest_ids == ['intro', 'sequel', 'finale', 'unlisted']
+    assert list(economy_analytics.has_completed(population, 'intro')) == [True, False, True]
+    assert list(economy_analytics.has_active(population, 'intro')) == [False, True, False]
+    assert list(economy_analytics.has_completed(population, 'unlisted')) == [False, False, True]
+
+def test_can_accept_mask_matches_quest_handler():
+    """Test vectorized eligibility against can_accept_quest"""
+    import quest_handler
+    
+    warrior, mage, fighter = make_characters()
+    warrior['completed_quests'].append('intro')
+    mage['active_quests'].append('intro')
+    fighter['completed_quests'].extend(['intro', 'sequel'])
+    fighter['level'] = 5
+    characters = [warrior, mage, fighter]
+    population = economy_analytics.population_from_characters(characters, ITEMS, QUESTS)
+    
+    for quest_id in QUESTS:
+        expected = [quest_handler.can_accept_quest(char, quest_id, QUESTS) for char in characters]
+        assert list(economy_analytics.can_accept_mask(population, quest_id, QUESTS)) == expected
+    
+    assert economy_analytics.characters_who_can_accept(population, 'finale', QUESTS) == ["AnalyticsFighter"]
+
+# ============================================================================
+# EXPERIENCE GRANT TESTS
+# ============================================================================
+
+def test_grant_experience_matches_gain_experience():
+    """Test the vectorized XP grant against gain_experience per character"""
+    characters = make_characters()
+    characters[1]['level'] = 4
+    characters[2]['experience'] = 90
+    population = economy_analytics.population_from_characters(characters, ITEMS)
+    amounts = np.array([50, 1234, 10 ** 9])
+    
+    gained = economy_analytics.grant_experience(population, amounts)
+    
+    for row, (char, amount) in enumerate(zip(characters, amounts)):
+        level = char['level']
+        character_manager.gain_experience(char, int(amount))
+        assert gained[row] == char['level'] - level
+        for column, stat_name in enumerate(economy_analytics.STAT_COLUMNS):
+            assert population.stats[row, column] == char[stat_name]
+
+def test_grant_experience_unknown_class_uses_default_curve():
+    """Test that a class without a progression curve levels up like gain_experience"""
+    characters = make_characters()
+    characters[0]['class'] = "Bard"
+    population = economy_analytics.population_from_characters(characters, ITEMS)
+    
+    gained = economy_analytics.grant_experience(population, 450)
+    
+    character_manager.gain_experience(characters[0], 450)
+    assert gained[0] == characters[0]['level'] - 1 > 0
+    for column, stat_name in enumerate(economy_analytics.STAT_COLUMNS):
+        assert population.stats[0, column] == characters[0][stat_name]
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,126 @@
+"""
+Test Game Events
+Tests the event bus and the events published by game modules
+"""
+
+import pytest
+import sys
+import os
+import asyncio
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import game_events
+import character_manager
+import inventory_system
+import quest_handler
+import quest_tracker
+
+SHOP_ITEMS = {
+    'iron_sword': {'item_id': 'iron_sword', 'name': 'Iron Sword', 'type': 'weapon', 'cost': 100}
+}
+
+@pytest.fixture
+def gold_events():
+    """Collect GoldChanged events for the duration of a test"""
+    received = []
+    game_events.subscribe(game_events.GoldChanged, received.append)
+    yield received
+    game_events.unsubscribe(game_events.GoldChanged, received.append)
+
+# ============================================================================
+# BUS TESTS
+# ============================================================================
+
+def test_publish_by_exact_type(gold_events):
+    """Test that subscribers only get their own event type"""
+    char = {'name': 'Test'}
+    
+    game_events.publish(game_events.GoldChanged(char, 10, 110))
+    game_events.publish(game_events.LevelUp(char, 1, 2))
+    
+    assert len(gold_events) == 1
+    assert gold_events[0].amount == 10 and gold_events[0].character is char
+
+def test_handlers_changing_subscriptions_during_publish():
+    """Test that an event reaches exactly the handlers subscribed when it was published"""
+    calls = []
+    
+    def late(event):
+        calls.append('late')
+    
+    def second(event):
+        calls.append('second')
+    
+    def first(event):
+        calls.append('first')
+        game_events.unsubscribe(game_events.LevelUp, first)
+        game_events.subscribe(game_events.LevelUp, late)
+    
+    game_events.subscribe(game_events.LevelUp, first)
+    game_events.subscribe(game_events.LevelUp, second)
+    try:
+        game_events.publish(game_events.LevelUp({'name': 'Test'}, 1, 2))
+        assert calls == ['first', 'second']
+        
+        game_events.publish(game_events.LevelUp({'name': 'Test'}, 2, 3))
+        assert calls == ['first', 'second', 'second', 'late']
+    finally:
+        for handler in (first, second, late):
+            game_events.unsubscribe(game_events.LevelUp, handler)
+
+def test_publish_later_flush_order(gold_events):
+    """Test that queued events are delivered in order on flush"""
+    char = {'name': 'Test'}
+    for amount in (1, 2, 3):
+        game_events.publish_later(game_events.GoldChanged(char, amount, amount))
+    
+    assert gold_events == []
+    assert game_events.flush() == 3
+    assert [event.amount for event in gold_events] == [1, 2, 3]
+
+def test_deliver_pending_batches(gold_events):
+    """Test that the async delivery empties the queue in batches"""
+    char = {'name': 'Test'}
+    for amount in range(25):
+        game_events.publish_later(game_events.GoldChanged(char, amount, amount))
+    
+    delivered = asyncio.run(game_events.deliver_pending(batch_size=10))
+    
+    assert delivered == 25
+    assert [event.amount for event in gold_events] == list(range(25))
+
+# ============================================================================
+# PUBLISHER TESTS
+# ============================================================================
+
+def test_gold_changes_are_published(gold_events):
+    """Test that add_gold and the shop publish GoldChanged"""
+    char = {'name': 'Test', 'inventory': [], 'gold': 150}
+    
+    character_manager.add_gold(char, 50)
+    inventory_system.purchase_item(char, 'iron_sword', SHOP_ITEMS['iron_sword'])
+    
+    assert [(event.amount, event.gold) for event in gold_events] == [(50, 200), (-100, 100)]
+
+def test_level_up_event_updates_objectives():
+    """Test that a LevelUp event moves a level objective forward"""
+    quests = {
+        'grow_up': {'quest_id': 'grow_up', 'required_level': 1, 'prerequisite': 'NONE',
+                    'objective': 'level:3'}
+    }
+    received = []
+    game_events.subscribe(game_events.LevelUp, received.append)
+    char = character_manager.create_character("Eventful", "Warrior")
+    quest_handler.accept_quest(char, 'grow_up', quests)
+    assert char['quest_progress'] == {'grow_up': [1]}
+    
+    character_manager.gain_experience(char, 300)
+    game_events.unsubscribe(game_events.LevelUp, received.append)
+    
+    assert [(event.old_level, event.new_level) for event in received] == [(1, char['level'])]
+    assert char['quest_progress'] == {'grow_up': [char['level']]}
+    assert quest_tracker.objectives_complete(char, 'grow_up', quests)
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
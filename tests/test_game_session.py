@@ -0,0 +1,284 @@
+"""
+Test Game Session
+Tests the per-player command interface and the local game server
+"""
+
+import pytest
+import sys
+import os
+import asyncio
+import io
+import json
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import game_data
+import game_session
+import game_server
+
+@pytest.fixture
+def catalogs():
+    """Load the shipped quest and item catalogs"""
+    return game_data.load_quests("data/quests.txt"), game_data.load_items("data/items.txt")
+
+# ============================================================================
+# SESSION TESTS
+# ============================================================================
+
+def test_session_commands_follow_state(catalogs, tmp_path):
+    """Test that commands are only allowed in the right state"""
+    session = game_session.GameSession(*catalogs, save_directory=str(tmp_path))
+    
+    assert "No character loaded" in session.execute("stats")
+    assert "Created Hero the Warrior" in session.execute("new Hero warrior")
+    assert "Level 1" in session.execute("stats")
+    assert "Unknown command" in session.execute("dance")
+    assert os.path.exists(tmp_path / "Hero_save.txt")
+
+def test_session_rejects_unsafe_names(catalogs, tmp_path):
+    """Test that names can't point save files outside the save directory"""
+    import character_manager
+    from custom_exceptions import InvalidCharacterNameError
+    
+    save_dir = tmp_path / "saves"
+    session = game_session.GameSession(*catalogs, save_directory=str(save_dir))
+    (tmp_path / "outside_save.txt").write_text("NAME: outside\n")
+    
+    for name in ("../escaped", "a/b", "..", "/tmp/x", "x" * 40):
+        assert session.execute(f"new {name} Warrior").startswith("✗ Invalid character name")
+        assert session.character is None
+    assert "Invalid character name" in session.execute("load ../outside")
+    assert not os.path.exists(tmp_path / "escaped_save.txt")
+    
+    with pytest.raises(InvalidCharacterNameError):
+        character_manager.delete_character("../outside", str(save_dir))
+    assert os.path.exists(tmp_path / "outside_save.txt")
+
+def test_session_shop_and_quests(catalogs, tmp_path):
+    """Test buying items and accepting quests through commands"""
+    session = game_session.GameSession(*catalogs, save_directory=str(tmp_path))
+    session.execute("new Shopper Mage")
+    
+    assert "Purchased 3 item(s) for 75 Gold" in session.execute("buy health_potion 3")
+    assert session.character['gold'] == 25
+    assert "Accepted quest" in session.execute("accept first_steps")
+    assert "first_steps" in session.execute("quests active")
+    
+    session.execute("quit")
+    assert not session.running
+    
+    reloaded = game_session.GameSession(*catalogs, save_directory=str(tmp_path))
+    assert "Loaded Shopper" in reloaded.execute("load Shopper")
+    assert reloaded.character['inventory'].count('health_potion') == 3
+
+def test_session_battle_round_by_round(catalogs, tmp_path):
+    """Test that a battle is fought one command at a time"""
+    session = game_session.GameSession(*catalogs, save_directory=str(tmp_path), autosave=False)
+    session.execute("new Fighter Warrior")
+    
+    output = session.execute("explore")
+    assert "Battle started" in output
+    assert session.state == game_session.IN_BATTLE
+    assert "in a battle" in session.execute("shop")
+    
+    for _ in range(100):
+        if session.battle is None:
+            break
+        session.execute("attack")
+    
+    assert session.battle is None
+    assert session.state in (game_session.PLAYING, game_session.DEAD)
+
+def test_main_menus_use_session_state(catalogs, tmp_path, monkeypatch, capsys):
+    """Test that main's menu functions work on the session they are given"""
+    import main
+    import character_manager
+    
+    session = game_session.GameSession(*catalogs, save_directory=str(tmp_path))
+    session.begin(character_manager.create_character("MenuHero", "Rogue"))
+    answers = iter(["1", "health_potion 2", "3"])
+    monkeypatch.setattr("builtins.input", lambda prompt="": next(answers))
+    
+    main.shop(session)
+    main.view_character_stats(session)
+    main.save_game(session)
+    
+    assert session.character['gold'] == 50
+    assert "Name: MenuHero" in capsys.readouterr().out
+    assert os.path.exists(tmp_path / "MenuHero_save.txt")
+
+# ============================================================================
+# SCRIPTED MODE TESTS
+# ============================================================================
+
+def test_run_script_runs_many_sessions(catalogs, tmp_path):
+    """Test scripted commands, comments, and a fresh session after quit"""
+    import main
+    
+    script = [
+        "# first player",
+        "new Scripted Warrior",
+        "",
+        "buy health_potion 2",
+        "quit",
+        "new Other Mage",
+        "stats",
+    ]
+    results = main.run_script(script, *catalogs, save_directory=str(tmp_path), autosave=False)
+    
+    assert [command for command, _ in results] == [
+        "new Scripted Warrior", "buy health_potion 2", "quit", "new Other Mage", "stats"]
+    assert "Purchased 2" in results[1][1]
+    assert "Other the Mage" in results[4][1]
+    
+    transcript = main.format_script_results(results)
+    assert transcript.startswith("> new Scripted Warrior\n")
+
+def test_json_lines_mode(catalogs, tmp_path):
+    """Test JSON-lines requests and replies, including a bad line"""
+    import main
+    
+    requests = io.StringIO('"new Jay Cleric"\n{"command": "stats"}\nnot json\n')
+    replies = io.StringIO()
+    
+    count = main.run_json_lines(requests, replies, *catalogs,
+                                save_directory=str(tmp_path), autosave=False)
+    lines = [json.loads(line) for line in replies.getvalue().splitlines()]
+    
+    assert count == 2
+    assert lines[0]['state'] == game_session.PLAYING
+    assert "Jay the Cleric" in lines[1]['output']
+    assert 'error' in lines[2]
+
+def test_main_script_option(catalogs, tmp_path, capsys):
+    """Test python main.py --script FILE writes the transcript"""
+    import main
+    
+    script = tmp_path / "actions.txt"
+    script.write_text("new FileHero Rogue\nsave\n")
+    
+    status = main.main(["--script", str(script), "--save-dir", str(tmp_path)])
+    
+    assert status == 0
+    assert "> save" in capsys.readouterr().out
+    assert (tmp_path / "FileHero_save.txt").exists()
+
+def test_main_exit_status_on_data_error(tmp_path, monkeypatch, capsys):
+    """Test that main() returns 1 when the game data can't be loaded, and 0 after a normal game"""
+    import main
+    from custom_exceptions import MissingDataFileError
+    
+    def missing():
+        raise MissingDataFileError("quests.txt not found")
+    
+    monkeypatch.setattr(main, 'load_game_data', missing)
+    assert main.main(["--save-dir", str(tmp_path)]) == 1
+    assert "Error loading game data" in capsys.readouterr().out
+    
+    monkeypatch.setattr(main, 'load_game_data', lambda: ({}, {}))
+    monkeypatch.setattr('builtins.input', lambda prompt="": "3")
+    assert main.main(["--save-dir", str(tmp_path)]) == 0
+
+# ============================================================================
+# SERVER TESTS
+# ============================================================================
+
+async def send(connection, command):
+    """Send one command to the server and read the reply"""
+    reader, writer = connection
+    writer.write((command + "\n").encode())
+    return await game_server.read_reply(reader)
+
+def test_server_sessions_are_independent(catalogs, tmp_path):
+    """Test two connections each getting their own character"""
+    async def scenario():
+        server = game_server.GameServer(*catalogs, save_directory=str(tmp_path))
+        await server.start(port=0)
+        
+        first = await asyncio.open_connection("127.0.0.1", server.port)
+        second = await asyncio.open_connection("127.0.0.1", server.port)
+        welcome = await game_server.read_reply(first[0])
+        await game_server.read_reply(second[0])
+        
+        await send(first, "new Alpha Warrior")
+        await send(second, "new Beta Mage")
+        replies = [welcome, await send(first, "stats"), await send(second, "stats")]
+        replies.append(await send(first, "quit"))
+        
+        second[1].close()
+        server.server.close()
+        await server.server.wait_closed()
+        return replies
+    
+    welcome, first_stats, second_stats, goodbye = asyncio.run(scenario())
+    
+    assert "Welcome" in welcome
+    assert "Alpha the Warrior" in first_stats
+    assert "Beta the Mage" in second_stats
+    assert goodbye == "Goodbye!"
+
+def test_server_survives_failing_and_slow_commands(catalogs, tmp_path, monkeypatch):
+    """Test that a failing command gets an error reply and a slow one doesn't block others"""
+    import time
+    
+    def boom(session, argument):
+        session.say("Partial output")
+        raise RuntimeError("disk on fire")
+    
+    def nap(session, argument):
+        time.sleep(0.5)
+        session.say("Rested")
+    
+    any_state = game_session.COMMANDS['help'][1]
+    monkeypatch.setitem(game_session.COMMANDS, 'boom', (boom, any_state, False))
+    monkeypatch.setitem(game_session.COMMANDS, 'nap', (nap, any_state, False))
+    
+    async def scenario():
+        server = game_server.GameServer(*catalogs, save_directory=str(tmp_path))
+        await server.start(port=0)
+        first = await asyncio.open_connection("127.0.0.1", server.port)
+        second = await asyncio.open_connection("127.0.0.1", server.port)
+        await game_server.read_reply(first[0])
+        await game_server.read_reply(second[0])
+        
+        failed = await send(first, "boom")
+        after = await send(first, "new Survivor Rogue")
+        
+        started = time.perf_counter()
+        napping = asyncio.ensure_future(send(first, "nap"))
+        await asyncio.sleep(0.05)
+        await send(second, "help")
+        quick = time.perf_counter() - started
+        rested = await napping
+        
+        for _, writer in (first, second):
+            writer.close()
+        server.server.close()
+        await server.server.wait_closed()
+        return failed, after, quick, rested
+    
+    failed, after, quick, rested = asyncio.run(scenario())
+    
+    assert failed == "Partial output\n✗ Error: disk on fire"
+    assert "Created Survivor the Rogue" in after
+    assert quick < 0.4
+    assert rested == "Rested"
+
+def test_server_refuses_remote_hosts(catalogs):
+    """Test that the server only binds to localhost"""
+    server = game_server.GameServer(*catalogs)
+    
+    with pytest.raises(ValueError):
+        asyncio.run(server.start(host="0.0.0.0", port=0))
+
+def test_reply_framing_round_trip():
+    """Test dot-stuffing of reply lines"""
+    async def scenario():
+        reader = asyncio.StreamReader()
+        reader.feed_data(game_server.frame_reply("first\n.hidden\n."))
+        return await game_server.read_reply(reader)
+    
+    assert asyncio.run(scenario()) == "first\n.hidden\n."
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
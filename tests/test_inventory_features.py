@@ -0,0 +1,107 @@
+"""
+Test Inventory Features
+Tests inventory display paging and shop helpers
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import inventory_system
+from custom_exceptions import InsufficientResourcesError, InventoryFullError, ItemNotFoundError
+
+SHOP_ITEMS = {
+    'health_potion': {'item_id': 'health_potion', 'name': 'Health Potion', 'type': 'consumable', 'cost': 25},
+    'iron_sword': {'item_id': 'iron_sword', 'name': 'Iron Sword', 'type': 'weapon', 'cost': 100}
+}
+
+# ============================================================================
+# DISPLAY TESTS
+# ============================================================================
+
+def test_display_inventory_pages():
+    """Test that only the requested page of items is rendered"""
+    char = {'inventory': [f"item_{i:02d}" for i in range(15)]}
+    items = {f"item_{i:02d}": {'name': f"Item {i:02d}", 'type': 'consumable'} for i in range(15)}
+    
+    first = inventory_system.render_inventory(char, items, page=0, page_size=10)
+    second = inventory_system.render_inventory(char, items, page=1, page_size=10)
+    
+    assert "Item 00" in first and "Item 10" not in first
+    assert "Item 10" in second and "Item 00" not in second
+    assert "Page 2/2" in second
+    assert inventory_system.get_inventory_page_count(char, page_size=10) == 2
+
+def test_display_inventory_single_write(capsys):
+    """Test that display_inventory writes counts and equipment"""
+    char = {'inventory': ['health_potion', 'health_potion'], 'equipped_weapon': 'iron_sword'}
+    items = {
+        'health_potion': {'name': 'Health Potion', 'type': 'consumable'},
+        'iron_sword': {'name': 'Iron Sword', 'type': 'weapon'}
+    }
+    
+    pages = inventory_system.display_inventory(char, items)
+    output = capsys.readouterr().out
+    
+    assert pages == 1
+    assert "Health Potion (consumable) x2" in output
+    assert "Weapon: Iron Sword" in output
+
+def test_item_row_reflects_item_changes():
+    """Test that rows always show the item's current name and cost"""
+    item = {'name': 'Old Name', 'type': 'weapon', 'cost': 10}
+    
+    assert inventory_system.get_item_row('row_test', item, 'shop') == "  row_test: Old Name - 10 Gold (weapon)"
+    
+    item['name'] = 'New Name'
+    item['cost'] = 12
+    assert inventory_system.get_item_row('row_test', item, 'shop') == "  row_test: New Name - 12 Gold (weapon)"
+    assert inventory_system.get_item_row('row_test', item) == "  • New Name (weapon)"
+
+# ============================================================================
+# BULK SHOP TESTS
+# ============================================================================
+
+def test_purchase_items_bulk():
+    """Test buying several items in one transaction"""
+    char = {'inventory': [], 'gold': 300}
+    
+    result = inventory_system.purchase_items(
+        char, [('health_potion', 3), ('iron_sword', 1), ('health_potion', 1)], SHOP_ITEMS
+    )
+    
+    assert result == {'items': 5, 'gold_spent': 200}
+    assert char['gold'] == 100
+    assert inventory_system.count_item(char, 'health_potion') == 4
+
+def test_purchase_items_all_or_nothing():
+    """Test that a failed bulk purchase changes nothing"""
+    char = {'inventory': [], 'gold': 100}
+    
+    with pytest.raises(InsufficientResourcesError):
+        inventory_system.purchase_items(char, [('health_potion', 2), ('iron_sword', 1)], SHOP_ITEMS)
+    
+    char['gold'] = 10000
+    with pytest.raises(InventoryFullError):
+        inventory_system.purchase_items(char, [('health_potion', 21)], SHOP_ITEMS)
+    
+    assert char == {'inventory': [], 'gold': 10000}
+
+def test_sell_items_bulk():
+    """Test selling several items at once, all or nothing"""
+    char = {'inventory': ['health_potion', 'iron_sword', 'health_potion'], 'gold': 0}
+    
+    with pytest.raises(ItemNotFoundError):
+        inventory_system.sell_items(char, [('health_potion', 3)], SHOP_ITEMS)
+    assert len(char['inventory']) == 3
+    
+    result = inventory_system.sell_items(char, [('health_potion', 2), ('iron_sword', 1)], SHOP_ITEMS)
+    
+    assert result == {'items': 3, 'gold_received': 74}
+    assert char['inventory'] == []
+    assert char['gold'] == 74
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
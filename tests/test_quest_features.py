@@ -0,0 +1,394 @@
+"""
+Test Quest Features
+Tests quest indexes and per-character quest state
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import game_data
+import quest_handler
+import character_manager
+import inventory_system
+import quest_tracker
+from custom_exceptions import (
+    InvalidDataFormatError,
+    InsufficientLevelError,
+    QuestRequirementsNotMetError
+)
+
+# ============================================================================
+# AVAILABLE QUEST TESTS
+# ============================================================================
+
+def _new_character(level=1):
+    return {'level': level, 'experience': 0, 'gold': 0, 'max_health': 100,
+            'health': 100, 'strength': 10, 'magic': 5,
+            'active_quests': [], 'completed_quests': []}
+
+def _available_ids(character, quests):
+    return [quest['quest_id'] for quest in quest_handler.get_available_quests(character, quests)]
+
+def _brute_force_ids(character, quests):
+    return [quest_id for quest_id in quests
+            if quest_handler.can_accept_quest(character, quest_id, quests)]
+
+def test_available_quests_follow_accept_and_complete():
+    """Test that the frontier tracks accept, complete and abandon"""
+    quests = game_data.load_quests("data/quests.txt")
+    char = _new_character()
+    
+    assert _available_ids(char, quests) == _brute_force_ids(char, quests)
+    
+    quest_handler.accept_quest(char, 'first_steps', quests)
+    assert 'first_steps' not in _available_ids(char, quests)
+    
+    quest_handler.abandon_quest(char, 'first_steps')
+    assert 'first_steps' in _available_ids(char, quests)
+    
+    quest_handler.accept_quest(char, 'first_steps', quests)
+    quest_handler.complete_quest(char, 'first_steps', quests)
+    assert _available_ids(char, quests) == _brute_force_ids(char, quests)
+
+def test_available_quests_unlock_on_level_up():
+    """Test that level-locked quests appear once the level is reached"""
+    quests = game_data.load_quests("data/quests.txt")
+    char = _new_character()
+    char['completed_quests'] = ['first_steps']
+    
+    before = _available_ids(char, quests)
+    char['level'] = 10
+    after = _available_ids(char, quests)
+    
+    assert len(after) > len(before)
+    assert after == _brute_force_ids(char, quests)
+
+def test_available_quests_notice_external_changes():
+    """Test that editing the quest lists directly rebuilds the frontier"""
+    quests = game_data.load_quests("data/quests.txt")
+    char = _new_character(level=10)
+    
+    _available_ids(char, quests)
+    char['completed_quests'].append('first_steps')
+    
+    assert 'first_steps' not in _available_ids(char, quests)
+    assert _available_ids(char, quests) == _brute_force_ids(char, quests)
+
+def test_available_quests_notice_same_length_swap():
+    """Test that removing one quest and adding another rebuilds the frontier"""
+    quests = game_data.load_quests("data/quests.txt")
+    char = _new_character(level=10)
+    char['completed_quests'] = ['first_steps']
+    
+    _available_ids(char, quests)
+    char['completed_quests'].remove('first_steps')
+    char['completed_quests'].append('goblin_hunter')
+    
+    assert 'first_steps' in _available_ids(char, quests)
+    assert _available_ids(char, quests) == _brute_force_ids(char, quests)
+
+def test_character_frontiers_survive_many_players():
+    """Test that Character records keep their frontier however many are active"""
+    quests = game_data.load_quests("data/quests.txt")
+    characters = [character_manager.Character.from_dict(_new_character(level=10))
+                  for _ in range(quest_handler.MAX_CACHED_FRONTIERS + 36)]
+    
+    first = [quest_handler.get_quest_frontier(char, quests) for char in characters]
+    for _ in range(2):
+        again = [quest_handler.get_quest_frontier(char, quests) for char in characters]
+        assert all(new is old for new, old in zip(again, first))
+    
+    assert all(_available_ids(char, quests) == _brute_force_ids(char, quests)
+               for char in characters[:3])
+
+def test_dictionary_character_quest_lists_upgraded():
+    """Test that plain quest lists become QuestLists when changed"""
+    quests = game_data.load_quests("data/quests.txt")
+    char = {'level': 2, 'active_quests': [], 'completed_quests': ['first_steps']}
+    
+    quest_handler.accept_quest(char, 'goblin_hunter', quests)
+    
+    assert isinstance(char['active_quests'], character_manager.QuestList)
+    assert isinstance(char['completed_quests'], character_manager.QuestList)
+    assert quest_handler.is_quest_active(char, 'goblin_hunter')
+    assert quest_handler.is_quest_completed(char, 'first_steps')
+
+def test_quests_by_level_range():
+    """Test bisect-based level range queries"""
+    quests = game_data.load_quests("data/quests.txt")
+    
+    result = quest_handler.get_quests_by_level(quests, 2, 3)
+    expected = [quest for quest in quests.values() if 2 <= quest['required_level'] <= 3]
+    
+    assert sorted(q['quest_id'] for q in result) == sorted(q['quest_id'] for q in expected)
+    assert [q['required_level'] for q in result] == sorted(q['required_level'] for q in result)
+    assert quest_handler.get_quests_by_level(quests, 11, 20) == []
+
+# ============================================================================
+# PREREQUISITE GRAPH TESTS
+# ============================================================================
+
+def test_prerequisite_chain_and_unlocks():
+    """Test chain and unlock queries on the quest graph"""
+    quests = game_data.load_quests("data/quests.txt")
+    
+    chain = quest_handler.get_quest_prerequisite_chain('dragon_slayer', quests)
+    unlocked = quest_handler.get_quests_unlocked_by('first_steps', quests)
+    
+    assert chain[0] == 'first_steps' and chain[-1] == 'dragon_slayer'
+    assert 'dragon_slayer' in unlocked and 'first_steps' not in unlocked
+    graph = game_data.get_quest_index(quests).graph
+    assert all(graph.position[a] < graph.position[b] for a, b in zip(chain, chain[1:]))
+
+def test_prerequisite_cycle_reported():
+    """Test that a prerequisite cycle is rejected with the full cycle"""
+    quests = {
+        'start': {'quest_id': 'start', 'prerequisite': 'NONE'},
+        'a': {'quest_id': 'a', 'prerequisite': 'c'},
+        'b': {'quest_id': 'b', 'prerequisite': 'a'},
+        'c': {'quest_id': 'c', 'prerequisite': 'b'}
+    }
+    
+    with pytest.raises(InvalidDataFormatError) as error:
+        quest_handler.validate_quest_prerequisites(quests)
+    
+    assert "a -> c -> b -> a" in str(error.value)
+
+def test_or_prerequisite_is_not_a_cycle():
+    """Test that an OR alternative through a dependent quest isn't a cycle"""
+    quests = {
+        'x': {'quest_id': 'x', 'prerequisite': 'a|b'},
+        'a': {'quest_id': 'a', 'prerequisite': 'x'},
+        'b': {'quest_id': 'b', 'prerequisite': 'NONE'}
+    }
+    
+    assert quest_handler.validate_quest_prerequisites(quests) == True
+    assert quest_handler.get_quest_prerequisite_chain('x', quests) == ['b', 'x']
+    assert quest_handler.get_quest_prerequisite_chain('a', quests) == ['b', 'x', 'a']
+    assert quest_handler.get_quests_unlocked_by('b', quests) == ['x', 'a']
+
+def test_and_prerequisites_still_form_cycles():
+    """Test that a cycle through every alternative is still rejected"""
+    quests = {
+        'x': {'quest_id': 'x', 'prerequisite': 'a|b'},
+        'a': {'quest_id': 'a', 'prerequisite': 'x'},
+        'b': {'quest_id': 'b', 'prerequisite': 'start, a'},
+        'start': {'quest_id': 'start', 'prerequisite': 'NONE'}
+    }
+    
+    with pytest.raises(InvalidDataFormatError) as error:
+        quest_handler.validate_quest_prerequisites(quests)
+    
+    assert "x -> a -> x" in str(error.value)
+
+# ============================================================================
+# REQUIREMENT EXPRESSION TESTS
+# ============================================================================
+
+def test_parse_quest_requirement_fields():
+    """Test parsing AND/OR prerequisites and item/gold requirements"""
+    quest = game_data.parse_quest_block([
+        "QUEST_ID: vault", "TITLE: Vault", "DESCRIPTION: Open the vault",
+        "REWARD_XP: 10", "REWARD_GOLD: 10", "REQUIRED_LEVEL: 2",
+        "PREREQUISITE: first_steps, goblin_hunter|orc_menace",
+        "REQUIRED_ITEM: iron_sword", "REQUIRED_GOLD: 50"
+    ])
+    
+    assert game_data.validate_quest_data(quest) == True
+    assert game_data.parse_prerequisite_expression(quest['prerequisite']) == (
+        ('first_steps',), ('goblin_hunter', 'orc_menace')
+    )
+    assert (quest['required_item'], quest['required_gold']) == ('iron_sword', 50)
+    
+    with pytest.raises(InvalidDataFormatError):
+        game_data.parse_prerequisite_expression("first_steps, |orc_menace")
+
+def test_compound_requirements_checked_on_accept():
+    """Test that accept_quest applies every compiled requirement"""
+    quests = {
+        'a': {'quest_id': 'a', 'required_level': 1, 'prerequisite': 'NONE'},
+        'b': {'quest_id': 'b', 'required_level': 1, 'prerequisite': 'NONE'},
+        'c': {'quest_id': 'c', 'required_level': 1, 'prerequisite': 'NONE'},
+        'vault': {'quest_id': 'vault', 'required_level': 2, 'prerequisite': 'a, b|c',
+                  'required_item': 'key', 'required_gold': 50}
+    }
+    char = {'level': 1, 'gold': 0, 'inventory': [], 'active_quests': [], 'completed_quests': ['a']}
+    
+    with pytest.raises(InsufficientLevelError):
+        quest_handler.accept_quest(char, 'vault', quests)
+    char['level'] = 2
+    with pytest.raises(QuestRequirementsNotMetError):
+        quest_handler.accept_quest(char, 'vault', quests)
+    char['completed_quests'].append('c')
+    char['inventory'].append('key')
+    assert 'vault' not in _available_ids(char, quests)
+    
+    char['gold'] = 50
+    assert 'vault' in _available_ids(char, quests)
+    assert quest_handler.can_accept_quest(char, 'vault', quests)
+    assert quest_handler.accept_quest(char, 'vault', quests)
+
+# ============================================================================
+# QUEST STATISTICS TESTS
+# ============================================================================
+
+def test_running_quest_totals_follow_completions():
+    """Test that complete_quest keeps the reward totals up to date"""
+    quests = game_data.load_quests("data/quests.txt")
+    char = character_manager.create_character("StatsTest", "Warrior")
+    
+    quest_handler.accept_quest(char, 'first_steps', quests)
+    quest_handler.complete_quest(char, 'first_steps', quests)
+    
+    first = quests['first_steps']
+    assert quest_handler.get_total_quest_rewards_earned(char, quests) == {
+        'total_xp': first['reward_xp'], 'total_gold': first['reward_gold']
+    }
+
+def test_quest_totals_saved_and_reconciled(tmp_path):
+    """Test that totals persist and are corrected against the save on load"""
+    quests = game_data.load_quests("data/quests.txt")
+    char = character_manager.create_character("ReconcileTest", "Mage")
+    quest_handler.accept_quest(char, 'first_steps', quests)
+    quest_handler.complete_quest(char, 'first_steps', quests)
+    character_manager.save_character(char, str(tmp_path))
+    
+    loaded = character_manager.load_character("ReconcileTest", str(tmp_path))
+    assert loaded['quest_xp_earned'] == char['quest_xp_earned']
+    assert quest_handler.reconcile_quest_stats(loaded, quests) == False
+    
+    loaded['completed_quests'].append('goblin_hunter')
+    assert quest_handler.reconcile_quest_stats(loaded, quests) == True
+    assert loaded['quest_gold_earned'] == (quests['first_steps']['reward_gold']
+                                           + quests['goblin_hunter']['reward_gold'])
+
+# ============================================================================
+# QUEST OBJECTIVE TESTS
+# ============================================================================
+
+def test_kill_objective_gates_completion():
+    """Test that a kill objective must be met before completing"""
+    quests = game_data.load_quests("data/quests.txt")
+    char = character_manager.create_character("ObjectiveTest", "Warrior")
+    char['level'] = 2
+    char['completed_quests'].append('first_steps')
+    quest_handler.accept_quest(char, 'goblin_hunter', quests)
+    
+    quest_tracker.record_event(char, 'kill', 'goblin')
+    quest_tracker.record_event(char, 'kill', 'orc')
+    with pytest.raises(QuestRequirementsNotMetError):
+        quest_handler.complete_quest(char, 'goblin_hunter', quests)
+    assert quest_tracker.describe_progress(char, 'goblin_hunter', quests) == ["Defeat goblin: 1/3"]
+    
+    quest_tracker.record_event(char, 'kill', 'Goblin', 5)
+    quest_handler.complete_quest(char, 'goblin_hunter', quests)
+    assert 'goblin_hunter' not in char['quest_progress']
+
+def test_shop_and_level_events_reach_objectives():
+    """Test that purchases and level-ups publish to listening objectives"""
+    quests = {
+        'gear_up': {'quest_id': 'gear_up', 'required_level': 1, 'prerequisite': 'NONE',
+                    'objective': 'buy:weapon|armor:1, level:3'}
+    }
+    char = character_manager.create_character("EventTest", "Mage")
+    quest_handler.accept_quest(char, 'gear_up', quests)
+    tracker = quest_tracker.get_tracker(char, quests)
+    
+    assert set(tracker.listeners) == {('buy', 'weapon'), ('buy', 'armor'), ('level', None)}
+    
+    inventory_system.purchase_item(char, 'health_potion', {'type': 'consumable', 'cost': 10})
+    inventory_system.purchase_item(char, 'iron_sword', {'type': 'weapon', 'cost': 10})
+    character_manager.gain_experience(char, 300)
+    
+    assert char['quest_progress']['gear_up'] == [1, 3]
+    assert quest_tracker.objectives_complete(char, 'gear_up', quests)
+
+def test_progress_kept_when_many_characters_track_quests():
+    """Test that events still count after many other characters' trackers were built"""
+    import copy
+    
+    quests = game_data.load_quests("data/quests.txt")
+    hero = character_manager.create_character("BusyHero", "Warrior")
+    plain = _new_character()
+    for char in (hero, plain):
+        char['level'] = 2
+        char['completed_quests'].append('first_steps')
+        quest_handler.accept_quest(char, 'goblin_hunter', quests)
+    
+    for number in range(quest_tracker.MAX_CACHED_TRACKERS + 1):
+        other = _new_character(level=2)
+        other['completed_quests'].append('first_steps')
+        quest_handler.accept_quest(other, 'goblin_hunter', quests)
+    clone = copy.deepcopy(hero)
+    
+    for char in (hero, plain, clone):
+        quest_tracker.record_event(char, 'kill', 'goblin', 3)
+        assert char['quest_progress'] == {'goblin_hunter': [3]}
+        assert quest_handler.complete_quest(char, 'goblin_hunter', quests)
+
+def test_evicted_tracker_rebuilt_for_its_own_catalog():
+    """Test that an evicted tracker is rebuilt against the character's catalog, not the last one used"""
+    import content_generator
+    
+    quests = game_data.load_quests("data/quests.txt")
+    other_quests = {quest['quest_id']: quest for quest in content_generator.generate_quests(10)}
+    char = _new_character(level=2)
+    char['completed_quests'].append('first_steps')
+    quest_handler.accept_quest(char, 'goblin_hunter', quests)
+    
+    for number in range(quest_tracker.MAX_CACHED_TRACKERS + 1):
+        quest_tracker.get_tracker(_new_character(), other_quests)
+    quest_tracker.record_event(char, 'kill', 'goblin', 2)
+    
+    assert char['quest_progress'] == {'goblin_hunter': [2]}
+
+def test_quest_caches_safe_across_threads():
+    """Test that sessions on worker threads can fill and evict the shared caches at once"""
+    import concurrent.futures
+    
+    quests = game_data.load_quests("data/quests.txt")
+    
+    def play(_):
+        characters = []
+        for _ in range(3000):
+            char = _new_character(level=2)
+            char['completed_quests'].append('first_steps')
+            characters.append(char)
+            quest_handler.get_quest_frontier(char, quests)
+            quest_tracker.get_tracker(char, quests)
+        quest_handler.accept_quest(char, 'goblin_hunter', quests)
+        quest_tracker.record_event(char, 'kill', 'goblin')
+        return char['quest_progress']
+    
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with concurrent.futures.ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(play, range(8)))
+    finally:
+        sys.setswitchinterval(interval)
+    
+    assert results == [{'goblin_hunter': [1]}] * 8
+
+def test_objective_progress_saved(tmp_path):
+    """Test that objective progress survives save and load"""
+    quests = game_data.load_quests("data/quests.txt")
+    char = character_manager.create_character("ProgressSaveTest", "Rogue")
+    char['level'] = 3
+    char['completed_quests'].extend(['first_steps', 'goblin_hunter'])
+    quest_handler.accept_quest(char, 'orc_menace', quests)
+    quest_tracker.record_event(char, 'kill', 'orc', 2)
+    character_manager.save_character(char, str(tmp_path))
+    
+    loaded = character_manager.load_character("ProgressSaveTest", str(tmp_path))
+    quest_tracker.get_tracker(loaded, quests)
+    quest_tracker.record_event(loaded, 'kill', 'orc')
+    
+    assert loaded['quest_progress'] == {'orc_menace': [3]}
+    assert quest_tracker.objectives_complete(loaded, 'orc_menace', quests)
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
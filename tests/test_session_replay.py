@@ -0,0 +1,113 @@
+"""
+Test Session Replay
+Tests input-log recording and deterministic replay
+"""
+
+import pytest
+import sys
+import os
+import json
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import game_data
+import game_session
+import session_replay
+
+ROGUE_SCRIPT = ["new Replayer Rogue", "explore"] + ["ability"] * 6 + ["stats", "quit"]
+
+@pytest.fixture
+def catalogs():
+    """Default quest and item catalogs"""
+    return game_data.load_quests(), game_data.load_items()
+
+def record_script(catalogs, tmp_path, seed, commands=ROGUE_SCRIPT):
+    """Record a commands-mode log with main.run_script"""
+    import main
+    
+    log_path = tmp_path / "session.log"
+    session_replay.choose_seed(seed)
+    writer = session_replay.InputLogWriter(str(log_path), seed, session_replay.COMMANDS_MODE, False)
+    main.run_script(commands, *catalogs, save_directory=str(tmp_path / "saves"),
+                    autosave=False, recorder=writer)
+    return log_path
+
+# ============================================================================
+# RECORDING TESTS
+# ============================================================================
+
+def test_log_records_seed_and_steps(catalogs, tmp_path):
+    """Test the log header, one step per command and the end record"""
+    log = session_replay.read_input_log(str(record_script(catalogs, tmp_path, 42)))
+    
+    assert log['seed'] == 42
+    assert log['mode'] == session_replay.COMMANDS_MODE
+    assert [line for line, _ in log['steps']] == ROGUE_SCRIPT
+    assert log['end'] is not None
+
+def test_state_digest_tracks_changes(catalogs, tmp_path):
+    """Test that the digest changes with the character"""
+    session = game_session.GameSession(*catalogs, save_directory=str(tmp_path), autosave=False)
+    empty = session_replay.state_digest(session)
+    session.execute("new Digest Mage")
+    created = session_replay.state_digest(session)
+    session.character['gold'] += 1
+    
+    assert len({empty, created, session_replay.state_digest(session)}) == 3
+
+# ============================================================================
+# REPLAY TESTS
+# ============================================================================
+
+def test_replay_matches_recording(catalogs, tmp_path):
+    """Test that replaying with the recorded seed reproduces every step"""
+    log_path = record_script(catalogs, tmp_path, 1234)
+    report = session_replay.replay_input_log(str(log_path), *catalogs, str(tmp_path / "saves"))
+    
+    assert report['replayed'] == report['steps'] == len(ROGUE_SCRIPT)
+    assert report['divergences'] == []
+    assert report['final_matches'] is True
+    assert report['error'] is None
+    assert len(report['timings']) == len(ROGUE_SCRIPT)
+
+def test_replay_reports_divergence(catalogs, tmp_path):
+    """Test that a changed log is reported at the first step that differs"""
+    log_path = record_script(catalogs, tmp_path, 1234)
+    records = log_path.read_text().splitlines()
+    step = json.loads(records[3])
+    step[1] = "0" * session_replay.DIGEST_LENGTH
+    records[3] = json.dumps(step)
+    log_path.write_text("\n".join(records) + "\n")
+    
+    report = session_replay.replay_input_log(str(log_path), *catalogs, str(tmp_path / "saves"))
+    
+    assert report['divergences'][0][0] == 2
+    assert "DIVERGED at step 3" in session_replay.format_replay_report(report)
+
+def test_replay_menu_session(catalogs, tmp_path):
+    """Test recording the interactive menus through session.input_func"""
+    import main
+    
+    # New warrior, explore and attack, look at stats, then save and exit
+    answers = iter(["1", "MenuReplay", "1", "4"] + ["1"] * 20 + ["6", "3"])
+    
+    def answer(prompt=""):
+        for line in answers:
+            return line
+        raise EOFError("Ran out of answers")
+    
+    session = game_session.GameSession(*catalogs, save_directory=str(tmp_path))
+    writer = session_replay.InputLogWriter(str(tmp_path / "menu.log"), session_replay.choose_seed(5))
+    session.input_func = session_replay.recording_input(session, writer, answer)
+    main.play(session)
+    writer.close(session_replay.state_digest(session))
+    os.remove(tmp_path / "MenuReplay_save.txt")
+    
+    report = session_replay.replay_input_log(str(tmp_path / "menu.log"), *catalogs, str(tmp_path))
+    
+    assert report['steps'] == writer.steps
+    assert report['divergences'] == []
+    assert report['final_matches'] is True
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])